@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+import re
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 from .cache import ParseCache
@@ -6,10 +8,18 @@ from .scanner import Scanner
 from .parser.gdscript import GDScriptParser
 from .parser.tscn import TscnParser
 from .parser.tres import TresParser
-from .parser.project_godot import parse_autoloads
+from .parser.project_godot import parse_autoloads, parse_main_scene
 from .graph.dependency import DependencyGraph
-from .graph.cycles import CycleDetector
-from .graph.node import Module
+from .graph.dominators import DominatorTree
+from .graph.hierarchy import InheritanceForest
+from .graph.metrics import GraphMetrics
+from .graph.packages import PackageGraph
+from .graph.reachability import ReachabilityIndex
+from .graph.condensation import Condensation
+from .graph.csr import CSRGraph
+from .graph.feedback import CycleBreak, feedback_arc_set
+from .graph.cycles import CycleDetector, ElementaryCycle
+from .graph.node import DependencyType, Module
 from .symbols.table import SymbolTable
 
 
@@ -19,14 +29,191 @@ class AnalysisResult:
 
     graph: DependencyGraph
     cycles: list[list[str]] = field(default_factory=list)
+    # Cycles that only exist through edges outside the `cycle_types` the
+    # hard `cycles` were restricted to, and share no module with a hard
+    # cycle (empty when no restriction applies).
+    soft_cycles: list[list[str]] = field(default_factory=list)
+    cycle_types: list[DependencyType] | None = None
+    elementary_cycles: list[ElementaryCycle] = field(default_factory=list)
     symbol_table: SymbolTable = field(default_factory=SymbolTable)
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Autoload singleton identifier -> res:// path, from project.godot.
+    autoloads: dict[str, str] = field(default_factory=dict)
+    # res:// path of project.godot's run/main_scene, if set.
+    main_scene: str | None = None
+    # Package-level graph, when a package key was requested.
+    packages: PackageGraph | None = None
+    _condensation: Condensation | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _reachability: ReachabilityIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _metrics: GraphMetrics | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dominators: DominatorTree | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cycle_breaks: list[list[CycleBreak]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hierarchy: InheritanceForest | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def condensation(self) -> Condensation:
+        """Return the condensation DAG of the graph (built once, on demand)."""
+        if self._condensation is None:
+            self._condensation = Condensation.from_graph(self.graph)
+        return self._condensation
+
+    def reachability(self) -> ReachabilityIndex:
+        """Return the transitive reachability index (built once, on demand)."""
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.condensation())
+        return self._reachability
+
+    def metrics(self) -> GraphMetrics:
+        """Return coupling metrics and PageRank (computed once, on demand)."""
+        if self._metrics is None:
+            self._metrics = GraphMetrics(
+                self.condensation().csr, autoloads=self.autoloads.values()
+            )
+        return self._metrics
+
+    def entry_points(self) -> list[str]:
+        """Return the main scene followed by every autoload script."""
+        entries = [self.main_scene] if self.main_scene else []
+        entries.extend(self.autoloads.values())
+        return entries
+
+    def cycle_breaks(self) -> list[list[CycleBreak]]:
+        """Return suggested edges to cut for each entry of ``cycles``.
+
+        Breaks are computed per listed cycle, so they stay aligned with
+        ``cycles`` after a baseline narrowed it. :meth:`subgraph` carries the
+        breaks of the full graph over, since a view may hold only part of a
+        cycle.
+        """
+        if self._cycle_breaks is None:
+            csr = self.condensation().csr
+            keep = (
+                csr.edge_filter(self.cycle_types)
+                if self.cycle_types is not None and self.cycles
+                else None
+            )
+            self._cycle_breaks = [
+                feedback_arc_set(csr, [csr.index[p] for p in cycle], keep)
+                for cycle in self.cycles
+            ]
+        return self._cycle_breaks
+
+    def subgraph(
+        self,
+        focus: str | None = None,
+        depth: int | None = None,
+        only_cycles: bool = False,
+    ) -> "AnalysisResult":
+        """Return a copy restricted to part of the graph.
+
+        The selection starts from the modules matching the ``focus`` regex
+        and, with ``only_cycles``, sitting on a cycle; it then grows by
+        ``depth`` hops in both directions (default: 1 with ``focus``, 0
+        otherwise). Cycle lists are narrowed to cycles touching the
+        selection, each kept whole along with its :meth:`cycle_breaks`.
+        """
+        if focus is None and not only_cycles:
+            return self
+        if only_cycles:
+            seeds = {path for cycle in self.cycles for path in cycle}
+        else:
+            seeds = {m.path for m in self.graph.all_modules()}
+        if focus is not None:
+            pattern = re.compile(focus)
+            seeds = {path for path in seeds if pattern.search(path)}
+        if depth is None:
+            depth = 1 if focus is not None else 0
+        selected = self.graph.neighborhood(seeds, depth)
+
+        def touching(cycles: list[list[str]]) -> list[list[str]]:
+            return [c for c in cycles if not selected.isdisjoint(c)]
+
+        kept = [i for i, c in enumerate(self.cycles) if not selected.isdisjoint(c)]
+        breaks = self.cycle_breaks()
+        view = replace(
+            self,
+            graph=self.graph.subgraph(selected),
+            cycles=[self.cycles[i] for i in kept],
+            soft_cycles=touching(self.soft_cycles),
+            elementary_cycles=[
+                c for c in self.elementary_cycles if not selected.isdisjoint(c.modules)
+            ],
+        )
+        view._cycle_breaks = [breaks[i] for i in kept]
+        return view
+
+    def hierarchy(self) -> InheritanceForest:
+        """Return the inheritance forest of the project (built once, on demand)."""
+        if self._hierarchy is None:
+            self._hierarchy = InheritanceForest(self.graph)
+        return self._hierarchy
+
+    def reduced(self) -> "AnalysisResult":
+        """Return a copy whose graph is transitively reduced.
+
+        Dependencies implied by a longer path are dropped; dependencies
+        inside a cycle, and those pointing outside the graph, are kept.
+        Cycle results are carried over unchanged.
+        """
+        condensation = self.condensation()
+        keep = condensation.reduction_filter()
+        dropped = {
+            id(dep)
+            for dep, kept in zip(condensation.csr.edge_deps, keep, strict=True)
+            if not kept
+        }
+        graph = DependencyGraph()
+        for module in self.graph.all_modules():
+            graph.add_module(
+                replace(
+                    module,
+                    dependencies=[
+                        d for d in module.dependencies if id(d) not in dropped
+                    ],
+                )
+            )
+        return replace(self, graph=graph)
+
+    def dominators(self) -> DominatorTree:
+        """Return the dominator tree rooted at the entry points (built once)."""
+        if self._dominators is None:
+            self._dominators = DominatorTree(
+                self.condensation().csr, self.entry_points()
+            )
+        return self._dominators
 
     def to_dict(self) -> dict:
         return {
             "graph": self.graph.to_dict(),
             "cycles": self.cycles,
+            "soft_cycles": self.soft_cycles,
+            "cycle_types": (
+                [t.value for t in self.cycle_types]
+                if self.cycle_types is not None
+                else None
+            ),
+            "elementary_cycles": [c.to_dict() for c in self.elementary_cycles],
+            "cycle_breaks": [
+                [b.to_dict() for b in breaks] for breaks in self.cycle_breaks()
+            ],
+            "topology": self.condensation().to_dict(),
+            "impact": self.reachability().impact(),
+            "metrics": self.metrics().to_dict(),
+            "dominators": self.dominators().to_dict(),
+            "hierarchy": self.hierarchy().to_dict(),
+            "packages": self.packages.to_dict() if self.packages else None,
             "symbols": self.symbol_table.all_classes(),
             "errors": self.errors,
             "warnings": self.warnings,
@@ -54,8 +241,30 @@ class Analyzer:
         self._errors: list[str] = []
         self._warnings: list[str] = []
 
-    def analyze(self, detect_cycles: bool = True) -> AnalysisResult:
-        """Analyze the project and return results."""
+    def analyze(
+        self,
+        detect_cycles: bool = True,
+        elementary_cycles: bool = False,
+        max_cycle_length: int | None = None,
+        max_cycles: int | None = None,
+        cycle_types: Collection[DependencyType] | None = None,
+        package_key: Callable[[str], str] | None = None,
+    ) -> AnalysisResult:
+        """Analyze the project and return results.
+
+        With ``elementary_cycles``, the individual cycles inside each cyclic
+        component are also enumerated, bounded by ``max_cycle_length``
+        modules per cycle and ``max_cycles`` cycles in total.
+
+        ``cycle_types`` restricts cycle detection to edges of those types
+        (e.g. the load-time ``preload``/``extends`` edges). Cycles that only
+        close through other edges are then reported as ``soft_cycles``.
+
+        ``package_key`` maps each module path to a package (see
+        :func:`~gdcruiser.graph.packages.depth_key`); the package graph is
+        then built and stored in ``packages``; its cycles follow
+        ``cycle_types`` too.
+        """
         gd_files, tscn_files, tres_files = self._scanner.find_all_files()
         root = self._scanner.root
 
@@ -70,6 +279,13 @@ class Analyzer:
             self._errors.append(f"Error parsing project.godot: {e}")
         for identifier, path in autoloads.items():
             self._symbol_table.register(identifier, path)
+        # Only unreadable or undecodable files are expected here; anything
+        # else is a bug and should surface.
+        try:
+            main_scene = parse_main_scene(root, tscn_files)
+        except (OSError, ValueError, KeyError) as e:
+            main_scene = None
+            self._errors.append(f"Error reading main scene from project.godot: {e}")
 
         if self._verbose:
             print(f"Found {len(gd_files)} GDScript files")
@@ -111,11 +327,38 @@ class Analyzer:
 
         # Detect cycles
         cycles: list[list[str]] = []
+        soft_cycles: list[list[str]] = []
+        elementary: list[ElementaryCycle] = []
+        condensation: Condensation | None = None
         if detect_cycles:
-            detector = CycleDetector(self._graph)
-            cycles = detector.find_cycles()
+            # The untyped cycles are the multi-module components of the
+            # condensation, so both come out of a single Tarjan pass.
+            csr = CSRGraph.from_graph(self._graph)
+            condensation = Condensation(csr)
+            detector = CycleDetector(self._graph, dep_types=cycle_types, csr=csr)
+            if cycle_types is None:
+                cycles = condensation.cycles()
+            else:
+                cycles = detector.find_cycles()
+                # Every hard cycle lies inside an untyped one; a component
+                # holding a hard cycle is only reported as hard, so no module
+                # is listed (or counted) twice.
+                hard = {path for cycle in cycles for path in cycle}
+                soft_cycles = [
+                    cycle for cycle in condensation.cycles() if hard.isdisjoint(cycle)
+                ]
             if self._verbose:
                 print(f"Found {len(cycles)} cycles")
+                if cycle_types is not None:
+                    print(f"Found {len(soft_cycles)} soft cycles")
+            if elementary_cycles and cycles:
+                elementary = list(
+                    detector.elementary_cycles(
+                        max_length=max_cycle_length, max_cycles=max_cycles
+                    )
+                )
+                if self._verbose:
+                    print(f"Enumerated {len(elementary)} elementary cycles")
 
         # Surface duplicate class_name / autoload registrations as warnings.
         for name, existing, new in self._symbol_table.collisions():
@@ -124,13 +367,29 @@ class Analyzer:
                 f"{existing} and {new} (using {new})"
             )
 
-        return AnalysisResult(
+        result = AnalysisResult(
             graph=self._graph,
             cycles=cycles,
+            soft_cycles=soft_cycles,
+            cycle_types=list(cycle_types) if cycle_types is not None else None,
+            elementary_cycles=elementary,
             symbol_table=self._symbol_table,
             errors=self._errors,
             warnings=self._warnings,
+            autoloads=autoloads,
+            main_scene=main_scene,
         )
+        result._condensation = condensation
+        if package_key is not None:
+            result.packages = PackageGraph(
+                result.condensation().csr, package_key, cycle_types
+            )
+            if self._verbose:
+                print(
+                    f"Found {result.packages.package_count()} packages, "
+                    f"{len(result.packages.cycles())} package cycles"
+                )
+        return result
 
     def _parse_file(self, file_path: Path, parser, root: Path) -> Module | None:
         """Parse a file, restoring it from the cache when unchanged.
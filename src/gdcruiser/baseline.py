@@ -0,0 +1,122 @@
+"""Baseline of known rule violations and cycles.
+
+A baseline records the violations and cycles of a project at one point in
+time so that only new ones are reported or fail the run. Entries are stored
+as short hashes of stable keys: a violation is identified by its rule and
+the modules involved, and a module or package cycle by its sorted members.
+Nothing depends on line numbers or on the order in which a cycle was
+traversed, so editing a file does not invalidate its baselined entries.
+Loaded hashes live in sets, so checking an entry costs one hash and one set
+lookup.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from .rules.models import RuleCheckResult, Violation
+
+BASELINE_VERSION = 1
+
+
+def _digest(*parts: str) -> str:
+    key = "\0".join(parts).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def violation_key(violation: Violation) -> str:
+    """Return the stable hash identifying ``violation``."""
+    source = violation.from_module
+    if violation.rule.circular:
+        # The cycle's rotation depends on where traversal entered it.
+        source = " -> ".join(sorted(source.split(" -> ")))
+    return _digest(
+        violation.rule_type,
+        violation.rule.name,
+        source,
+        violation.to_module or "",
+    )
+
+
+def cycle_key(cycle: list[str]) -> str:
+    """Return the stable hash identifying a cycle by its members."""
+    return _digest("cycle", *sorted(cycle))
+
+
+def package_cycle_key(cycle: list[str]) -> str:
+    """Return the stable hash identifying a package cycle by its packages."""
+    return _digest("package-cycle", *sorted(cycle))
+
+
+@dataclass
+class Baseline:
+    """Hashes of the known violations, module cycles and package cycles."""
+
+    violations: set[str] = field(default_factory=set)
+    cycles: set[str] = field(default_factory=set)
+    package_cycles: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_results(
+        cls,
+        cycles: list[list[str]],
+        rule_result: RuleCheckResult | None = None,
+        package_cycles: list[list[str]] | None = None,
+    ) -> "Baseline":
+        """Record the given cycles and violations as known."""
+        return cls(
+            violations={
+                violation_key(v)
+                for v in (rule_result.violations if rule_result else [])
+            },
+            cycles={cycle_key(c) for c in cycles},
+            package_cycles={package_cycle_key(c) for c in package_cycles or []},
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "Baseline":
+        """Load a baseline written by :meth:`save`.
+
+        Raises ``ValueError`` when the file is not such a baseline.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read baseline {path}: {e}") from e
+        if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+            raise ValueError(f"{path} is not a gdcruiser baseline")
+        return cls(
+            violations=set(data.get("violations", [])),
+            cycles=set(data.get("cycles", [])),
+            package_cycles=set(data.get("package_cycles", [])),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the baseline as JSON, entries sorted for stable diffs."""
+        data = {
+            "version": BASELINE_VERSION,
+            "violations": sorted(self.violations),
+            "cycles": sorted(self.cycles),
+            "package_cycles": sorted(self.package_cycles),
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    def new_cycles(self, cycles: list[list[str]]) -> list[list[str]]:
+        """Return the cycles not in the baseline."""
+        return [c for c in cycles if cycle_key(c) not in self.cycles]
+
+    def new_package_cycles(self, cycles: list[list[str]]) -> list[list[str]]:
+        """Return the package cycles not in the baseline."""
+        return [c for c in cycles if package_cycle_key(c) not in self.package_cycles]
+
+    def new_violations(self, rule_result: RuleCheckResult) -> RuleCheckResult:
+        """Return a copy of ``rule_result`` without the known violations."""
+        return replace(
+            rule_result,
+            violations=[
+                v
+                for v in rule_result.violations
+                if violation_key(v) not in self.violations
+            ],
+        )
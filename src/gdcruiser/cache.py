@@ -16,7 +16,7 @@ from .graph.node import Module
 
 # Bump when the cached representation or parsing semantics change, so stale
 # caches from older versions are transparently ignored.
-CACHE_VERSION = 1
+CACHE_VERSION = 2
 
 
 class ParseCache:
@@ -1,14 +1,73 @@
 import argparse
+import json
+import re
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 from .analyzer import Analyzer
+from .baseline import Baseline
 from .cache import ParseCache
 from .config import ConfigError, ConfigLoader, ConfigValidator
-from .output import FORMATTERS
+from .config.validator import NESTED_QUANTIFIERS, has_nested_quantifiers
+from .diff import diff_snapshots, format_text, load_snapshot
+from .graph.node import DependencyType
+from .graph.packages import depth_key, pattern_key
+from .output import FORMATTERS, TextFormatter
+from .output.dsm import DENSE_LIMIT, LAYOUTS
 from .rules import RuleEngine
 
 
+def _dependency_types(value: str) -> list[DependencyType]:
+    """Parse a comma-separated list of dependency type names."""
+    types: list[DependencyType] = []
+    for name in value.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            types.append(DependencyType(name))
+        except ValueError:
+            valid = ", ".join(t.value for t in DependencyType)
+            raise argparse.ArgumentTypeError(
+                f"unknown dependency type '{name}' (valid: {valid})"
+            )
+    if not types:
+        raise argparse.ArgumentTypeError("expected at least one dependency type")
+    return types
+
+
+def _regex(value: str) -> str:
+    """Check that ``value`` compiles as a regular expression."""
+    try:
+        re.compile(value)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(f"invalid regex '{value}': {e}")
+    return value
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse an integer of at least 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """Parse an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="gdcruiser",
@@ -21,10 +80,34 @@ Examples:
   gdcruiser . -f json            Output as JSON
   gdcruiser . -f dot -o deps.dot Output DOT file for GraphViz
   gdcruiser . --no-cycles        Skip cycle detection
+  gdcruiser . --cycle-types preload,extends_path,extends_class
+                                 Only fail on load-time cycles
+  gdcruiser . --elementary-cycles --max-cycle-length 6
+                                 List the individual cycles in each cycle
   gdcruiser . --config rules.json Use custom config file
   gdcruiser . --validate-config  Validate config without analyzing
+  gdcruiser . --baseline known.json --write-baseline
+                                 Record today's violations and cycles
+  gdcruiser . --baseline known.json
+                                 Only report violations and cycles added since
   gdcruiser . -f mermaid         Output Mermaid diagram
+  gdcruiser . -f dot --reduce    Output DOT without transitively implied edges
+  gdcruiser . -f dot --focus "^res://ui/" --depth 2
+                                 Output only ui/ and modules 2 hops around it
+  gdcruiser . -f mermaid --only-cycles
+                                 Output only the modules on cycles
   gdcruiser . --exclude addons   Exclude paths matching "addons"
+  gdcruiser . --top-impact 20    List the 20 modules with most dependents
+  gdcruiser . --suggest-breaks   Suggest which dependencies break each cycle
+  gdcruiser . --package-depth 1  Check cycles between top-level directories
+  gdcruiser . --chokepoints 10   List the 10 modules dominating most loads
+  gdcruiser . --hierarchy        Show the class inheritance tree
+  gdcruiser . --rule-stats       Show what each rule cost to evaluate
+  gdcruiser . --fail-fast        Stop at the first rule error (pre-commit)
+  gdcruiser . --max-violations-per-rule 20
+                                 List at most 20 violations of each rule
+  gdcruiser diff old.json new.json
+                                 Compare two JSON snapshots (see diff -h)
 """,
     )
 
@@ -56,6 +139,119 @@ Examples:
         help="Skip cycle detection",
     )
 
+    parser.add_argument(
+        "--cycle-types",
+        type=_dependency_types,
+        metavar="TYPES",
+        help=(
+            "Comma-separated dependency types that form hard cycles, e.g. "
+            "preload,extends_path,extends_class (other cycles are reported "
+            "as soft)"
+        ),
+    )
+
+    parser.add_argument(
+        "--focus",
+        type=_regex,
+        metavar="REGEX",
+        help="Only output modules matching REGEX and their neighbors (see --depth)",
+    )
+
+    parser.add_argument(
+        "--depth",
+        type=_non_negative_int,
+        metavar="N",
+        help="With --focus or --only-cycles, include modules up to N dependency "
+        "hops away in either direction (default: 1 with --focus, else 0)",
+    )
+
+    parser.add_argument(
+        "--only-cycles",
+        action="store_true",
+        help="Only output modules that are part of a cycle",
+    )
+
+    parser.add_argument(
+        "--reduce",
+        action="store_true",
+        help="Drop dependencies implied by longer paths (transitive reduction; "
+        "dot and mermaid output)",
+    )
+
+    parser.add_argument(
+        "--dsm-layout",
+        choices=LAYOUTS,
+        default="auto",
+        help="dsm output: the square matrix (dense), one row,col line per "
+        f"dependency (sparse), or dense up to {DENSE_LIMIT} modules (auto, "
+        "the default)",
+    )
+
+    parser.add_argument(
+        "--elementary-cycles",
+        action="store_true",
+        help="Enumerate the individual elementary cycles inside each cycle",
+    )
+
+    parser.add_argument(
+        "--max-cycle-length",
+        type=_positive_int,
+        metavar="N",
+        help="Only enumerate elementary cycles of at most N modules",
+    )
+
+    parser.add_argument(
+        "--max-cycles",
+        type=_positive_int,
+        default=1000,
+        metavar="N",
+        help="Stop enumerating elementary cycles after N results (default: 1000)",
+    )
+
+    packages = parser.add_mutually_exclusive_group()
+    packages.add_argument(
+        "--package-depth",
+        type=_positive_int,
+        metavar="N",
+        help="Group modules into packages by their first N directories and "
+        "report package-level dependencies and cycles",
+    )
+    packages.add_argument(
+        "--package-pattern",
+        type=_regex,
+        metavar="REGEX",
+        help="Group modules into packages by REGEX (first capture group, or the "
+        "whole match); unmatched modules are their own package",
+    )
+
+    parser.add_argument(
+        "--hierarchy",
+        action="store_true",
+        help="Show the class inheritance tree built from extends (text output)",
+    )
+
+    parser.add_argument(
+        "--suggest-breaks",
+        action="store_true",
+        help="Suggest the cheapest dependencies to remove to break each cycle "
+        "(text output)",
+    )
+
+    parser.add_argument(
+        "--top-impact",
+        type=_positive_int,
+        metavar="N",
+        help="List the N modules with the most transitive dependents (text output)",
+    )
+
+    parser.add_argument(
+        "--chokepoints",
+        type=_positive_int,
+        metavar="N",
+        help="List the N modules that dominate the most modules loaded from "
+        "the main scene and autoloads (text output)",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -81,10 +277,44 @@ Examples:
         help="Skip rule evaluation",
     )
 
+    parser.add_argument(
+        "--rule-stats",
+        action="store_true",
+        help="Show the time, modules matched, edges tested and violations of "
+        "each rule (text output; always included in JSON output)",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Only check error rules, cheapest first, and stop at the first violation",
+    )
+
+    parser.add_argument(
+        "--max-violations-per-rule",
+        type=_positive_int,
+        metavar="N",
+        help="List at most N violations of each rule; the rest are only counted",
+    )
+
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="Only report (and fail on) violations and cycles not recorded in "
+        "this baseline file",
+    )
+
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Record the current violations and cycles in the --baseline file and exit",
+    )
+
     parser.add_argument(
         "--exclude",
         action="append",
         default=None,
+        type=_regex,
         metavar="PATTERN",
         help="Regex pattern to exclude paths from analysis (can be repeated)",
     )
@@ -104,9 +334,48 @@ Examples:
     return parser
 
 
+def _make_formatter(args: argparse.Namespace):
+    """Instantiate the formatter for ``--format`` with its CLI options."""
+    if args.format == "text":
+        return TextFormatter(
+            top_impact=args.top_impact,
+            chokepoints=args.chokepoints,
+            cycle_breaks=args.suggest_breaks,
+            hierarchy=args.hierarchy,
+            rule_stats=args.rule_stats,
+        )
+    if args.format in ("dot", "mermaid"):
+        return FORMATTERS[args.format](reduce=args.reduce)
+    if args.format == "dsm":
+        return FORMATTERS[args.format](layout=args.dsm_layout)
+    return FORMATTERS[args.format]()
+
+
+def _package_key(args: argparse.Namespace):
+    """Return the package key function selected on the command line, if any."""
+    if args.package_depth is not None:
+        return depth_key(args.package_depth)
+    if args.package_pattern is not None:
+        return pattern_key(args.package_pattern)
+    return None
+
+
 def run(args: argparse.Namespace) -> int:
     project_path = Path(args.path).resolve()
 
+    if args.write_baseline and not args.baseline:
+        print("Error: --write-baseline requires --baseline FILE", file=sys.stderr)
+        return 1
+
+    if args.baseline and (args.fail_fast or args.max_violations_per_rule):
+        # A baseline is matched against, or records, every violation.
+        print(
+            "Error: --baseline cannot be combined with --fail-fast or "
+            "--max-violations-per-rule",
+            file=sys.stderr,
+        )
+        return 1
+
     if not project_path.exists():
         print(f"Error: Path does not exist: {project_path}", file=sys.stderr)
         return 1
@@ -129,6 +398,15 @@ def run(args: argparse.Namespace) -> int:
     # when they leave no valid rules behind (e.g. a mistyped section name).
     for w in config.warnings:
         print(f"Warning: {w}", file=sys.stderr)
+    for option, patterns in (
+        ("--exclude", args.exclude or []),
+        ("--focus", [args.focus]),
+        ("--package-pattern", [args.package_pattern]),
+    ):
+        for pattern in patterns:
+            if pattern and has_nested_quantifiers(pattern):
+                message = NESTED_QUANTIFIERS.format(pattern=pattern)
+                print(f"Warning: {option}: {message}", file=sys.stderr)
 
     # Validate config
     if config.has_rules() or args.validate_config:
@@ -152,6 +430,8 @@ def run(args: argparse.Namespace) -> int:
                 print(f"  Forbidden rules: {len(config.forbidden)}")
                 print(f"  Allowed rules: {len(config.allowed)}")
                 print(f"  Required rules: {len(config.required)}")
+                print(f"  Threshold rules: {len(config.thresholds)}")
+                print(f"  Layers: {len(config.layers)}")
             else:
                 print("No config file found")
             return 0
@@ -160,6 +440,8 @@ def run(args: argparse.Namespace) -> int:
         print(f"Analyzing: {project_path}")
         if config.has_rules():
             print(f"Rules loaded: {len(config.all_rules())}")
+            if config.layers:
+                print(f"Layers: {' < '.join(layer.name for layer in config.layers)}")
 
     exclude = list(config.options.exclude)
     if args.exclude:
@@ -181,32 +463,112 @@ def run(args: argparse.Namespace) -> int:
         exclude=exclude or None,
         cache=cache,
     )
-    result = analyzer.analyze(detect_cycles=not args.no_cycles)
+    result = analyzer.analyze(
+        detect_cycles=not args.no_cycles,
+        elementary_cycles=args.elementary_cycles,
+        max_cycle_length=args.max_cycle_length,
+        max_cycles=args.max_cycles,
+        cycle_types=args.cycle_types,
+        package_key=_package_key(args),
+    )
 
     # Evaluate rules
     rule_result = None
     if config.has_rules() and not args.ignore_rules:
-        engine = RuleEngine(config, result.graph)
+        engine = RuleEngine(
+            config,
+            result.graph,
+            reachability=result.reachability,
+            condensation=result.condensation,
+            metrics=result.metrics,
+            fail_fast=args.fail_fast,
+            max_violations=args.max_violations_per_rule,
+        )
         rule_result = engine.check_all(cycles=result.cycles)
 
+        for name, seconds in rule_result.slow_rules.items():
+            print(
+                f"Warning: {name} spent {seconds:.2f}s matching paths "
+                f"(regexBudget {config.options.regex_budget}s); its patterns may "
+                "backtrack catastrophically",
+                file=sys.stderr,
+            )
+
         if args.verbose:
             print(
                 f"Rule violations: {rule_result.error_count()} errors, "
                 f"{rule_result.warning_count()} warnings"
             )
+            slowest = sorted(rule_result.stats, key=lambda s: s.seconds, reverse=True)
+            if slowest:
+                print("Slowest rules (see --rule-stats):")
+            for s in slowest[:5]:
+                print(
+                    f"  {s.rule}: {s.seconds * 1000:.2f} ms, {s.modules} modules, "
+                    f"{s.edges} edges, {s.violations} violations"
+                )
+
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        package_cycles = result.packages.cycles() if result.packages else []
+        if args.write_baseline:
+            Baseline.from_results(result.cycles, rule_result, package_cycles).save(
+                baseline_path
+            )
+            violations = len(rule_result.violations) if rule_result else 0
+            print(
+                f"Baseline written to {baseline_path}: {violations} violations, "
+                f"{len(result.cycles)} cycles, {len(package_cycles)} package cycles"
+            )
+            return 0
+        try:
+            baseline = Baseline.load(baseline_path)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        known_cycles = len(result.cycles)
+        result = replace(result, cycles=baseline.new_cycles(result.cycles))
+        known_cycles -= len(result.cycles)
+        if result.packages:
+            new_package_cycles = baseline.new_package_cycles(package_cycles)
+            known_cycles += len(package_cycles) - len(new_package_cycles)
+            result = replace(
+                result, packages=result.packages.with_cycles(new_package_cycles)
+            )
+        known_violations = 0
+        if rule_result:
+            known_violations = len(rule_result.violations)
+            rule_result = baseline.new_violations(rule_result)
+            known_violations -= len(rule_result.violations)
+        if args.verbose:
+            print(
+                f"Baseline: {known_violations} known violations and "
+                f"{known_cycles} known cycles not reported"
+            )
 
-    # Format output
-    formatter = FORMATTERS[args.format]()
-    output = formatter.format(result, rule_result)
-
-    # Write output
-    if args.output:
+    # Format the selected view; the exit code below still covers every module.
+    view = result.subgraph(
+        focus=args.focus, depth=args.depth, only_cycles=args.only_cycles
+    )
+    formatter = _make_formatter(args)
+
+    # Formatters with a write() method stream their output instead.
+    if hasattr(formatter, "write"):
+        if args.output:
+            with Path(args.output).open("w", encoding="utf-8", newline="") as out:
+                formatter.write(out, view, rule_result)
+            if args.verbose:
+                print(f"Output written to: {args.output}")
+        else:
+            formatter.write(sys.stdout, view, rule_result)
+    elif args.output:
+        output = formatter.format(view, rule_result)
         output_path = Path(args.output)
         output_path.write_text(output, encoding="utf-8")
         if args.verbose:
             print(f"Output written to: {output_path}")
     else:
-        print(output)
+        print(formatter.format(view, rule_result))
 
     # Return non-zero if rule errors or cycles found
     if rule_result and rule_result.has_errors():
@@ -215,10 +577,65 @@ def run(args: argparse.Namespace) -> int:
     if result.cycles and not args.no_cycles:
         return 1
 
+    if result.packages and result.packages.cycles() and not args.no_cycles:
+        return 1
+
     return 0
 
 
-def main() -> int:
+def create_diff_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="gdcruiser diff",
+        description="Compare two JSON analysis snapshots (gdcruiser -f json) and "
+        "report added/removed modules and dependencies, new or grown cycles, "
+        "and coupling metric changes. Exits 1 when a cycle appeared or grew.",
+    )
+    parser.add_argument("old", help="Snapshot of the base version")
+    parser.add_argument("new", help="Snapshot of the changed version")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Write output to file instead of stdout",
+    )
+    return parser
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    snapshots = []
+    for name in (args.old, args.new):
+        try:
+            snapshots.append(load_snapshot(Path(name)))
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read snapshot {name}: {e}", file=sys.stderr)
+            return 1
+
+    diff = diff_snapshots(*snapshots)
+    if args.format == "json":
+        output = json.dumps(diff.to_dict(), indent=2)
+    else:
+        output = format_text(diff)
+
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    return 1 if diff.has_new_cycles() else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    # A project directory named "diff" is analyzed, not taken as the command.
+    if argv and argv[0] == "diff" and not Path(argv[0]).is_dir():
+        return run_diff(create_diff_parser().parse_args(argv[1:]))
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     return run(args)
@@ -1,7 +1,7 @@
 """Configuration module for gdcruiser custom rules."""
 
 from .loader import ConfigError, ConfigLoader
-from .models import Config, ConfigOptions, PathMatcher, Rule, Severity
+from .models import Config, ConfigOptions, Layer, PathMatcher, Rule, Severity
 from .validator import ConfigValidator, ValidationResult
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "ConfigLoader",
     "ConfigOptions",
     "ConfigValidator",
+    "Layer",
     "PathMatcher",
     "Rule",
     "Severity",
@@ -3,7 +3,8 @@
 import json
 from pathlib import Path
 
-from .models import Config, ConfigOptions, PathMatcher, Rule, Severity
+from ..graph.node import DependencyType
+from .models import Config, ConfigOptions, Layer, PathMatcher, Rule, Severity
 
 
 class ConfigError(Exception):
@@ -90,12 +91,30 @@ class ConfigLoader:
 
         return self._parse_config(tool_config)
 
-    _TOP_LEVEL_KEYS = frozenset({"forbidden", "allowed", "required", "options"})
+    _TOP_LEVEL_KEYS = frozenset(
+        {"forbidden", "allowed", "required", "thresholds", "layers", "options"}
+    )
     _RULE_KEYS = frozenset(
-        {"name", "severity", "comment", "from", "to", "circular", "orphan"}
+        {
+            "name",
+            "severity",
+            "comment",
+            "from",
+            "to",
+            "circular",
+            "orphan",
+            "reachable",
+            "dependencyTypes",
+            "dependencyTypesNot",
+            "maxFanOut",
+            "maxFanIn",
+            "maxDepth",
+            "maxCycleSize",
+        }
     )
     _MATCHER_KEYS = frozenset({"path", "pathNot"})
-    _OPTION_KEYS = frozenset({"exclude"})
+    _LAYER_KEYS = frozenset({"name", "path", "pathNot"})
+    _OPTION_KEYS = frozenset({"exclude", "regexBudget"})
 
     def _parse_config(self, data: dict) -> Config:
         """Parse configuration dictionary into Config object."""
@@ -114,12 +133,22 @@ class ConfigLoader:
             self._parse_rule(r, f"required[{i}]", warnings)
             for i, r in enumerate(data.get("required", []))
         ]
+        thresholds = [
+            self._parse_rule(r, f"thresholds[{i}]", warnings)
+            for i, r in enumerate(data.get("thresholds", []))
+        ]
+        layers = [
+            self._parse_layer(layer, f"layers[{i}]", warnings)
+            for i, layer in enumerate(data.get("layers", []))
+        ]
         options = self._parse_options(data.get("options", {}), warnings)
 
         return Config(
             forbidden=forbidden,
             allowed=allowed,
             required=required,
+            thresholds=thresholds,
+            layers=layers,
             options=options,
             warnings=warnings,
         )
@@ -167,6 +196,47 @@ class ConfigLoader:
             ),
             circular=data.get("circular", False),
             orphan=data.get("orphan", False),
+            reachable=data.get("reachable", False),
+            dependency_types=self._parse_dependency_types(
+                data, "dependencyTypes", path, warnings
+            ),
+            dependency_types_not=self._parse_dependency_types(
+                data, "dependencyTypesNot", path, warnings
+            ),
+            max_fan_out=data.get("maxFanOut"),
+            max_fan_in=data.get("maxFanIn"),
+            max_depth=data.get("maxDepth"),
+            max_cycle_size=data.get("maxCycleSize"),
+        )
+
+    def _parse_dependency_types(
+        self, data: dict, key: str, path: str, warnings: list[str]
+    ) -> list[DependencyType] | None:
+        """Parse a list of dependency type names, skipping unknown ones."""
+        if key not in data:
+            return None
+        names = data[key]
+        if isinstance(names, str):
+            names = [names]
+        types: list[DependencyType] = []
+        for name in names:
+            try:
+                types.append(DependencyType(str(name).lower()))
+            except ValueError:
+                valid = ", ".join(t.value for t in DependencyType)
+                warnings.append(
+                    f"{path}.{key}: unknown dependency type '{name}', "
+                    f"ignored (valid: {valid})"
+                )
+        return types
+
+    def _parse_layer(self, data: dict, path: str, warnings: list[str]) -> Layer:
+        """Parse a layer dictionary into a Layer object."""
+        self._warn_unknown_keys(data, self._LAYER_KEYS, path, warnings)
+        return Layer(
+            name=data.get("name", ""),
+            path=data.get("path"),
+            pathNot=data.get("pathNot"),
         )
 
     def _parse_options(self, data: dict, warnings: list[str]) -> ConfigOptions:
@@ -174,4 +244,5 @@ class ConfigLoader:
         self._warn_unknown_keys(data, self._OPTION_KEYS, "options", warnings)
         return ConfigOptions(
             exclude=data.get("exclude", []),
+            regex_budget=data.get("regexBudget", 1.0),
         )
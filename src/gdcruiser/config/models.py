@@ -1,8 +1,14 @@
 """Configuration models for gdcruiser custom rules."""
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ..graph.node import DependencyType
+
+# ``$1``..``$9`` in a ``to`` pattern: a group captured by the ``from`` pattern.
+BACK_REFERENCE = re.compile(r"\$([1-9])")
+
 
 class Severity(Enum):
     """Rule violation severity levels."""
@@ -32,6 +38,16 @@ class Rule:
     to: PathMatcher | None = None
     circular: bool = False
     orphan: bool = False
+    # Forbidden rules only: also match targets reached through other modules.
+    reachable: bool = False
+    # Edge rules only: restrict the rule to dependencies of these types.
+    dependency_types: list[DependencyType] | None = None
+    dependency_types_not: list[DependencyType] | None = None
+    # Threshold rules only: limits checked for every module matching 'from'.
+    max_fan_out: int | None = None
+    max_fan_in: int | None = None
+    max_depth: int | None = None
+    max_cycle_size: int | None = None
 
     def __post_init__(self) -> None:
         if self.from_ is None:
@@ -39,12 +55,32 @@ class Rule:
         if self.to is None:
             self.to = PathMatcher()
 
+    def dependency_type_set(self) -> frozenset[DependencyType] | None:
+        """Return the dependency types the rule applies to (None for all)."""
+        if self.dependency_types is None and self.dependency_types_not is None:
+            return None
+        types = frozenset(
+            DependencyType if self.dependency_types is None else self.dependency_types
+        )
+        return types - frozenset(self.dependency_types_not or ())
+
+
+@dataclass
+class Layer:
+    """An architectural layer: the modules whose path matches its patterns."""
+
+    name: str
+    path: str | None = None
+    pathNot: str | None = None
+
 
 @dataclass
 class ConfigOptions:
     """Global configuration options."""
 
     exclude: list[str] = field(default_factory=list)
+    # Seconds a rule's patterns may spend matching paths before it is reported.
+    regex_budget: float = 1.0
 
 
 @dataclass
@@ -54,13 +90,22 @@ class Config:
     forbidden: list[Rule] = field(default_factory=list)
     allowed: list[Rule] = field(default_factory=list)
     required: list[Rule] = field(default_factory=list)
+    thresholds: list[Rule] = field(default_factory=list)
+    # Ordered bottom to top: a module may only depend on its own or lower layers.
+    layers: list[Layer] = field(default_factory=list)
     options: ConfigOptions = field(default_factory=ConfigOptions)
     # Non-fatal issues found while loading (unknown keys, bad enum values).
     warnings: list[str] = field(default_factory=list)
 
     def has_rules(self) -> bool:
         """Check if any rules are defined."""
-        return bool(self.forbidden or self.allowed or self.required)
+        return bool(
+            self.forbidden
+            or self.allowed
+            or self.required
+            or self.thresholds
+            or self.layers
+        )
 
     def all_rules(self) -> list[tuple[str, Rule]]:
         """Return all rules with their type."""
@@ -71,4 +116,6 @@ class Config:
             rules.append(("allowed", rule))
         for rule in self.required:
             rules.append(("required", rule))
+        for rule in self.thresholds:
+            rules.append(("thresholds", rule))
         return rules
@@ -3,7 +3,7 @@
 import re
 from dataclasses import dataclass, field
 
-from .models import Config, PathMatcher, Rule
+from .models import BACK_REFERENCE, Config, Layer, PathMatcher, Rule
 
 
 @dataclass
@@ -32,6 +32,146 @@ class ValidationResult:
         self.warnings.append(ValidationError(path, message))
 
 
+# Rule attribute -> config key of the limits used by threshold rules.
+THRESHOLD_KEYS = {
+    "max_fan_out": "maxFanOut",
+    "max_fan_in": "maxFanIn",
+    "max_depth": "maxDepth",
+    "max_cycle_size": "maxCycleSize",
+}
+
+# The nested quantifier check walks the parse tree of CPython's private
+# regex parser. Where it is missing or has changed, the check is skipped.
+try:
+    from re import _constants as sre
+    from re import _parser
+
+    # Regexes for the character categories of ``\\d``, ``\\w`` and ``\\s``.
+    _CATEGORIES = {
+        str(category): re.compile(pattern)
+        for category, pattern in (
+            (sre.CATEGORY_DIGIT, r"\d"),
+            (sre.CATEGORY_NOT_DIGIT, r"\D"),
+            (sre.CATEGORY_WORD, r"\w"),
+            (sre.CATEGORY_NOT_WORD, r"\W"),
+            (sre.CATEGORY_SPACE, r"\s"),
+            (sre.CATEGORY_NOT_SPACE, r"\S"),
+        )
+    }
+    _REPEATS = (sre.MAX_REPEAT, sre.MIN_REPEAT)
+except (ImportError, AttributeError):
+    _parser = None
+
+NESTED_QUANTIFIERS = (
+    "Regex pattern '{pattern}' nests unbounded quantifiers and may backtrack "
+    "catastrophically; use a possessive quantifier ('++', '*+') or an atomic "
+    "group '(?>...)' for the inner one"
+)
+
+
+def has_nested_quantifiers(pattern: str) -> bool:
+    """Check whether ``pattern`` may backtrack catastrophically.
+
+    Flags an unbounded quantifier nested in another one, as in ``(a+)+`` or
+    ``(\\w+\\s?)*``, where a failing match tries every way of splitting the
+    input between the iterations. An iteration that must match a literal
+    the inner quantifier cannot, as the ``/`` in ``(\\w+/)*``, leaves only one
+    way and is not flagged, nor are possessive quantifiers and atomic
+    groups, which never backtrack. This is a heuristic for the common
+    exponential cases, not a proof that a pattern is safe. Always False
+    when the interpreter's regex parser is not available.
+    """
+    if _parser is None:
+        return False
+    try:
+        parsed = _parser.parse(pattern)
+    except re.error:
+        return False
+    return _nested_repeat(list(parsed), False, frozenset())
+
+
+def _nested_repeat(items: list, nested: bool, separators: frozenset[int]) -> bool:
+    """Search ``items`` for an unbounded repeat in another one.
+
+    ``nested`` tells whether ``items`` are inside an unbounded repeat, and
+    ``separators`` are the literals every iteration of that repeat matches.
+    """
+    separators = separators | {av for op, av in items if op is sre.LITERAL}
+    for op, av in items:
+        if op in _REPEATS and av[1] == sre.MAXREPEAT:
+            body = list(av[2])
+            if nested and all(_may_match(body, c) for c in separators):
+                return True
+            if _nested_repeat(body, True, frozenset()):
+                return True
+            continue
+        if op in _REPEATS:
+            children = [av[2]]
+        elif op is sre.SUBPATTERN:
+            children = [av[3]]
+        elif op is sre.BRANCH:
+            children = av[1]
+        elif op in (sre.ASSERT, sre.ASSERT_NOT):
+            children = [av[1]]
+        elif op is sre.GROUPREF_EXISTS:
+            children = [av[1], av[2]]
+        else:
+            # Literals, and atomic groups and possessive repeats, which do
+            # not backtrack into their contents.
+            continue
+        for child in children:
+            if child and _nested_repeat(list(child), nested, separators):
+                return True
+    return False
+
+
+def _may_match(items: list, char: int) -> bool:
+    """Check whether any part of ``items`` may match the character ``char``."""
+    for op, av in items:
+        if op is sre.LITERAL:
+            hit = av == char
+        elif op is sre.NOT_LITERAL:
+            hit = av != char
+        elif op is sre.ANY:
+            hit = char != ord("\n")
+        elif op is sre.IN:
+            hit = _in_matches(av, char)
+        elif op in (*_REPEATS, sre.POSSESSIVE_REPEAT):
+            hit = _may_match(list(av[2]), char)
+        elif op is sre.SUBPATTERN:
+            hit = _may_match(list(av[3]), char)
+        elif op is sre.ATOMIC_GROUP:
+            hit = _may_match(list(av), char)
+        elif op is sre.BRANCH:
+            hit = any(_may_match(list(branch), char) for branch in av[1])
+        elif op in (sre.AT, sre.ASSERT, sre.ASSERT_NOT):
+            hit = False  # Zero-width
+        else:
+            hit = True  # Back-references and the like: assume the worst
+        if hit:
+            return True
+    return False
+
+
+def _in_matches(items: list, char: int) -> bool:
+    """Check whether the character class ``items`` matches ``char``."""
+    negate = False
+    hit = False
+    for op, av in items:
+        if op is sre.NEGATE:
+            negate = True
+        elif op is sre.LITERAL:
+            hit = hit or av == char
+        elif op is sre.RANGE:
+            hit = hit or av[0] <= char <= av[1]
+        elif op is sre.CATEGORY:
+            category = _CATEGORIES.get(str(av))
+            hit = hit or category is None or bool(category.match(chr(char)))
+        else:
+            hit = True
+    return hit != negate
+
+
 class ConfigValidator:
     """Validates gdcruiser configuration."""
 
@@ -41,13 +181,22 @@ class ConfigValidator:
 
         for i, rule in enumerate(config.forbidden):
             self._validate_rule(rule, f"forbidden[{i}]", result)
+            self._warn_thresholds_only(rule, f"forbidden[{i}]", result)
 
         for i, rule in enumerate(config.allowed):
             self._validate_rule(rule, f"allowed[{i}]", result)
+            self._warn_forbidden_only(rule, f"allowed[{i}]", result)
+            self._warn_thresholds_only(rule, f"allowed[{i}]", result)
 
         for i, rule in enumerate(config.required):
             self._validate_rule(rule, f"required[{i}]", result)
+            self._warn_forbidden_only(rule, f"required[{i}]", result)
+            self._warn_thresholds_only(rule, f"required[{i}]", result)
+
+        for i, rule in enumerate(config.thresholds):
+            self._validate_threshold_rule(rule, f"thresholds[{i}]", result)
 
+        self._validate_layers(config.layers, result)
         self._validate_options(config, result)
 
         return result
@@ -62,6 +211,7 @@ class ConfigValidator:
 
         if rule.to:
             self._validate_path_matcher(rule.to, f"{path}.to", result)
+            self._validate_back_references(rule, path, result)
 
         # Check that rule has some matching criteria
         has_path_criteria = (
@@ -72,11 +222,77 @@ class ConfigValidator:
         )
         has_special_criteria = rule.circular or rule.orphan
 
+        if rule.circular or rule.orphan or rule.reachable:
+            self._warn_types_ignored(
+                rule, path, "circular, orphan and reachable rules", result
+            )
+
         if not has_path_criteria and not has_special_criteria:
             result.add_warning(
                 path, "Rule has no matching criteria and will match nothing"
             )
 
+    def _warn_forbidden_only(
+        self, rule: Rule, path: str, result: ValidationResult
+    ) -> None:
+        """Warn about flags that only have an effect on forbidden rules."""
+        for flag in ("circular", "orphan", "reachable"):
+            if getattr(rule, flag):
+                result.add_warning(
+                    f"{path}.{flag}", f"'{flag}' only applies to forbidden rules"
+                )
+
+    def _warn_types_ignored(
+        self, rule: Rule, path: str, kind: str, result: ValidationResult
+    ) -> None:
+        """Warn about dependency type filters on rules that ignore them."""
+        for attr, key in (
+            ("dependency_types", "dependencyTypes"),
+            ("dependency_types_not", "dependencyTypesNot"),
+        ):
+            if getattr(rule, attr) is not None:
+                result.add_warning(f"{path}.{key}", f"'{key}' is ignored by {kind}")
+
+    def _warn_thresholds_only(
+        self, rule: Rule, path: str, result: ValidationResult
+    ) -> None:
+        """Warn about limits set outside the thresholds section."""
+        for attr, key in THRESHOLD_KEYS.items():
+            if getattr(rule, attr) is not None:
+                result.add_warning(
+                    f"{path}.{key}", f"'{key}' only applies to threshold rules"
+                )
+
+    def _validate_threshold_rule(
+        self, rule: Rule, path: str, result: ValidationResult
+    ) -> None:
+        """Validate a threshold rule: a 'from' scope plus at least one limit."""
+        if not rule.name:
+            result.add_error(path, "Rule must have a name")
+
+        if rule.from_:
+            self._validate_path_matcher(rule.from_, f"{path}.from", result)
+
+        if rule.to and (rule.to.path or rule.to.pathNot):
+            result.add_warning(f"{path}.to", "'to' is ignored by threshold rules")
+        self._warn_forbidden_only(rule, path, result)
+        self._warn_types_ignored(rule, path, "threshold rules", result)
+
+        limits = 0
+        for attr, key in THRESHOLD_KEYS.items():
+            value = getattr(rule, attr)
+            if value is None:
+                continue
+            limits += 1
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                result.add_error(
+                    f"{path}.{key}", f"must be a non-negative integer, got {value!r}"
+                )
+        if not limits:
+            result.add_warning(
+                path, "Threshold rule sets no limit and will match nothing"
+            )
+
     def _validate_path_matcher(
         self, matcher: PathMatcher, path: str, result: ValidationResult
     ) -> None:
@@ -87,6 +303,26 @@ class ConfigValidator:
         if matcher.pathNot:
             self._validate_regex(matcher.pathNot, f"{path}.pathNot", result)
 
+    def _validate_back_references(
+        self, rule: Rule, path: str, result: ValidationResult
+    ) -> None:
+        """Check that ``$N`` in 'to' refers to a group of 'from.path'."""
+        groups = 0
+        if rule.from_ and rule.from_.path:
+            try:
+                groups = re.compile(rule.from_.path).groups
+            except re.error:
+                return  # Reported as an invalid 'from.path' already
+        for key in ("path", "pathNot"):
+            pattern = getattr(rule.to, key)
+            for match in BACK_REFERENCE.finditer(pattern or ""):
+                if int(match.group(1)) > groups:
+                    result.add_error(
+                        f"{path}.to.{key}",
+                        f"'{match.group(0)}' refers to a group that 'from.path' "
+                        f"does not capture ({groups} groups)",
+                    )
+
     def _validate_regex(
         self, pattern: str, path: str, result: ValidationResult
     ) -> None:
@@ -95,8 +331,40 @@ class ConfigValidator:
             re.compile(pattern)
         except re.error as e:
             result.add_error(path, f"Invalid regex pattern '{pattern}': {e}")
+            return
+        # A heuristic, so only a warning: the pattern may well be safe.
+        if has_nested_quantifiers(pattern):
+            result.add_warning(path, NESTED_QUANTIFIERS.format(pattern=pattern))
+
+    def _validate_layers(self, layers: list[Layer], result: ValidationResult) -> None:
+        """Validate the layer names and patterns."""
+        seen: set[str] = set()
+        for i, layer in enumerate(layers):
+            path = f"layers[{i}]"
+            if not layer.name:
+                result.add_error(path, "Layer must have a name")
+            elif layer.name in seen:
+                result.add_error(path, f"Duplicate layer name '{layer.name}'")
+            seen.add(layer.name)
+
+            if not layer.path:
+                result.add_error(path, "Layer must have a 'path' pattern")
+            self._validate_path_matcher(
+                PathMatcher(path=layer.path, pathNot=layer.pathNot), path, result
+            )
 
     def _validate_options(self, config: Config, result: ValidationResult) -> None:
         """Validate configuration options."""
         for i, pattern in enumerate(config.options.exclude):
             self._validate_regex(pattern, f"options.exclude[{i}]", result)
+
+        budget = config.options.regex_budget
+        if (
+            isinstance(budget, bool)
+            or not isinstance(budget, (int, float))
+            or budget <= 0
+        ):
+            result.add_error(
+                "options.regexBudget",
+                f"must be a positive number of seconds, got {budget!r}",
+            )
@@ -0,0 +1,236 @@
+"""Architectural diff between two JSON analysis snapshots.
+
+Compares two ``AnalysisResult.to_dict()`` outputs (``gdcruiser -f json``)
+and reports only what changed structurally: modules, edges by type, cycles
+and per-module metrics. Edges are compared by ``(from, to, type)`` keys in
+hash sets, so the diff is linear in the size of the snapshots; line numbers
+are ignored so that moving code around is not reported as a change.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Coupling metrics compared between snapshots, from the "metrics" section.
+# PageRank is left out: any edge change shifts every module's score slightly.
+DIFF_METRICS = ("afferent", "efferent", "instability")
+
+
+@dataclass
+class CycleChange:
+    """A cycle in the new snapshot that did not exist, or got bigger."""
+
+    modules: list[str]
+    # Modules that were not in an overlapping cycle before (all of them for
+    # a brand-new cycle).
+    added: list[str]
+    grown: bool
+
+    def to_dict(self) -> dict:
+        return {"modules": self.modules, "added": self.added, "grown": self.grown}
+
+
+@dataclass
+class GraphDiff:
+    """Structural differences between an old and a new snapshot."""
+
+    added_modules: list[str] = field(default_factory=list)
+    removed_modules: list[str] = field(default_factory=list)
+    # Dependency type -> sorted (from, to) pairs.
+    added_edges: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    removed_edges: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    cycle_changes: list[CycleChange] = field(default_factory=list)
+    resolved_cycles: list[list[str]] = field(default_factory=list)
+    # Module -> metric -> (old, new), only for metrics that changed.
+    metric_deltas: dict[str, dict[str, tuple[float, float]]] = field(
+        default_factory=dict
+    )
+
+    def is_empty(self) -> bool:
+        """Check whether the snapshots are architecturally identical."""
+        return not (
+            self.added_modules
+            or self.removed_modules
+            or self.added_edges
+            or self.removed_edges
+            or self.cycle_changes
+            or self.resolved_cycles
+            or self.metric_deltas
+        )
+
+    def has_new_cycles(self) -> bool:
+        """Check whether any cycle appeared or grew."""
+        return bool(self.cycle_changes)
+
+    def to_dict(self) -> dict:
+        def edges(by_type: dict[str, list[tuple[str, str]]]) -> dict:
+            return {
+                dep_type: [{"from": a, "to": b} for a, b in pairs]
+                for dep_type, pairs in sorted(by_type.items())
+            }
+
+        return {
+            "modules": {
+                "added": self.added_modules,
+                "removed": self.removed_modules,
+            },
+            "edges": {
+                "added": edges(self.added_edges),
+                "removed": edges(self.removed_edges),
+            },
+            "cycles": {
+                "new": [c.to_dict() for c in self.cycle_changes],
+                "resolved": self.resolved_cycles,
+            },
+            "metrics": {
+                path: {
+                    name: {"old": old, "new": new, "delta": round(new - old, 6)}
+                    for name, (old, new) in metrics.items()
+                }
+                for path, metrics in self.metric_deltas.items()
+            },
+        }
+
+
+def load_snapshot(path: Path) -> dict:
+    """Load a JSON snapshot written by ``gdcruiser -f json``.
+
+    Raises ``ValueError`` when the file is not such a snapshot.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or "graph" not in data:
+        raise ValueError(f"{path} is not a gdcruiser JSON snapshot")
+    return data
+
+
+def _edge_keys(snapshot: dict) -> set[tuple[str, str, str]]:
+    keys: set[tuple[str, str, str]] = set()
+    for path, module in snapshot["graph"].get("modules", {}).items():
+        for dep in module.get("dependencies", []):
+            keys.add((path, dep["target"], dep["type"]))
+    return keys
+
+
+def _group_edges(
+    keys: set[tuple[str, str, str]],
+) -> dict[str, list[tuple[str, str]]]:
+    grouped: dict[str, list[tuple[str, str]]] = {}
+    for source, target, dep_type in keys:
+        grouped.setdefault(dep_type, []).append((source, target))
+    for pairs in grouped.values():
+        pairs.sort()
+    return grouped
+
+
+def _cycle_changes(
+    old_cycles: list[list[str]], new_cycles: list[list[str]]
+) -> tuple[list[CycleChange], list[list[str]]]:
+    """Match cycles by shared modules in one pass over each cycle list."""
+    old_cycle_of: dict[str, int] = {}
+    for i, cycle in enumerate(old_cycles):
+        for path in cycle:
+            old_cycle_of[path] = i
+
+    changes: list[CycleChange] = []
+    matched: set[int] = set()
+    for cycle in new_cycles:
+        overlapping = {old_cycle_of[p] for p in cycle if p in old_cycle_of}
+        matched |= overlapping
+        added = sorted(p for p in cycle if p not in old_cycle_of)
+        if not overlapping:
+            changes.append(CycleChange(sorted(cycle), added, grown=False))
+        elif added or len(overlapping) > 1:
+            # Gained modules, or merged previously separate cycles.
+            changes.append(CycleChange(sorted(cycle), added, grown=True))
+
+    resolved = [sorted(cycle) for i, cycle in enumerate(old_cycles) if i not in matched]
+    return changes, resolved
+
+
+def _metric_deltas(old: dict, new: dict) -> dict[str, dict[str, tuple[float, float]]]:
+    old_metrics = (old.get("metrics") or {}).get("modules", {})
+    new_metrics = (new.get("metrics") or {}).get("modules", {})
+    deltas: dict[str, dict[str, tuple[float, float]]] = {}
+    for path, after in new_metrics.items():
+        before = old_metrics.get(path)
+        if before is None:
+            continue
+        changed = {
+            name: (before[name], after[name])
+            for name in DIFF_METRICS
+            if name in before and name in after and before[name] != after[name]
+        }
+        if changed:
+            deltas[path] = changed
+    return deltas
+
+
+def diff_snapshots(old: dict, new: dict) -> GraphDiff:
+    """Compute the structural diff from ``old`` to ``new``."""
+    old_modules = set(old["graph"].get("modules", {}))
+    new_modules = set(new["graph"].get("modules", {}))
+    old_edges = _edge_keys(old)
+    new_edges = _edge_keys(new)
+    changes, resolved = _cycle_changes(old.get("cycles", []), new.get("cycles", []))
+    return GraphDiff(
+        added_modules=sorted(new_modules - old_modules),
+        removed_modules=sorted(old_modules - new_modules),
+        added_edges=_group_edges(new_edges - old_edges),
+        removed_edges=_group_edges(old_edges - new_edges),
+        cycle_changes=changes,
+        resolved_cycles=resolved,
+        metric_deltas=_metric_deltas(old, new),
+    )
+
+
+def format_text(diff: GraphDiff) -> str:
+    """Render a diff as a human-readable report."""
+    if diff.is_empty():
+        return "No architectural changes.\n"
+
+    lines: list[str] = []
+
+    def section(title: str) -> None:
+        if lines:
+            lines.append("")
+        lines.extend(["-" * 40, title, "-" * 40])
+
+    if diff.added_modules or diff.removed_modules:
+        section(f"MODULES (+{len(diff.added_modules)} -{len(diff.removed_modules)})")
+        lines.extend(f"  + {path}" for path in diff.added_modules)
+        lines.extend(f"  - {path}" for path in diff.removed_modules)
+
+    if diff.added_edges or diff.removed_edges:
+        added = sum(len(pairs) for pairs in diff.added_edges.values())
+        removed = sum(len(pairs) for pairs in diff.removed_edges.values())
+        section(f"DEPENDENCIES (+{added} -{removed})")
+        for sign, by_type in (("+", diff.added_edges), ("-", diff.removed_edges)):
+            for dep_type, pairs in sorted(by_type.items()):
+                for source, target in pairs:
+                    lines.append(f"  {sign} {source} --[{dep_type}]--> {target}")
+
+    if diff.cycle_changes or diff.resolved_cycles:
+        section(
+            f"CYCLES ({len(diff.cycle_changes)} new or grown, "
+            f"{len(diff.resolved_cycles)} resolved)"
+        )
+        for change in diff.cycle_changes:
+            kind = "Grown" if change.grown else "New"
+            lines.append(f"\n{kind} cycle ({len(change.modules)} modules):")
+            added = set(change.added)
+            for path in change.modules:
+                marker = "+" if change.grown and path in added else " "
+                lines.append(f"  {marker} {path}")
+        for cycle in diff.resolved_cycles:
+            lines.append(f"\nResolved cycle: {', '.join(cycle)}")
+
+    if diff.metric_deltas:
+        section(f"METRICS ({len(diff.metric_deltas)} modules changed)")
+        for path, metrics in sorted(diff.metric_deltas.items()):
+            changes = ", ".join(
+                f"{name} {old:g} -> {new:g}" for name, (old, new) in metrics.items()
+            )
+            lines.append(f"  {path}: {changes}")
+
+    lines.append("")
+    return "\n".join(lines)
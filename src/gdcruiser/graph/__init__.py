@@ -1,5 +1,32 @@
 from .node import DependencyType, Dependency, Module
 from .dependency import DependencyGraph
-from .cycles import CycleDetector
+from .cycles import CycleDetector, ElementaryCycle
+from .csr import CSRGraph
+from .condensation import Condensation
+from .reachability import ReachabilityIndex
+from .dominators import DominatorTree
+from .feedback import CycleBreak
+from .metrics import DirectoryMetrics, GraphMetrics, ModuleMetrics
+from .hierarchy import InheritanceForest
+from .packages import PackageGraph, depth_key, pattern_key
 
-__all__ = ["DependencyType", "Dependency", "Module", "DependencyGraph", "CycleDetector"]
+__all__ = [
+    "DependencyType",
+    "Dependency",
+    "Module",
+    "DependencyGraph",
+    "CycleDetector",
+    "ElementaryCycle",
+    "CSRGraph",
+    "Condensation",
+    "ReachabilityIndex",
+    "GraphMetrics",
+    "ModuleMetrics",
+    "DirectoryMetrics",
+    "DominatorTree",
+    "CycleBreak",
+    "InheritanceForest",
+    "PackageGraph",
+    "depth_key",
+    "pattern_key",
+]
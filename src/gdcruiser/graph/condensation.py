@@ -0,0 +1,149 @@
+"""Condensation of a dependency graph into a DAG of its SCCs."""
+
+from .csr import CSRGraph, strongly_connected_components
+from .dependency import DependencyGraph
+
+
+class Condensation:
+    """The DAG obtained by collapsing every SCC into a single component.
+
+    Components are numbered in load order: a component's dependencies always
+    have smaller ids, so ``0..n`` is a valid order to load (or process) them.
+    A component's *level* is the length of its longest dependency chain —
+    level 0 components depend on nothing in the graph, and everything at
+    level ``k`` only waits on levels below ``k``.
+
+    Construction is linear in the size of the CSR graph: one Tarjan pass, then
+    one pass over the edges that builds the deduplicated DAG adjacency and the
+    levels together (dependencies are always visited first).
+    """
+
+    def __init__(self, csr: CSRGraph) -> None:
+        self.csr = csr
+        # Tarjan emits each SCC after every SCC it depends on: load order.
+        self.components = strongly_connected_components(csr)
+        self.component_of = [0] * csr.node_count()
+        for cid, members in enumerate(self.components):
+            for node in members:
+                self.component_of[node] = cid
+
+        # Deduplicated DAG adjacency in CSR form, plus longest-path levels.
+        component_of = self.component_of
+        last_seen = [-1] * len(self.components)
+        self.dag_offsets = [0]
+        self.dag_targets: list[int] = []
+        self.levels: list[int] = []
+        for cid, members in enumerate(self.components):
+            level = 0
+            for node in members:
+                for target in csr.successors(node):
+                    tc = component_of[target]
+                    if tc == cid or last_seen[tc] == cid:
+                        continue
+                    last_seen[tc] = cid
+                    self.dag_targets.append(tc)
+                    if self.levels[tc] + 1 > level:
+                        level = self.levels[tc] + 1
+            self.dag_offsets.append(len(self.dag_targets))
+            self.levels.append(level)
+
+    @classmethod
+    def from_graph(cls, graph: DependencyGraph) -> "Condensation":
+        """Condense ``graph`` over all of its in-graph edges."""
+        return cls(CSRGraph.from_graph(graph))
+
+    def component_count(self) -> int:
+        """Return the number of components (DAG nodes)."""
+        return len(self.components)
+
+    def dag_successors(self, cid: int) -> list[int]:
+        """Return the components that component ``cid`` depends on."""
+        return self.dag_targets[self.dag_offsets[cid] : self.dag_offsets[cid + 1]]
+
+    def transitive_reduction(self) -> list[list[int]]:
+        """Return the DAG successors of each component after transitive reduction.
+
+        An arc ``c -> d`` is dropped when ``d`` is also reachable through
+        another successor of ``c``. Components are visited in load order with
+        a bitset of everything each one reaches; a component's successors are
+        tried in descending id order, since a successor can only reach
+        components with smaller ids. Cost: one bitset OR per kept arc.
+        """
+        reach = [0] * len(self.components)
+        reduced: list[list[int]] = []
+        for cid in range(len(self.components)):
+            bits = 0
+            kept: list[int] = []
+            for succ in sorted(self.dag_successors(cid), reverse=True):
+                if bits >> succ & 1:
+                    continue
+                kept.append(succ)
+                bits |= 1 << succ | reach[succ]
+            reach[cid] = bits
+            reduced.append(kept)
+        return reduced
+
+    def reduction_filter(self) -> list[bool]:
+        """Return a per-edge keep flag for the transitive reduction.
+
+        Flags follow :meth:`CSRGraph.edge_filter`: edges inside a component
+        are always kept, so cycles stay visible; edges between components are
+        kept when their component arc survives :meth:`transitive_reduction`.
+        """
+        kept = {
+            (cid, succ)
+            for cid, succs in enumerate(self.transitive_reduction())
+            for succ in succs
+        }
+        csr = self.csr
+        component_of = self.component_of
+        flags = [False] * csr.edge_count()
+        for node in range(csr.node_count()):
+            source = component_of[node]
+            for edge in csr.edge_range(node):
+                target = component_of[csr.targets[edge]]
+                flags[edge] = source == target or (source, target) in kept
+        return flags
+
+    def cycles(self) -> list[list[str]]:
+        """Return the modules of every component with more than one member."""
+        nodes = self.csr.nodes
+        return [[nodes[i] for i in c] for c in self.components if len(c) > 1]
+
+    def level(self, path: str) -> int:
+        """Return the topological level of a module."""
+        return self.levels[self.component_of[self.csr.index[path]]]
+
+    def module_levels(self) -> dict[str, int]:
+        """Return the topological level of every module."""
+        levels = self.levels
+        component_of = self.component_of
+        return {path: levels[component_of[i]] for i, path in enumerate(self.csr.nodes)}
+
+    def depth(self) -> int:
+        """Return the longest dependency chain length (highest level)."""
+        return max(self.levels, default=0)
+
+    def load_order(self) -> list[str]:
+        """Return every module such that dependencies precede dependents.
+
+        Members of one cycle are adjacent; their relative order is arbitrary
+        since no valid order exists between them.
+        """
+        nodes = self.csr.nodes
+        return [nodes[i] for members in self.components for i in members]
+
+    def stages(self) -> list[list[str]]:
+        """Group modules by level; each stage only depends on earlier ones."""
+        stages: list[list[str]] = [[] for _ in range(self.depth() + 1)]
+        nodes = self.csr.nodes
+        for cid, members in enumerate(self.components):
+            stages[self.levels[cid]].extend(nodes[i] for i in members)
+        return stages if self.components else []
+
+    def to_dict(self) -> dict:
+        return {
+            "depth": self.depth(),
+            "levels": self.module_levels(),
+            "load_order": self.load_order(),
+        }
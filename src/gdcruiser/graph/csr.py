@@ -0,0 +1,164 @@
+"""Compressed sparse row (CSR) view of a dependency graph.
+
+Whole-graph algorithms (SCCs, cycle enumeration, ...) run on dense integer
+node ids and flat successor arrays instead of walking ``Module.dependencies``
+and hashing ``res://`` strings at every step.
+"""
+
+from collections.abc import Collection
+
+from .dependency import DependencyGraph
+from .node import Dependency, DependencyType
+
+
+class CSRGraph:
+    """Integer-indexed adjacency arrays for the in-graph edges of a graph.
+
+    Node ``i`` is ``nodes[i]``; its outgoing edges occupy the slice
+    ``offsets[i]:offsets[i + 1]`` of ``targets`` (successor ids),
+    ``edge_types`` and ``edge_deps`` (the originating :class:`Dependency`).
+    Edges whose target is not a module of the graph (unresolved classes,
+    missing files) are dropped. Node and edge order follow the graph's module
+    and dependency order, so algorithms stay deterministic.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        offsets: list[int],
+        targets: list[int],
+        edge_types: list[DependencyType],
+        edge_deps: list[Dependency],
+    ) -> None:
+        self.nodes = nodes
+        self.index = {path: i for i, path in enumerate(nodes)}
+        self.offsets = offsets
+        self.targets = targets
+        self.edge_types = edge_types
+        self.edge_deps = edge_deps
+
+    @classmethod
+    def from_graph(cls, graph: DependencyGraph) -> "CSRGraph":
+        """Build the CSR arrays in a single pass over all edges."""
+        modules = graph.all_modules()
+        index = {module.path: i for i, module in enumerate(modules)}
+        offsets = [0]
+        targets: list[int] = []
+        edge_types: list[DependencyType] = []
+        edge_deps: list[Dependency] = []
+        for module in modules:
+            for dep in module.dependencies:
+                target = index.get(dep.target)
+                if target is None:
+                    continue
+                targets.append(target)
+                edge_types.append(dep.dep_type)
+                edge_deps.append(dep)
+            offsets.append(len(targets))
+        return cls([m.path for m in modules], offsets, targets, edge_types, edge_deps)
+
+    def node_count(self) -> int:
+        """Return the number of nodes."""
+        return len(self.nodes)
+
+    def edge_count(self) -> int:
+        """Return the number of in-graph edges."""
+        return len(self.targets)
+
+    def edge_range(self, node: int) -> range:
+        """Return the edge ids leaving ``node``."""
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def successors(self, node: int) -> list[int]:
+        """Return the successor ids of ``node`` (may contain duplicates)."""
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def edge_filter(
+        self, dep_types: Collection[DependencyType] | None
+    ) -> list[bool] | None:
+        """Return a per-edge keep flag for ``dep_types`` (``None`` keeps all).
+
+        Algorithms take this filter alongside the shared arrays, so a typed
+        view of the graph costs one flag per edge instead of a copy of the
+        adjacency.
+        """
+        if dep_types is None:
+            return None
+        wanted = frozenset(dep_types)
+        return [t in wanted for t in self.edge_types]
+
+
+def strongly_connected_components(
+    csr: CSRGraph, keep: list[bool] | None = None
+) -> list[list[int]]:
+    """Return every SCC of ``csr`` (singletons included) via Tarjan's algorithm.
+
+    Iterative, so deep dependency chains cannot raise ``RecursionError``.
+    Components come out in reverse topological order: every component is
+    emitted after all components it depends on. ``keep`` (see
+    :meth:`CSRGraph.edge_filter`) restricts the search to flagged edges.
+    """
+    n = csr.node_count()
+    offsets = csr.offsets
+    targets = csr.targets
+    indices = [-1] * n
+    lowlinks = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    sccs: list[list[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if indices[root] != -1:
+            continue
+        # Each work-stack frame is [node, next-edge-id].
+        work: list[list[int]] = [[root, offsets[root]]]
+        indices[root] = lowlinks[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+
+        while work:
+            frame = work[-1]
+            node, edge = frame
+            end = offsets[node + 1]
+
+            recursed = False
+            while edge < end:
+                target = targets[edge]
+                edge += 1
+                if keep is not None and not keep[edge - 1]:
+                    continue
+                if indices[target] == -1:
+                    frame[1] = edge
+                    indices[target] = lowlinks[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append([target, offsets[target]])
+                    recursed = True
+                    break
+                elif on_stack[target] and indices[target] < lowlinks[node]:
+                    lowlinks[node] = indices[target]
+
+            if recursed:
+                continue
+
+            # All successors processed — close out this node.
+            if lowlinks[node] == indices[node]:
+                scc: list[int] = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    scc.append(w)
+                    if w == node:
+                        break
+                sccs.append(scc)
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlinks[node] < lowlinks[parent]:
+                    lowlinks[parent] = lowlinks[node]
+
+    return sccs
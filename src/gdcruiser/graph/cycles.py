@@ -1,95 +1,278 @@
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+
+from .csr import CSRGraph, strongly_connected_components
 from .dependency import DependencyGraph
+from .feedback import CycleBreak, feedback_arc_set
+from .node import DependencyType
+
+
+@dataclass
+class ElementaryCycle:
+    """A single elementary cycle, with the dependency types on each edge.
+
+    ``edge_types[i]`` lists the types of the edge ``modules[i] ->
+    modules[i + 1]``; the last entry labels the closing edge back to
+    ``modules[0]``.
+    """
+
+    modules: list[str]
+    edge_types: list[list[DependencyType]]
+
+    def to_dict(self) -> dict:
+        n = len(self.modules)
+        return {
+            "modules": self.modules,
+            "edges": [
+                {
+                    "from": self.modules[i],
+                    "to": self.modules[(i + 1) % n],
+                    "types": [t.value for t in self.edge_types[i]],
+                }
+                for i in range(n)
+            ],
+        }
 
 
 class CycleDetector:
-    """Detects cycles in dependency graph using Tarjan's algorithm."""
+    """Detects cycles in dependency graph using Tarjan's algorithm.
 
-    def __init__(self, graph: DependencyGraph) -> None:
+    With ``dep_types``, only edges of those types are followed — e.g. the
+    load-time ``preload``/``extends`` edges that actually break Godot when
+    they form a cycle. The filter is applied on the fly over the shared CSR
+    arrays, so a typed detector does not copy the graph.
+    """
+
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        dep_types: Collection[DependencyType] | None = None,
+        csr: CSRGraph | None = None,
+    ) -> None:
         self._graph = graph
-        self._index = 0
-        self._stack: list[str] = []
-        self._on_stack: set[str] = set()
-        self._indices: dict[str, int] = {}
-        self._lowlinks: dict[str, int] = {}
-        self._sccs: list[list[str]] = []
+        self._dep_types = frozenset(dep_types) if dep_types is not None else None
+        self._csr = csr
+        self._keep: list[bool] | None = None
+
+    def _compact(self) -> CSRGraph:
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self._graph)
+        if self._keep is None and self._dep_types is not None:
+            self._keep = self._csr.edge_filter(self._dep_types)
+        return self._csr
+
+    def find_components(self) -> list[list[str]]:
+        """Return every strongly connected component, singletons included."""
+        csr = self._compact()
+        return [
+            [csr.nodes[i] for i in scc]
+            for scc in strongly_connected_components(csr, self._keep)
+        ]
 
     def find_cycles(self) -> list[list[str]]:
         """Find all strongly connected components with more than one node (cycles)."""
-        self._index = 0
-        self._stack = []
-        self._on_stack = set()
-        self._indices = {}
-        self._lowlinks = {}
-        self._sccs = []
-
-        for module in self._graph.all_modules():
-            if module.path not in self._indices:
-                self._strongconnect(module.path)
-
-        return [scc for scc in self._sccs if len(scc) > 1]
-
-    def _successors(self, path: str) -> list[str]:
-        """Return in-graph dependency targets for a node (deduplicated)."""
-        seen: set[str] = set()
-        targets: list[str] = []
-        for dep in self._graph.get_dependencies(path):
-            target = dep.target
-            if target in seen or not self._graph.has_module(target):
+        return [scc for scc in self.find_components() if len(scc) > 1]
+
+    def cycle_breaks(self) -> list[list[CycleBreak]]:
+        """Suggest the dependencies to cut to break each cycle.
+
+        Returns one feedback arc set per cycle, in :meth:`find_cycles`
+        order, with the cheapest edges to remove first.
+        """
+        csr = self._compact()
+        return [
+            feedback_arc_set(csr, scc, self._keep)
+            for scc in strongly_connected_components(csr, self._keep)
+            if len(scc) > 1
+        ]
+
+    def elementary_cycles(
+        self, max_length: int | None = None, max_cycles: int | None = None
+    ) -> Iterator[ElementaryCycle]:
+        """Yield the elementary cycles inside each SCC (Johnson's algorithm).
+
+        Cycles are streamed one at a time. ``max_length`` skips cycles with
+        more than that many modules and ``max_cycles`` stops the enumeration
+        after that many results, so a pathological component cannot exhaust
+        memory or time. Self-loops are not reported, matching
+        :meth:`find_cycles`.
+        """
+        if max_cycles is not None and max_cycles <= 0:
+            return
+        csr = self._compact()
+        keep = self._keep
+        emitted = 0
+        for scc in strongly_connected_components(csr, keep):
+            if len(scc) < 2:
                 continue
-            seen.add(target)
-            targets.append(target)
-        return targets
+            # Deduplicated successor lists (with the types of each edge) for
+            # members of this component only.
+            members = set(scc)
+            succ: dict[int, dict[int, list[DependencyType]]] = {}
+            for node in scc:
+                out: dict[int, list[DependencyType]] = {}
+                for edge in csr.edge_range(node):
+                    if keep is not None and not keep[edge]:
+                        continue
+                    target = csr.targets[edge]
+                    if target == node or target not in members:
+                        continue
+                    types = out.setdefault(target, [])
+                    if csr.edge_types[edge] not in types:
+                        types.append(csr.edge_types[edge])
+                succ[node] = out
+
+            for cycle in _johnson(succ, scc, max_length):
+                yield ElementaryCycle(
+                    modules=[csr.nodes[i] for i in cycle],
+                    edge_types=[
+                        list(succ[a][b])
+                        for a, b in zip(cycle, cycle[1:] + cycle[:1], strict=True)
+                    ],
+                )
+                emitted += 1
+                if max_cycles is not None and emitted >= max_cycles:
+                    return
+
 
-    def _strongconnect(self, start: str) -> None:
-        """Iterative Tarjan's algorithm (explicit stack avoids RecursionError)."""
-        successors: dict[str, list[str]] = {}
-        # Each work-stack frame is [node, next-successor-index].
-        work: list[list] = [[start, 0]]
+def _johnson(
+    succ: dict[int, dict[int, list[DependencyType]]],
+    component: list[int],
+    max_length: int | None,
+) -> Iterator[list[int]]:
+    """Enumerate elementary cycles of one strongly connected component.
+
+    Every cycle is found from its smallest node: start nodes are taken in
+    order, and each is removed once its cycles are out. With ``max_length``
+    the search from a start node is a plain depth-bounded DFS (see
+    :func:`_bounded_cycles`); otherwise it is Johnson's blocking search.
+    Either way the component is never re-split into SCCs, so the work per
+    start node stays proportional to what its search actually visits.
+    """
+    pred: dict[int, list[int]] = {node: [] for node in component}
+    for node in component:
+        for w in succ[node]:
+            pred[w].append(node)
+    if max_length is not None:
+        yield from _bounded_cycles(succ, pred, component, max_length)
+        return
+
+    # Nodes left without an in- or out-edge among the active ones cannot be
+    # on a remaining cycle; removing a start node trims them, transitively.
+    active = set(component)
+    indegree = {node: len(pred[node]) for node in component}
+    outdegree = {node: len(succ[node]) for node in component}
+
+    def remove(node: int) -> None:
+        stack = [node]
+        active.discard(node)
+        while stack:
+            gone = stack.pop()
+            for w in succ[gone]:
+                indegree[w] -= 1
+                if w in active and not indegree[w]:
+                    active.discard(w)
+                    stack.append(w)
+            for u in pred[gone]:
+                outdegree[u] -= 1
+                if u in active and not outdegree[u]:
+                    active.discard(u)
+                    stack.append(u)
+
+    for start in sorted(component):
+        if start not in active:
+            continue
+        blocked = {start}
+        blocked_by: dict[int, set[int]] = {}
+        path = [start]
+        closed = [False]
+        work = [(start, iter([w for w in succ[start] if w in active]))]
 
         while work:
-            frame = work[-1]
-            node, next_i = frame
-
-            if next_i == 0:
-                self._indices[node] = self._index
-                self._lowlinks[node] = self._index
-                self._index += 1
-                self._stack.append(node)
-                self._on_stack.add(node)
-                successors[node] = self._successors(node)
-
-            recursed = False
-            node_successors = successors[node]
-            while next_i < len(node_successors):
-                target = node_successors[next_i]
-                next_i += 1
-                if target not in self._indices:
-                    frame[1] = next_i
-                    work.append([target, 0])
-                    recursed = True
-                    break
-                elif target in self._on_stack:
-                    self._lowlinks[node] = min(
-                        self._lowlinks[node], self._indices[target]
-                    )
-
-            if recursed:
+            node, neighbors = work[-1]
+            nxt = next(neighbors, None)
+            if nxt is not None:
+                if nxt == start:
+                    yield list(path)
+                    closed[-1] = True
+                elif nxt not in blocked:
+                    path.append(nxt)
+                    blocked.add(nxt)
+                    closed.append(False)
+                    work.append((nxt, iter([w for w in succ[nxt] if w in active])))
                 continue
 
-            # All successors processed — close out this node.
-            if self._lowlinks[node] == self._indices[node]:
-                scc: list[str] = []
-                while True:
-                    w = self._stack.pop()
-                    self._on_stack.remove(w)
-                    scc.append(w)
-                    if w == node:
-                        break
-                self._sccs.append(scc)
-
+            # All successors explored — unwind this node.
             work.pop()
-            if work:
-                parent = work[-1][0]
-                self._lowlinks[parent] = min(
-                    self._lowlinks[parent], self._lowlinks[node]
-                )
+            path.pop()
+            node_closed = closed.pop()
+            if node_closed:
+                unblock = [node]
+                while unblock:
+                    u = unblock.pop()
+                    if u in blocked:
+                        blocked.discard(u)
+                        unblock.extend(blocked_by.pop(u, ()))
+            else:
+                for w in succ[node]:
+                    if w in active:
+                        blocked_by.setdefault(w, set()).add(node)
+            if closed and node_closed:
+                closed[-1] = True
+
+        remove(start)
+
+
+def _bounded_cycles(
+    succ: dict[int, dict[int, list[DependencyType]]],
+    pred: dict[int, list[int]],
+    component: list[int],
+    max_length: int,
+) -> Iterator[list[int]]:
+    """Enumerate the cycles of at most ``max_length`` nodes of a component.
+
+    From each start node, a backward BFS of ``max_length - 1`` hops finds
+    how far every active node is from closing the cycle, and a DFS then
+    only extends the path to nodes that can still get back in time. The
+    cost per start node is bounded by its ``max_length`` neighborhood, not
+    by the size of the component.
+    """
+    active = set(component)
+    for start in sorted(component):
+        # Hops from each active node back to the start, up to the bound.
+        distance = {start: 0}
+        frontier = [start]
+        for hops in range(1, max_length):
+            reached = []
+            for v in frontier:
+                for u in pred[v]:
+                    if u in active and u not in distance:
+                        distance[u] = hops
+                        reached.append(u)
+            if not reached:
+                break
+            frontier = reached
+
+        path = [start]
+        on_path = {start}
+        work = [iter(succ[start])]
+        while work:
+            nxt = next(work[-1], None)
+            if nxt is None:
+                work.pop()
+                on_path.discard(path.pop())
+                continue
+            if nxt == start:
+                yield list(path)
+                continue
+            hops = distance.get(nxt)
+            if hops is None or nxt in on_path or len(path) + hops > max_length:
+                continue
+            if len(path) + 1 == max_length:
+                # The bound leaves one hop, so ``nxt`` leads straight back.
+                yield [*path, nxt]
+                continue
+            path.append(nxt)
+            on_path.add(nxt)
+            work.append(iter(succ[nxt]))
+        active.discard(start)
@@ -1,4 +1,7 @@
-from .node import Module, Dependency
+from collections.abc import Iterable
+from dataclasses import replace
+
+from .node import Module, Dependency, DependencyType
 
 
 class DependencyGraph:
@@ -10,11 +13,16 @@ class DependencyGraph:
         # lazily on first `get_dependents` call and invalidated whenever a
         # module is added. Avoids re-scanning every module on each lookup.
         self._dependents_index: dict[str, list[tuple[str, Dependency]]] | None = None
+        # Edges grouped by dependency type (type -> list of (source path,
+        # dep) in module order), built and invalidated like the index above.
+        self._type_index: dict[DependencyType, list[tuple[str, Dependency]]] | None
+        self._type_index = None
 
     def add_module(self, module: Module) -> None:
         """Add a module to the graph."""
         self._modules[module.path] = module
         self._dependents_index = None
+        self._type_index = None
 
     def get_module(self, path: str) -> Module | None:
         """Get a module by path."""
@@ -47,6 +55,65 @@ class DependencyGraph:
                 index.setdefault(dep.target, []).append((module.path, dep))
         return index
 
+    def get_edges_by_type(
+        self, dep_type: DependencyType
+    ) -> list[tuple[str, Dependency]]:
+        """Get every ``(source path, dependency)`` edge of the given type."""
+        if self._type_index is None:
+            index: dict[DependencyType, list[tuple[str, Dependency]]] = {}
+            for module in self._modules.values():
+                for dep in module.dependencies:
+                    index.setdefault(dep.dep_type, []).append((module.path, dep))
+            self._type_index = index
+        return self._type_index.get(dep_type, [])
+
+    def neighborhood(self, seeds: Iterable[str], depth: int | None) -> set[str]:
+        """Return ``seeds`` plus every module within ``depth`` hops of them.
+
+        Hops follow dependencies and dependents (through the reverse index),
+        so the cost grows with the size of the neighborhood, not the graph.
+        ``None`` means no depth limit.
+        """
+        selected = {path for path in seeds if path in self._modules}
+        frontier = list(selected)
+        hops = 0
+        while frontier and (depth is None or hops < depth):
+            hops += 1
+            next_frontier: list[str] = []
+            for path in frontier:
+                neighbors = [dep.target for dep in self.get_dependencies(path)]
+                neighbors.extend(source for source, _ in self.get_dependents(path))
+                for neighbor in neighbors:
+                    if neighbor not in selected and neighbor in self._modules:
+                        selected.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return selected
+
+    def subgraph(self, paths: Iterable[str]) -> "DependencyGraph":
+        """Return the graph induced by ``paths``, in this graph's module order.
+
+        Dependencies between selected modules are kept, as are those pointing
+        outside the project (unresolved classes, missing files); dependencies
+        on modules that were not selected are dropped.
+        """
+        wanted = set(paths)
+        sub = DependencyGraph()
+        for path, module in self._modules.items():
+            if path not in wanted:
+                continue
+            sub.add_module(
+                replace(
+                    module,
+                    dependencies=[
+                        dep
+                        for dep in module.dependencies
+                        if dep.target in wanted or dep.target not in self._modules
+                    ],
+                )
+            )
+        return sub
+
     def module_count(self) -> int:
         """Return the number of modules in the graph."""
         return len(self._modules)
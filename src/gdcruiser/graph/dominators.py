@@ -0,0 +1,179 @@
+"""Dominator tree of the modules reachable from the project's entry points."""
+
+from collections.abc import Iterable
+
+from .csr import CSRGraph
+
+
+class DominatorTree:
+    """Dominators of every module reachable from a set of entry points.
+
+    A virtual root is connected to each entry point (typically the main
+    scene and the autoload singletons). Module ``a`` dominates module ``b``
+    when every dependency chain from an entry point to ``b`` passes through
+    ``a`` — so ``b`` can only ever be loaded after ``a``, and deferring ``a``
+    (lazy loading) defers everything it dominates.
+
+    The tree is built with the Cooper–Harvey–Kennedy iterative algorithm over
+    the CSR arrays: one DFS for the reverse postorder, then a few passes of
+    ``idom`` refinement, which converge quickly on dependency graphs.
+    Modules not reachable from any entry point have no dominator.
+    """
+
+    def __init__(self, csr: CSRGraph, roots: Iterable[str]) -> None:
+        self._csr = csr
+        n = csr.node_count()
+        self._root = n
+        self.roots = list(dict.fromkeys(p for p in roots if p in csr.index))
+        root_targets = [csr.index[p] for p in self.roots]
+
+        def successors(node: int) -> list[int]:
+            return root_targets if node == n else csr.successors(node)
+
+        # Iterative DFS from the virtual root for the postorder numbering.
+        postorder: list[int] = []
+        visited = [False] * (n + 1)
+        visited[n] = True
+        work = [(n, iter(successors(n)))]
+        while work:
+            node, it = work[-1]
+            for target in it:
+                if not visited[target]:
+                    visited[target] = True
+                    work.append((target, iter(successors(target))))
+                    break
+            else:
+                work.pop()
+                postorder.append(node)
+        order = [-1] * (n + 1)
+        for number, node in enumerate(postorder):
+            order[node] = number
+
+        # Predecessors restricted to reachable nodes.
+        preds: list[list[int]] = [[] for _ in range(n + 1)]
+        for node in postorder:
+            for target in successors(node):
+                preds[target].append(node)
+
+        idom = [-1] * (n + 1)
+        idom[n] = n
+        rpo = postorder[-2::-1]  # reverse postorder without the root
+        changed = True
+        while changed:
+            changed = False
+            for node in rpo:
+                new_idom = -1
+                for pred in preds[node]:
+                    if idom[pred] == -1:
+                        continue
+                    if new_idom == -1:
+                        new_idom = pred
+                        continue
+                    # Walk both fingers up the current tree until they meet.
+                    a, b = pred, new_idom
+                    while a != b:
+                        while order[a] < order[b]:
+                            a = idom[a]
+                        while order[b] < order[a]:
+                            b = idom[b]
+                    new_idom = a
+                if idom[node] != new_idom:
+                    idom[node] = new_idom
+                    changed = True
+        self._idom = idom
+
+        # Subtree sizes: a node's idom always comes later in postorder.
+        size = [1 if visited[node] else 0 for node in range(n + 1)]
+        for node in postorder[:-1]:
+            size[idom[node]] += size[node]
+        self._size = size
+
+        # Pre/post intervals over the tree for O(1) dominance queries.
+        children: list[list[int]] = [[] for _ in range(n + 1)]
+        for node in rpo:
+            children[idom[node]].append(node)
+        self._enter = [-1] * (n + 1)
+        self._exit = [-1] * (n + 1)
+        clock = 0
+        stack = [(n, False)]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                self._exit[node] = clock
+                continue
+            self._enter[node] = clock
+            clock += 1
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children[node]))
+
+    def _node(self, path: str) -> int | None:
+        node = self._csr.index.get(path)
+        if node is None or self._idom[node] == -1:
+            return None
+        return node
+
+    def is_reachable(self, path: str) -> bool:
+        """Check whether ``path`` is reachable from an entry point."""
+        return self._node(path) is not None
+
+    def immediate_dominator(self, path: str) -> str | None:
+        """Return the closest strict dominator of ``path``.
+
+        None for entry points that no other module dominates, and for
+        unreachable modules.
+        """
+        node = self._node(path)
+        if node is None or self._idom[node] == self._root:
+            return None
+        return self._csr.nodes[self._idom[node]]
+
+    def dominates(self, dominator: str, path: str) -> bool:
+        """Check whether every chain from an entry point to ``path`` passes
+        through ``dominator`` (a module dominates itself)."""
+        a = self._node(dominator)
+        b = self._node(path)
+        if a is None or b is None:
+            return False
+        return self._enter[a] <= self._enter[b] and self._exit[b] <= self._exit[a]
+
+    def dominated_count(self, path: str) -> int:
+        """Return how many other modules ``path`` dominates."""
+        node = self._node(path)
+        return self._size[node] - 1 if node is not None else 0
+
+    def unreachable(self) -> list[str]:
+        """Return the modules no entry point reaches."""
+        idom = self._idom
+        return [p for i, p in enumerate(self._csr.nodes) if idom[i] == -1]
+
+    def chokepoints(self, limit: int | None = None) -> list[tuple[str, int]]:
+        """Return ``(module, dominated count)`` pairs, largest subtree first.
+
+        Only modules dominating at least one other module are listed.
+        """
+        size = self._size
+        ranked = sorted(
+            (
+                (path, size[i] - 1)
+                for i, path in enumerate(self._csr.nodes)
+                if size[i] > 1
+            ),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return ranked[:limit] if limit is not None else ranked
+
+    def to_dict(self) -> dict:
+        nodes = self._csr.nodes
+        return {
+            "roots": self.roots,
+            "idom": {
+                path: self.immediate_dominator(path)
+                for i, path in enumerate(nodes)
+                if self._idom[i] != -1
+            },
+            "chokepoints": [
+                {"module": path, "dominated": count}
+                for path, count in self.chokepoints()
+            ],
+            "unreachable": self.unreachable(),
+        }
@@ -0,0 +1,153 @@
+"""Inheritance forest built from ``extends`` dependencies."""
+
+from .dependency import DependencyGraph
+from .node import DependencyType
+
+EXTENDS_TYPES = frozenset({DependencyType.EXTENDS_PATH, DependencyType.EXTENDS_CLASS})
+
+
+class InheritanceForest:
+    """The class hierarchy of the project's scripts.
+
+    Each module's parent is the in-project script it ``extends``; modules
+    extending a built-in (or an unresolved class) are roots. Only modules
+    that extend, or are extended by, another module are part of the forest.
+
+    Depths are computed once, and a preorder (Euler tour) numbering gives
+    every class an interval holding exactly its subclasses, so "is A a
+    subclass of B" is two integer comparisons and listing the subclasses of
+    B is a slice.
+
+    An ``extends`` cycle cannot load in Godot; the edge closing it is
+    ignored here and its source is listed in ``cyclic``.
+    """
+
+    def __init__(self, graph: DependencyGraph) -> None:
+        parent: dict[str, str] = {}
+        for module in graph.all_modules():
+            for dep in module.dependencies:
+                if dep.dep_type in EXTENDS_TYPES and graph.has_module(dep.target):
+                    parent[module.path] = dep.target
+                    break
+
+        # Break extends cycles so that every parent chain ends at a root.
+        self.cyclic: list[str] = []
+        state: dict[str, int] = {}  # 1 = on the current chain, 2 = done
+        for start in list(parent):
+            chain: list[str] = []
+            node: str | None = start
+            while node is not None and node not in state:
+                state[node] = 1
+                chain.append(node)
+                node = parent.get(node)
+            if node is not None and state[node] == 1:
+                # Cycle through ``node``: drop the edge that closes it.
+                self.cyclic.append(chain[-1])
+                del parent[chain[-1]]
+            for visited in chain:
+                state[visited] = 2
+        self._parent = parent
+
+        self._children: dict[str, list[str]] = {}
+        for child, base in parent.items():
+            self._children.setdefault(base, []).append(child)
+        members = set(parent) | set(self._children)
+        self.roots = sorted(m for m in members if m not in parent)
+        self._class_names = {
+            m.path: m.class_name for m in graph.all_modules() if m.path in members
+        }
+
+        # Preorder walk: depth, position and last-descendant position.
+        self._order: list[str] = []
+        self._position: dict[str, int] = {}
+        self._last: dict[str, int] = {}
+        self._depth: dict[str, int] = {}
+        for root in self.roots:
+            stack: list[tuple[str, int, bool]] = [(root, 0, False)]
+            while stack:
+                node, depth, done = stack.pop()
+                if done:
+                    self._last[node] = len(self._order) - 1
+                    continue
+                self._position[node] = len(self._order)
+                self._order.append(node)
+                self._depth[node] = depth
+                stack.append((node, depth, True))
+                for child in sorted(self._children.get(node, ()), reverse=True):
+                    stack.append((child, depth + 1, False))
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._position
+
+    def class_count(self) -> int:
+        """Return the number of modules in the forest."""
+        return len(self._order)
+
+    def parent(self, path: str) -> str | None:
+        """Return the in-project script ``path`` extends, if any."""
+        return self._parent.get(path)
+
+    def children(self, path: str) -> list[str]:
+        """Return the scripts that directly extend ``path``."""
+        return sorted(self._children.get(path, ()))
+
+    def depth(self, path: str) -> int:
+        """Return the number of in-project ancestors of ``path`` (0 for roots)."""
+        return self._depth.get(path, 0)
+
+    def max_depth(self) -> int:
+        """Return the deepest inheritance chain in the project."""
+        return max(self._depth.values(), default=0)
+
+    def superclasses(self, path: str) -> list[str]:
+        """Return the ancestors of ``path``, nearest first."""
+        chain: list[str] = []
+        node = self._parent.get(path)
+        while node is not None:
+            chain.append(node)
+            node = self._parent.get(node)
+        return chain
+
+    def is_subclass(self, path: str, base: str) -> bool:
+        """Check whether ``path`` (transitively) extends ``base``."""
+        position = self._position.get(path)
+        start = self._position.get(base)
+        if position is None or start is None:
+            return False
+        return start < position <= self._last[base]
+
+    def subclasses(self, path: str) -> list[str]:
+        """Return every direct and indirect subclass of ``path`` in preorder."""
+        start = self._position.get(path)
+        if start is None:
+            return []
+        return self._order[start + 1 : self._last[path] + 1]
+
+    def subclass_count(self, path: str) -> int:
+        """Return how many scripts (transitively) extend ``path``."""
+        start = self._position.get(path)
+        return self._last[path] - start if start is not None else 0
+
+    def preorder(self) -> list[tuple[str, int]]:
+        """Return ``(module, depth)`` for every class, each tree in preorder."""
+        return [(path, self._depth[path]) for path in self._order]
+
+    def label(self, path: str) -> str:
+        """Return ``path`` with its ``class_name``, if it has one."""
+        class_name = self._class_names.get(path)
+        return f"{path} ({class_name})" if class_name else path
+
+    def to_dict(self) -> dict:
+        return {
+            "max_depth": self.max_depth(),
+            "roots": self.roots,
+            "classes": {
+                path: {
+                    "extends": self.parent(path),
+                    "depth": depth,
+                    "subclasses": self.subclass_count(path),
+                }
+                for path, depth in self.preorder()
+            },
+            "cyclic": self.cyclic,
+        }
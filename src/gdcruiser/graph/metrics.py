@@ -0,0 +1,175 @@
+"""Coupling and centrality metrics over a dependency graph."""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from .csr import CSRGraph
+
+
+@dataclass
+class ModuleMetrics:
+    """Coupling metrics for one module (or one aggregated node)."""
+
+    afferent: int = 0  # Ca: distinct modules depending on this one
+    efferent: int = 0  # Ce: distinct modules this one depends on
+    autoload_coupling: int = 0  # distinct autoload singletons depended on
+    pagerank: float = 0.0
+
+    @property
+    def instability(self) -> float:
+        """Ce / (Ca + Ce): 0 is maximally stable, 1 maximally unstable."""
+        total = self.afferent + self.efferent
+        return self.efferent / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "afferent": self.afferent,
+            "efferent": self.efferent,
+            "instability": round(self.instability, 4),
+            "autoload_coupling": self.autoload_coupling,
+            "pagerank": round(self.pagerank, 6),
+        }
+
+
+@dataclass
+class DirectoryMetrics(ModuleMetrics):
+    """Coupling metrics for a directory, counted across its boundary.
+
+    Ca counts modules outside the directory that depend on a module inside
+    it, Ce counts modules outside that something inside depends on, and
+    PageRank is the sum over its modules.
+    """
+
+    modules: int = 0
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data["modules"] = self.modules
+        return data
+
+
+def directory_of(path: str) -> str:
+    """Return the directory part of a ``res://`` path (``res://`` for the root)."""
+    head, sep, _ = path.rpartition("/")
+    if not sep or head.endswith(":/"):
+        return head + sep
+    return head
+
+
+class GraphMetrics:
+    """Per-module and per-directory coupling metrics plus PageRank.
+
+    Everything is computed in a bounded number of passes over the CSR edges:
+    one pass for coupling counts (edges deduplicated per module pair), and at
+    most ``max_iterations`` power-iteration passes for PageRank.
+    """
+
+    def __init__(
+        self,
+        csr: CSRGraph,
+        autoloads: Collection[str] = (),
+        damping: float = 0.85,
+        max_iterations: int = 100,
+        tolerance: float = 1e-6,
+        directories: bool = True,
+    ) -> None:
+        self._csr = csr
+        n = csr.node_count()
+        autoload_nodes = {csr.index[p] for p in autoloads if p in csr.index}
+
+        # Deduplicated successor / predecessor lists (self-edges dropped).
+        succ: list[list[int]] = [[] for _ in range(n)]
+        pred: list[list[int]] = [[] for _ in range(n)]
+        last_seen = [-1] * n
+        for node in range(n):
+            for target in csr.successors(node):
+                if target == node or last_seen[target] == node:
+                    continue
+                last_seen[target] = node
+                succ[node].append(target)
+                pred[target].append(node)
+
+        ranks = _pagerank(succ, pred, damping, max_iterations, tolerance)
+        self.modules: dict[str, ModuleMetrics] = {}
+        for node, path in enumerate(csr.nodes):
+            self.modules[path] = ModuleMetrics(
+                afferent=len(pred[node]),
+                efferent=len(succ[node]),
+                autoload_coupling=sum(1 for t in succ[node] if t in autoload_nodes),
+                pagerank=ranks[node],
+            )
+
+        self.directories: dict[str, DirectoryMetrics] = {}
+        if directories:
+            self.directories = self._aggregate(succ, ranks, autoload_nodes)
+
+    def _aggregate(
+        self,
+        succ: list[list[int]],
+        ranks: list[float],
+        autoload_nodes: set[int],
+    ) -> dict[str, DirectoryMetrics]:
+        nodes = self._csr.nodes
+        dirs = [directory_of(path) for path in nodes]
+        afferent: dict[str, set[int]] = {}
+        efferent: dict[str, set[int]] = {}
+        metrics: dict[str, DirectoryMetrics] = {}
+        for node, directory in enumerate(dirs):
+            entry = metrics.get(directory)
+            if entry is None:
+                entry = metrics[directory] = DirectoryMetrics()
+            entry.modules += 1
+            entry.pagerank += ranks[node]
+            for target in succ[node]:
+                if dirs[target] != directory:
+                    efferent.setdefault(directory, set()).add(target)
+                    afferent.setdefault(dirs[target], set()).add(node)
+        for directory, entry in metrics.items():
+            outgoing = efferent.get(directory, set())
+            entry.afferent = len(afferent.get(directory, ()))
+            entry.efferent = len(outgoing)
+            entry.autoload_coupling = len(outgoing & autoload_nodes)
+        return metrics
+
+    def to_dict(self) -> dict:
+        return {
+            "modules": {path: m.to_dict() for path, m in self.modules.items()},
+            "directories": {
+                path: m.to_dict() for path, m in sorted(self.directories.items())
+            },
+        }
+
+
+def _pagerank(
+    succ: list[list[int]],
+    pred: list[list[int]],
+    damping: float,
+    max_iterations: int,
+    tolerance: float,
+) -> list[float]:
+    """Power-iteration PageRank; rank flows from a module to its dependencies.
+
+    Modules without dependencies spread their rank uniformly. Iteration stops
+    once the L1 change drops below ``tolerance`` or after ``max_iterations``.
+    """
+    n = len(succ)
+    if n == 0:
+        return []
+    out_degree = [len(targets) for targets in succ]
+    dangling = [node for node in range(n) if not out_degree[node]]
+    ranks = [1.0 / n] * n
+    for _ in range(max_iterations):
+        share = [
+            ranks[node] / out_degree[node] if out_degree[node] else 0.0
+            for node in range(n)
+        ]
+        leaked = sum(ranks[node] for node in dangling)
+        base = (1.0 - damping) / n + damping * leaked / n
+        new_ranks = [
+            base + damping * sum(map(share.__getitem__, sources)) for sources in pred
+        ]
+        delta = sum(abs(a - b) for a, b in zip(new_ranks, ranks, strict=True))
+        ranks = new_ranks
+        if delta < tolerance:
+            break
+    return ranks
@@ -16,18 +16,35 @@ class DependencyType(Enum):
 
 @dataclass
 class Dependency:
-    """Represents a dependency from one module to another."""
+    """Represents a dependency from one module to another.
+
+    One dependency stands for every reference of the same type to the same
+    target within a module: ``lines`` lists where each occurrence is and
+    ``line`` is the first of them.
+    """
 
     target: str
     dep_type: DependencyType
     line: int | None = None
     resolved: bool = True
+    lines: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.lines and self.line is not None:
+            self.lines = [self.line]
+
+    @property
+    def count(self) -> int:
+        """Return how many references this dependency aggregates."""
+        return len(self.lines) or 1
 
     def to_dict(self) -> dict:
         return {
             "target": self.target,
             "type": self.dep_type.value,
             "line": self.line,
+            "lines": self.lines,
+            "count": self.count,
             "resolved": self.resolved,
         }
 
@@ -38,9 +55,31 @@ class Dependency:
             dep_type=DependencyType(data["type"]),
             line=data.get("line"),
             resolved=data.get("resolved", True),
+            lines=list(data.get("lines", [])),
         )
 
 
+def aggregate_dependencies(dependencies: list[Dependency]) -> list[Dependency]:
+    """Merge dependencies sharing a (target, type) into one edge each.
+
+    The first occurrence is kept (and absorbs the others' line numbers), so
+    edge order stays stable.
+    """
+    merged: dict[tuple[str, DependencyType], Dependency] = {}
+    for dep in dependencies:
+        key = (dep.target, dep.dep_type)
+        first = merged.get(key)
+        if first is None:
+            merged[key] = dep
+        else:
+            first.lines.extend(dep.lines)
+    for dep in merged.values():
+        dep.lines = sorted(set(dep.lines))
+        if dep.lines:
+            dep.line = dep.lines[0]
+    return list(merged.values())
+
+
 @dataclass
 class Module:
     """Represents a GDScript or scene file."""
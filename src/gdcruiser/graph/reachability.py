@@ -0,0 +1,172 @@
+"""Transitive reachability over the condensation DAG, stored as bitsets."""
+
+from collections.abc import Iterable
+
+from .condensation import Condensation
+
+
+class ReachabilityIndex:
+    """Transitive dependencies and dependents of every module.
+
+    Sets are Python big ints used as bitsets: bit ``i`` stands for module
+    ``csr.nodes[i]``. They are computed per condensation component with one
+    dynamic-programming pass in load order (descendants) and one in reverse
+    load order (ancestors), so building costs one bitset OR per DAG edge and
+    every query afterwards is a single bit test or mask intersection.
+
+    "Reaches" means "depends on through a path of at least one edge": a
+    module reaches itself only when it sits on a cycle.
+    """
+
+    def __init__(
+        self,
+        condensation: Condensation,
+        descendants: list[int] | None = None,
+        ancestors: list[int] | None = None,
+    ) -> None:
+        self._condensation = condensation
+        self._index = condensation.csr.index
+        self._nodes = condensation.csr.nodes
+        if descendants is None or ancestors is None:
+            descendants, ancestors = self._build(condensation)
+        self._descendants = descendants
+        self._ancestors = ancestors
+
+    @staticmethod
+    def _build(condensation: Condensation) -> tuple[list[int], list[int]]:
+        components = condensation.components
+        count = len(components)
+        members = [0] * count
+        for cid, nodes in enumerate(components):
+            bits = 0
+            for node in nodes:
+                bits |= 1 << node
+            members[cid] = bits
+
+        # A cyclic component reaches (and is reached by) all of its members.
+        cyclic = [len(nodes) > 1 for nodes in components]
+        descendants = [0] * count
+        for cid in range(count):
+            bits = members[cid] if cyclic[cid] else 0
+            for succ in condensation.dag_successors(cid):
+                bits |= members[succ] | descendants[succ]
+            descendants[cid] = bits
+
+        ancestors = [members[cid] if cyclic[cid] else 0 for cid in range(count)]
+        for cid in range(count - 1, -1, -1):
+            reach = members[cid] | ancestors[cid]
+            for succ in condensation.dag_successors(cid):
+                ancestors[succ] |= reach
+        return descendants, ancestors
+
+    def _component(self, path: str) -> int:
+        return self._condensation.component_of[self._index[path]]
+
+    def _expand(self, bits: int) -> list[str]:
+        nodes = self._nodes
+        # Reversed binary digits: character ``i`` is bit ``i``.
+        digits = bin(bits)[:1:-1]
+        return [nodes[i] for i, digit in enumerate(digits) if digit == "1"]
+
+    def mask(self, paths: Iterable[str]) -> int:
+        """Return the bitset of the given module paths (unknown paths ignored)."""
+        bits = 0
+        index = self._index
+        for path in paths:
+            node = index.get(path)
+            if node is not None:
+                bits |= 1 << node
+        return bits
+
+    def descendant_mask(self, path: str) -> int:
+        """Return the bitset of modules ``path`` transitively depends on."""
+        return self._descendants[self._component(path)]
+
+    def ancestor_mask(self, path: str) -> int:
+        """Return the bitset of modules that transitively depend on ``path``."""
+        return self._ancestors[self._component(path)]
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Check whether ``source`` transitively depends on ``target``."""
+        node = self._index.get(target)
+        if node is None or source not in self._index:
+            return False
+        return bool(self.descendant_mask(source) >> node & 1)
+
+    def reaches_any(self, sources: Iterable[str], targets: Iterable[str]) -> bool:
+        """Check whether any of ``sources`` transitively reaches any ``targets``."""
+        wanted = self.mask(targets)
+        if not wanted:
+            return False
+        return any(
+            self.descendant_mask(path) & wanted
+            for path in sources
+            if path in self._index
+        )
+
+    def descendant_count(self, path: str) -> int:
+        """Return how many other modules ``path`` transitively depends on."""
+        node = self._index[path]
+        return (self.descendant_mask(path) & ~(1 << node)).bit_count()
+
+    def ancestor_count(self, path: str) -> int:
+        """Return how many other modules transitively depend on ``path``."""
+        node = self._index[path]
+        return (self.ancestor_mask(path) & ~(1 << node)).bit_count()
+
+    def impact(self) -> dict[str, dict[str, int]]:
+        """Return transitive dependent/dependency counts for every module."""
+        return {
+            path: {
+                "dependents": self.ancestor_count(path),
+                "dependencies": self.descendant_count(path),
+            }
+            for path in self._nodes
+        }
+
+    def descendants(self, path: str) -> list[str]:
+        """Return every module ``path`` transitively depends on."""
+        return self._expand(self.descendant_mask(path))
+
+    def ancestors(self, path: str) -> list[str]:
+        """Return every module that transitively depends on ``path``."""
+        return self._expand(self.ancestor_mask(path))
+
+    def shortest_paths(self, source: str, targets: int) -> dict[str, list[str]]:
+        """Return a shortest dependency chain from ``source`` to each target.
+
+        ``targets`` is a bitset of modules (see :meth:`mask`); the chains are
+        found with one breadth-first search from ``source``, which stops as
+        soon as every reachable target has been seen. Each chain starts with
+        ``source`` and ends with the target; ``source`` itself is never a
+        target, even on a cycle.
+        """
+        csr = self._condensation.csr
+        start = self._index[source]
+        remaining = targets & self.descendant_mask(source) & ~(1 << start)
+        parent = {start: start}
+        frontier = [start]
+        found: list[int] = []
+        while frontier and remaining:
+            next_frontier: list[int] = []
+            for node in frontier:
+                for succ in csr.successors(node):
+                    if succ in parent:
+                        continue
+                    parent[succ] = node
+                    next_frontier.append(succ)
+                    if remaining >> succ & 1:
+                        found.append(succ)
+                        remaining ^= 1 << succ
+            frontier = next_frontier
+
+        paths: dict[str, list[str]] = {}
+        for end in found:
+            chain = [end]
+            node = end
+            while node != start:
+                node = parent[node]
+                chain.append(node)
+            chain.reverse()
+            paths[self._nodes[end]] = [self._nodes[n] for n in chain]
+        return paths
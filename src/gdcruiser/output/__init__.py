@@ -2,14 +2,17 @@ from .text import TextFormatter
 from .json import JsonFormatter
 from .dot import DotFormatter
 from .mermaid import MermaidFormatter
+from .dsm import DsmFormatter
 
 # Registry keyed by the CLI `--format` value. Every formatter exposes the same
 # ``format(result, rule_result=None)`` signature so the CLI can dispatch by name.
+# Those that can also stream add ``write(out, result, rule_result=None)``.
 FORMATTERS = {
     "text": TextFormatter,
     "json": JsonFormatter,
     "dot": DotFormatter,
     "mermaid": MermaidFormatter,
+    "dsm": DsmFormatter,
 }
 
 __all__ = [
@@ -17,5 +20,6 @@ __all__ = [
     "JsonFormatter",
     "DotFormatter",
     "MermaidFormatter",
+    "DsmFormatter",
     "FORMATTERS",
 ]
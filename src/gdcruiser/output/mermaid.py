@@ -6,12 +6,16 @@ from .labels import cycle_node_set, escape_mermaid_label, short_path, type_label
 class MermaidFormatter:
     """Formats analysis results as a Mermaid flowchart diagram."""
 
-    def __init__(self, show_type: bool = True) -> None:
+    def __init__(self, show_type: bool = True, reduce: bool = False) -> None:
         self._show_type = show_type
+        self._reduce = reduce
 
     def format(
         self, result: AnalysisResult, rule_result: RuleCheckResult | None = None
     ) -> str:
+        if self._reduce:
+            result = result.reduced()
+
         lines: list[str] = []
         lines.append("graph LR")
 
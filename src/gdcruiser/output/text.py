@@ -1,4 +1,5 @@
 from ..analyzer import AnalysisResult
+from ..graph.packages import PackageGraph
 from ..rules.models import RuleCheckResult
 from .violations import ViolationTextFormatter
 
@@ -6,8 +7,20 @@ from .violations import ViolationTextFormatter
 class TextFormatter:
     """Formats analysis results as human-readable text."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        top_impact: int | None = None,
+        chokepoints: int | None = None,
+        cycle_breaks: bool = False,
+        hierarchy: bool = False,
+        rule_stats: bool = False,
+    ) -> None:
         self._violation_formatter = ViolationTextFormatter()
+        self._top_impact = top_impact
+        self._chokepoints = chokepoints
+        self._cycle_breaks = cycle_breaks
+        self._hierarchy = hierarchy
+        self._rule_stats = rule_stats
 
     def format(
         self, result: AnalysisResult, rule_result: RuleCheckResult | None = None
@@ -38,6 +51,58 @@ class TextFormatter:
                 lines.append(f"  -> {cycle[0]} (back to start)")
             lines.append("")
 
+        # Edges to cut to break each cycle
+        if self._cycle_breaks and result.cycles:
+            lines.extend(self._format_cycle_breaks(result))
+            lines.append("")
+
+        # Soft cycles
+        if result.soft_cycles:
+            types = ", ".join(t.value for t in result.cycle_types or [])
+            lines.append("-" * 40)
+            lines.append(f"SOFT CYCLES ({len(result.soft_cycles)} found)")
+            lines.append(f"(need at least one edge outside: {types})")
+            lines.append("-" * 40)
+            for i, cycle in enumerate(result.soft_cycles, start=1):
+                lines.append(f"\nSoft cycle {i}:")
+                for path in cycle:
+                    lines.append(f"  -> {path}")
+                lines.append(f"  -> {cycle[0]} (back to start)")
+            lines.append("")
+
+        # Elementary cycles
+        if result.elementary_cycles:
+            lines.append("-" * 40)
+            lines.append(f"ELEMENTARY CYCLES ({len(result.elementary_cycles)} listed)")
+            lines.append("-" * 40)
+            for i, cycle in enumerate(result.elementary_cycles, start=1):
+                lines.append(f"\nElementary cycle {i}:")
+                for path, types in zip(cycle.modules, cycle.edge_types, strict=True):
+                    labels = ", ".join(t.value for t in types)
+                    lines.append(f"  {path} --[{labels}]-->")
+                lines.append(f"  {cycle.modules[0]} (back to start)")
+            lines.append("")
+
+        # Modules whose change invalidates the most of the project
+        if self._top_impact:
+            lines.extend(self._format_top_impact(result, self._top_impact))
+            lines.append("")
+
+        # Class hierarchy
+        if self._hierarchy:
+            lines.extend(self._format_hierarchy(result))
+            lines.append("")
+
+        # Package-level dependencies and cycles
+        if result.packages is not None:
+            lines.extend(self._format_packages(result.packages))
+            lines.append("")
+
+        # Modules every load path from the entry points goes through
+        if self._chokepoints:
+            lines.extend(self._format_chokepoints(result, self._chokepoints))
+            lines.append("")
+
         # Module details
         lines.append("-" * 40)
         lines.append("MODULE DEPENDENCIES")
@@ -51,9 +116,11 @@ class TextFormatter:
             if module.dependencies:
                 for dep in module.dependencies:
                     resolved = "" if dep.resolved else " [unresolved]"
-                    line_info = f":{dep.line}" if dep.line else ""
+                    line_info = ":" + ",".join(map(str, dep.lines)) if dep.lines else ""
+                    count = f" (x{dep.count})" if dep.count > 1 else ""
                     lines.append(
-                        f"  {dep.dep_type.value}: {dep.target}{line_info}{resolved}"
+                        f"  {dep.dep_type.value}: {dep.target}{line_info}{count}"
+                        f"{resolved}"
                     )
             else:
                 lines.append("  (no dependencies)")
@@ -63,6 +130,11 @@ class TextFormatter:
             lines.append("")
             lines.append(self._violation_formatter.format(rule_result))
 
+        # Per-rule evaluation cost
+        if self._rule_stats and rule_result and rule_result.stats:
+            lines.append("")
+            lines.append(self._violation_formatter.format_stats(rule_result))
+
         # Warnings
         if result.warnings:
             lines.append("")
@@ -83,3 +155,77 @@ class TextFormatter:
 
         lines.append("")
         return "\n".join(lines)
+
+    def _format_top_impact(self, result: AnalysisResult, limit: int) -> list[str]:
+        impact = result.reachability().impact()
+        ranked = sorted(
+            impact.items(), key=lambda item: (-item[1]["dependents"], item[0])
+        )[:limit]
+        lines = ["-" * 40, f"TOP IMPACT ({len(ranked)} modules)", "-" * 40]
+        lines.append("  dependents  dependencies  module")
+        for path, counts in ranked:
+            lines.append(
+                f"  {counts['dependents']:>10}  {counts['dependencies']:>12}  {path}"
+            )
+        return lines
+
+    def _format_cycle_breaks(self, result: AnalysisResult) -> list[str]:
+        lines = ["-" * 40, "SUGGESTED CYCLE BREAKS", "-" * 40]
+        for i, breaks in enumerate(result.cycle_breaks(), start=1):
+            total = sum(b.cost for b in breaks)
+            lines.append(f"\nCycle {i}: cut {len(breaks)} edges (cost {total})")
+            for b in breaks:
+                types = ", ".join(t.value for t in b.types)
+                at = f" (line {', '.join(map(str, b.lines))})" if b.lines else ""
+                lines.append(f"  [{b.cost}] {b.source} --[{types}]--> {b.target}{at}")
+        return lines
+
+    def _format_hierarchy(self, result: AnalysisResult) -> list[str]:
+        forest = result.hierarchy()
+        lines = [
+            "-" * 40,
+            f"CLASS HIERARCHY ({forest.class_count()} classes, "
+            f"max depth {forest.max_depth()})",
+            "-" * 40,
+        ]
+        for path, depth in forest.preorder():
+            lines.append(f"  {'  ' * depth}{forest.label(path)}")
+        for path in forest.cyclic:
+            lines.append(f"  [extends cycle] {path}")
+        return lines
+
+    def _format_packages(self, packages: PackageGraph) -> list[str]:
+        edges = packages.edges()
+        lines = [
+            "-" * 40,
+            f"PACKAGES ({packages.package_count()} packages, "
+            f"{len(edges)} dependencies)",
+            "-" * 40,
+        ]
+        metrics = packages.metrics()
+        lines.append("  modules  Ca  Ce  instability  package")
+        for i, package in enumerate(packages.csr.nodes):
+            m = metrics[package]
+            lines.append(
+                f"  {packages.module_counts[i]:>7}  {m.afferent:>2}  "
+                f"{m.efferent:>2}  {m.instability:>11.2f}  {package}"
+            )
+        cycles = packages.cycles()
+        if cycles:
+            lines.append(f"\nPackage cycles ({len(cycles)} found):")
+            for i, cycle in enumerate(cycles, start=1):
+                lines.append(f"  {i}. {' -> '.join(cycle)} -> {cycle[0]}")
+        return lines
+
+    def _format_chokepoints(self, result: AnalysisResult, limit: int) -> list[str]:
+        tree = result.dominators()
+        ranked = tree.chokepoints(limit)
+        lines = ["-" * 40, f"CHOKEPOINTS ({len(ranked)} modules)", "-" * 40]
+        if not tree.roots:
+            lines.append("  (no main scene or autoloads in project.godot)")
+            return lines
+        lines.append(f"  entry points: {', '.join(tree.roots)}")
+        lines.append("  dominated  module")
+        for path, count in ranked:
+            lines.append(f"  {count:>9}  {path}")
+        return lines
@@ -27,8 +27,14 @@ class ViolationTextFormatter:
             f"RULE VIOLATIONS ({result.error_count()} errors, "
             f"{result.warning_count()} warnings)"
         )
+        if result.stopped:
+            lines.append("(stopped at the first violation, --fail-fast)")
         lines.append("-" * 40)
 
+        suppressed: dict[str, int] = defaultdict(int)
+        for s in result.stats:
+            suppressed[s.rule] += s.suppressed
+
         # Group violations by rule
         by_rule: dict[str, list[Violation]] = defaultdict(list)
         for v in result.violations:
@@ -43,11 +49,31 @@ class ViolationTextFormatter:
                 lines.append(f"  {first.rule.comment}")
 
             for v in violations:
-                if v.to_module:
+                if v.rule_type == "thresholds":
+                    lines.append(f"    {v.message}")
+                elif v.path:
+                    lines.append(f"    {' -> '.join(v.path)}")
+                elif v.to_module:
                     lines.append(f"    {v.from_module} -> {v.to_module}")
                 else:
                     lines.append(f"    {v.from_module}")
+            if suppressed[rule_name]:
+                lines.append(f"    ... and {suppressed[rule_name]} more")
+
+        return "\n".join(lines)
 
+    def format_stats(self, result: RuleCheckResult) -> str:
+        """Format per-rule evaluation stats as a table, slowest rule first."""
+        lines: list[str] = []
+        lines.append("-" * 40)
+        lines.append(f"RULE STATS ({len(result.stats)} rules)")
+        lines.append("-" * 40)
+        lines.append(f"{'ms':>9} {'modules':>8} {'edges':>8} {'violations':>10}  rule")
+        for s in sorted(result.stats, key=lambda s: s.seconds, reverse=True):
+            lines.append(
+                f"{s.seconds * 1000:>9.2f} {s.modules:>8} {s.edges:>8} "
+                f"{s.violations:>10}  {s.rule} ({s.rule_type})"
+            )
         return "\n".join(lines)
 
 
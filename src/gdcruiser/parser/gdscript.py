@@ -1,7 +1,7 @@
 import re
 from pathlib import Path
 
-from ..graph.node import Module, Dependency, DependencyType
+from ..graph.node import Module, Dependency, DependencyType, aggregate_dependencies
 from ..symbols.table import SymbolTable
 from . import patterns
 from .paths import to_res_path
@@ -130,7 +130,9 @@ class GDScriptParser:
                 # else: drop unresolved or self-references
             else:
                 kept.append(dep)
-        module.dependencies = kept
+        # Distinct names (a class_name and an autoload, say) can resolve to
+        # the same script; keep one edge per (target, type).
+        module.dependencies = aggregate_dependencies(kept)
 
     def _extract_class_name(self, content: str) -> str | None:
         """Extract class_name declaration from content."""
@@ -141,9 +143,12 @@ class GDScriptParser:
         return None
 
     def _extract_dependencies(self, content: str) -> list[Dependency]:
-        """Extract all dependencies from content (already comment/string-stripped)."""
+        """Extract all dependencies from content (already comment/string-stripped).
+
+        Repeated references are aggregated into one dependency per
+        (target, type) carrying every line they occur on.
+        """
         dependencies: list[Dependency] = []
-        seen_class_refs: set[str] = set()
 
         for line_num, line in enumerate(content.splitlines(), start=1):
             # extends "res://..."
@@ -205,9 +210,6 @@ class GDScriptParser:
             for class_ref in self._find_class_refs(sanitized):
                 if self._is_builtin_class(class_ref):
                     continue
-                if class_ref in seen_class_refs:
-                    continue
-                seen_class_refs.add(class_ref)
                 dependencies.append(
                     Dependency(
                         target=class_ref,
@@ -217,7 +219,7 @@ class GDScriptParser:
                     )
                 )
 
-        return dependencies
+        return aggregate_dependencies(dependencies)
 
     @staticmethod
     def _sanitize_for_class_refs(line: str) -> str:
@@ -46,3 +46,10 @@ RESOURCE_SCRIPT_CLASS = re.compile(r'script_class="([A-Z][A-Za-z0-9_]*)"')
 # project.godot [autoload] entry: `Identifier="*res://path/to/script.gd"`.
 # The leading `*` marks an enabled singleton and is stripped from the captured path.
 AUTOLOAD_ENTRY = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"\*?(res://[^"]+)"\s*$')
+
+# project.godot [application] entry: `run/main_scene="res://main.tscn"`.
+# Godot 4.2+ may store a `uid://...` reference instead of a path.
+MAIN_SCENE_ENTRY = re.compile(r'^run/main_scene\s*=\s*"((?:res|uid)://[^"]+)"\s*$')
+
+# Scene header: [gd_scene ... uid="uid://..."]
+SCENE_UID = re.compile(r'^\[gd_scene\b[^\]]*\buid="(uid://[^"]+)"')
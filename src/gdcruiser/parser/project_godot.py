@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from pathlib import Path
 
 from . import patterns
@@ -37,3 +38,49 @@ def parse_autoloads(project_root: Path) -> dict[str, str]:
             autoloads[identifier] = path
 
     return autoloads
+
+
+def parse_main_scene(
+    project_root: Path, scene_files: Iterable[Path] = ()
+) -> str | None:
+    """Return the `res://` path of `run/main_scene` from `project.godot`.
+
+    Godot 4.2+ may store the main scene as a `uid://` reference; it is
+    resolved against the `uid="..."` header of ``scene_files``. Returns
+    None when there is no `project.godot`, no main scene, or the uid
+    matches no scene.
+    """
+    project_file = project_root / "project.godot"
+    if not project_file.exists():
+        return None
+
+    main_scene: str | None = None
+    in_section = False
+    for line in project_file.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+
+        if not stripped or stripped.startswith(";"):
+            continue
+
+        if stripped.startswith("[") and stripped.endswith("]"):
+            in_section = stripped == "[application]"
+            continue
+
+        if not in_section:
+            continue
+
+        match = patterns.MAIN_SCENE_ENTRY.match(stripped)
+        if match:
+            main_scene = match.group(1)
+
+    if main_scene is None or main_scene.startswith("res://"):
+        return main_scene
+
+    for scene_file in scene_files:
+        with scene_file.open(encoding="utf-8") as f:
+            header = f.readline()
+        match = patterns.SCENE_UID.match(header)
+        if match and match.group(1) == main_scene:
+            relative = scene_file.relative_to(project_root).as_posix()
+            return f"res://{relative}"
+    return None
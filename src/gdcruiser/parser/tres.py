@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from ..graph.node import Module, Dependency, DependencyType
+from ..graph.node import Module, Dependency, DependencyType, aggregate_dependencies
 from ..symbols.table import SymbolTable
 from . import patterns
 from .paths import to_res_path
@@ -40,14 +40,10 @@ class TresParser:
 
     def _extract_dependencies(self, content: str) -> list[Dependency]:
         dependencies: list[Dependency] = []
-        seen: set[str] = set()
 
         for line_num, line in enumerate(content.splitlines(), start=1):
             for match in patterns.RESOURCE_PATH.finditer(line):
                 target = match.group(1)
-                if target in seen:
-                    continue
-                seen.add(target)
                 dependencies.append(
                     Dependency(
                         target=target,
@@ -56,7 +52,7 @@ class TresParser:
                     )
                 )
 
-        return dependencies
+        return aggregate_dependencies(dependencies)
 
     @staticmethod
     def _classify(target: str) -> DependencyType:
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from ..graph.node import Module, Dependency, DependencyType
+from ..graph.node import Module, Dependency, DependencyType, aggregate_dependencies
 from . import patterns
 from .paths import to_res_path
 
@@ -20,21 +20,17 @@ class TscnParser:
     def _extract_dependencies(self, content: str) -> list[Dependency]:
         """Extract script dependencies from TSCN content."""
         dependencies: list[Dependency] = []
-        seen_scripts: set[str] = set()
 
         for line_num, line in enumerate(content.splitlines(), start=1):
             # Find external resource declarations for .gd files
             match = patterns.TSCN_EXT_RESOURCE.search(line)
             if match:
-                script_path = match.group(1)
-                if script_path not in seen_scripts:
-                    seen_scripts.add(script_path)
-                    dependencies.append(
-                        Dependency(
-                            target=script_path,
-                            dep_type=DependencyType.SCENE_SCRIPT,
-                            line=line_num,
-                        )
+                dependencies.append(
+                    Dependency(
+                        target=match.group(1),
+                        dep_type=DependencyType.SCENE_SCRIPT,
+                        line=line_num,
                     )
+                )
 
-        return dependencies
+        return aggregate_dependencies(dependencies)
@@ -1,12 +1,14 @@
 """Rules module for gdcruiser custom rules."""
 
 from .engine import RuleEngine
-from .matcher import PathMatcherCompiled
-from .models import RuleCheckResult, Violation
+from .matcher import PathMatcherCompiled, RuleMatrix
+from .models import RuleCheckResult, RuleStats, Violation
 
 __all__ = [
     "PathMatcherCompiled",
     "RuleCheckResult",
     "RuleEngine",
+    "RuleMatrix",
+    "RuleStats",
     "Violation",
 ]
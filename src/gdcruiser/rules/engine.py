@@ -1,207 +1,729 @@
 """Rule evaluation engine."""
 
-import re
+from collections.abc import Callable
+from time import perf_counter
 
-from ..config.models import Config, Rule, Severity
+from ..config.models import Config, PathMatcher, Rule, Severity
+from ..graph.condensation import Condensation
 from ..graph.dependency import DependencyGraph
-from .matcher import PathMatcherCompiled
-from .models import RuleCheckResult, Violation
+from ..graph.metrics import GraphMetrics
+from ..graph.node import Dependency, DependencyType
+from ..graph.reachability import ReachabilityIndex
+from .matcher import PathMatcherCompiled, RuleMatrix
+from .models import RuleCheckResult, RuleStats, Violation
 
 
-class RuleEngine:
-    """Evaluates rules against a dependency graph."""
+def _bits(mask: int):
+    """Yield the indexes of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
-    def __init__(self, config: Config, graph: DependencyGraph) -> None:
-        self._config = config
-        self._graph = graph
-        self._exclude_patterns = [re.compile(p) for p in config.options.exclude]
 
-    def check_all(self, cycles: list[list[str]] | None = None) -> RuleCheckResult:
-        """Check all rules and return violations."""
-        result = RuleCheckResult()
+# Position of each dependency type in per-type count lists.
+_TYPE_INDEX = {dep_type: i for i, dep_type in enumerate(DependencyType)}
 
-        for rule in self._config.forbidden:
-            self._check_forbidden(rule, result, cycles)
 
-        for rule in self._config.allowed:
-            self._check_allowed(rule, result)
+# Relative cost of each kind of check, cheapest first: the order in which
+# they run with fail_fast.
+_COST = {
+    "circular": 0,
+    "orphan": 1,
+    "edges": 2,
+    "thresholds": 3,
+    "layers": 4,
+    "reachable": 5,
+}
 
-        for rule in self._config.required:
-            self._check_required(rule, result)
 
-        return result
+class _FailFast(Exception):
+    """Raised to stop the evaluation at the first violation."""
 
-    def _is_excluded(self, path: str) -> bool:
-        """Check if a path is excluded from rule checking."""
-        return any(p.search(path) for p in self._exclude_patterns)
 
-    def _check_forbidden(
+class RuleEngine:
+    """Evaluates rules against a dependency graph.
+
+    All rules are compiled into one :class:`RuleMatrix`, and the forbidden,
+    allowed and required rules are then checked together in a single pass
+    over the graph's edges. Violations are collected per rule and reported
+    in rule order, as if each rule had been checked on its own.
+
+    Rules restricted to some dependency types only apply to edges of those
+    types; forbidden and allowed rules that are all typed are checked in a
+    second pass over the graph's per-type edge index instead, so a
+    ``preload``-only rule never looks at the other edges.
+
+    The ``layers`` section is checked last: every module is assigned a layer
+    once, and every edge then costs one integer comparison.
+
+    ``reachable`` forbidden rules need a :class:`ReachabilityIndex`, and
+    threshold rules a :class:`Condensation` and :class:`GraphMetrics`. Each
+    is obtained at most once, on first use, from the matching callable (e.g.
+    ``AnalysisResult.reachability``) or else built from the graph, so every
+    rule shares the same analyses.
+
+    Python's ``re`` cannot interrupt a match, so a pattern that backtracks
+    catastrophically cannot be stopped; instead the time each rule's
+    patterns spend matching is measured, and rules over the configured
+    ``regexBudget`` are listed in :attr:`RuleCheckResult.slow_rules`.
+
+    With ``fail_fast`` only error rules are checked, the cheapest kinds of
+    checks first, and evaluation stops at the first violation; paths are
+    then only classified as the checks reach them, and rule coverage is not
+    collected. With ``max_violations``, violations of a rule past that many
+    are counted in its :class:`RuleStats` instead of being created.
+    """
+
+    def __init__(
         self,
-        rule: Rule,
-        result: RuleCheckResult,
-        cycles: list[list[str]] | None,
+        config: Config,
+        graph: DependencyGraph,
+        reachability: Callable[[], ReachabilityIndex] | None = None,
+        condensation: Callable[[], Condensation] | None = None,
+        metrics: Callable[[], GraphMetrics] | None = None,
+        fail_fast: bool = False,
+        max_violations: int | None = None,
     ) -> None:
-        """Check a forbidden rule."""
-        if rule.severity == Severity.IGNORE:
-            return
+        self._config = config
+        self._graph = graph
+        self._reachability = reachability
+        self._condensation = condensation
+        self._metrics = metrics
+        self._reachability_cache: ReachabilityIndex | None = None
+        self._condensation_cache: Condensation | None = None
+        self._metrics_cache: GraphMetrics | None = None
+        self._fail_fast = fail_fast
+        self._max_violations = max_violations
+        # Only errors can fail a run, so fail_fast skips the other rules.
+        self._rules = [
+            (rule_type, rule)
+            for rule_type, rule in config.all_rules()
+            if rule.severity != Severity.IGNORE
+            and (not fail_fast or rule.severity == Severity.ERROR)
+        ]
+        self._matrix = RuleMatrix(
+            [rule for _, rule in self._rules], config.options.exclude
+        )
+        self._layer_time = 0.0
 
-        from_matcher = PathMatcherCompiled(rule.from_)
-        to_matcher = PathMatcherCompiled(rule.to)
+    def check_all(self, cycles: list[list[str]] | None = None) -> RuleCheckResult:
+        """Check all rules and return violations."""
+        found: list[list[Violation]] = [[] for _ in self._rules]
+        seconds = [0.0] * len(self._rules)
+        self._counts = [0] * (len(self._rules) + 1)  # Last: the layers check
+        self._suppressed = [0] * (len(self._rules) + 1)
+        forbidden = allowed = required = 0
+        # With fail_fast, paths are classified lazily by the checks that run.
+        if not self._fail_fast:
+            self._matrix.prepare(
+                path
+                for module in self._graph.all_modules()
+                for path in (module.path, *(dep.target for dep in module.dependencies))
+            )
 
-        # Handle circular dependency rules
-        if rule.circular and cycles:
-            self._check_circular_forbidden(rule, from_matcher, cycles, result)
-            return
+        # (cost rank, check): the checks run in the order listed, or cheapest
+        # first with fail_fast.
+        steps: list[tuple[int, Callable[[], None]]] = []
+
+        def per_rule(i: int, check: Callable, *args) -> Callable[[], None]:
+            def step() -> None:
+                start = perf_counter()
+                try:
+                    check(i, self._rules[i][1], *args, found[i])
+                finally:
+                    seconds[i] += perf_counter() - start
+
+            return step
+
+        for i, (rule_type, rule) in enumerate(self._rules):
+            if rule_type == "forbidden":
+                if rule.circular:
+                    check = self._check_circular_forbidden
+                    steps.append((_COST["circular"], per_rule(i, check, cycles or [])))
+                elif rule.orphan:
+                    check = self._check_orphan_forbidden
+                    steps.append((_COST["orphan"], per_rule(i, check)))
+                elif rule.reachable:
+                    check = self._check_reachable_forbidden
+                    steps.append((_COST["reachable"], per_rule(i, check)))
+                else:
+                    forbidden |= 1 << i
+            elif rule_type == "thresholds":
+                steps.append((_COST["thresholds"], per_rule(i, self._check_thresholds)))
+            elif rule_type == "allowed":
+                allowed |= 1 << i
+            # Required rules only make sense with specific 'to' patterns
+            elif not PathMatcherCompiled(rule.to).matches_any():
+                required |= 1 << i
+
+        # Rules restricted to some dependency types, and per type the edge
+        # rules that apply to it.
+        typed = 0
+        applies = dict.fromkeys(DependencyType, 0)
+        for i in _bits(forbidden | allowed | required):
+            types = self._rules[i][1].dependency_type_set()
+            if types is not None:
+                typed |= 1 << i
+            for dep_type in DependencyType if types is None else types:
+                applies[dep_type] |= 1 << i
+
+        if self._fail_fast:
+            modules = [0] * len(self._rules)
+            edges = [0] * len(self._rules)
+        else:
+            modules, edges = self._coverage(forbidden | allowed | required, applies)
+
+        # Typed required rules still need every dependency of a module.
+        untyped = ~typed | required
+        if (forbidden | allowed) & untyped or required:
+
+            def check_edges() -> None:
+                start = perf_counter()
+                try:
+                    self._check_edges(
+                        forbidden & untyped, allowed & untyped, required, applies, found
+                    )
+                finally:
+                    self._share(
+                        perf_counter() - start,
+                        (forbidden | allowed) & untyped | required,
+                        edges,
+                        seconds,
+                    )
 
-        # Handle orphan rules
-        if rule.orphan:
-            self._check_orphan_forbidden(rule, from_matcher, result)
-            return
+            steps.append((_COST["edges"], check_edges))
+        if (forbidden | allowed) & typed:
+
+            def check_typed_edges() -> None:
+                start = perf_counter()
+                try:
+                    self._check_typed_edges(
+                        forbidden & typed, allowed & typed, applies, found
+                    )
+                finally:
+                    self._share(
+                        perf_counter() - start,
+                        (forbidden | allowed) & typed,
+                        edges,
+                        seconds,
+                    )
 
-        # Regular dependency rules
+            steps.append((_COST["edges"], check_typed_edges))
+        layer_violations: list[Violation] = []
+        layer_stats = RuleStats(rule="layers", rule_type="layers")
+        if self._config.layers:
+
+            def check_layers() -> None:
+                start = perf_counter()
+                try:
+                    self._check_layers(layer_violations, layer_stats)
+                finally:
+                    layer_stats.seconds += perf_counter() - start
+
+            steps.append((_COST["layers"], check_layers))
+
+        if self._fail_fast:
+            steps.sort(key=lambda step: step[0])
+        stopped = False
+        try:
+            for _, step in steps:
+                step()
+        except _FailFast:
+            stopped = True
+
+        violations = [v for vs in found for v in vs] + layer_violations
+        stats = [
+            RuleStats(
+                rule=rule.name,
+                rule_type=rule_type,
+                severity=rule.severity,
+                seconds=seconds[i] + self._matrix.rule_time(i),
+                modules=modules[i],
+                edges=edges[i],
+                violations=self._counts[i],
+                suppressed=self._suppressed[i],
+            )
+            for i, (rule_type, rule) in enumerate(self._rules)
+        ]
+        if self._config.layers:
+            layer_stats.violations = self._counts[-1]
+            layer_stats.suppressed = self._suppressed[-1]
+            stats.append(layer_stats)
+        return RuleCheckResult(
+            violations=violations,
+            slow_rules=self._slow_rules(),
+            stats=stats,
+            stopped=stopped,
+        )
+
+    def _keep(self, i: int) -> bool:
+        """Count a violation of rule ``i`` and tell whether to create it.
+
+        ``i == len(rules)`` stands for the layers check. Past the per-rule
+        limit the violation is only counted.
+        """
+        self._counts[i] += 1
+        if self._max_violations is not None and self._counts[i] > self._max_violations:
+            self._suppressed[i] += 1
+            return False
+        return True
+
+    def _record(self, violations: list[Violation], violation: Violation) -> None:
+        """Add a violation; with fail_fast, this ends the evaluation."""
+        violations.append(violation)
+        if self._fail_fast:
+            raise _FailFast
+
+    def _coverage(
+        self, edge_rules: int, applies: dict[DependencyType, int]
+    ) -> tuple[list[int], list[int]]:
+        """Count the modules each rule's ``from`` matches and its edges tested.
+
+        Edges are only counted for the forbidden, allowed and required rules
+        in ``edge_rules``: those of the matching modules whose dependency
+        type the rule applies to. Modules are tallied per rule mask first,
+        so the cost does not grow with the number of rules.
+        """
+        by_mask: dict[int, list[int]] = {}
         for module in self._graph.all_modules():
-            if self._is_excluded(module.path):
+            masks = self._matrix.classify(module.path)
+            if masks is None or not masks[0]:
                 continue
-
-            if not from_matcher.matches(module.path):
+            counts = by_mask.setdefault(masks[0], [0] * (len(DependencyType) + 1))
+            counts[-1] += 1
+            if masks[0] & edge_rules:
+                for dep in module.dependencies:
+                    counts[_TYPE_INDEX[dep.dep_type]] += 1
+
+        modules = [0] * len(self._rules)
+        edges = [0] * len(self._rules)
+        for mask, counts in by_mask.items():
+            for i in _bits(mask):
+                modules[i] += counts[-1]
+            for dep_type, index in _TYPE_INDEX.items():
+                for i in _bits(mask & edge_rules & applies[dep_type]):
+                    edges[i] += counts[index]
+        return modules, edges
+
+    def _share(
+        self, spent: float, rules: int, edges: list[int], seconds: list[float]
+    ) -> None:
+        """Split the time of a pass shared by ``rules`` by their edges tested."""
+        indexes = list(_bits(rules))
+        total = sum(edges[i] for i in indexes)
+        for i in indexes:
+            seconds[i] += spent * (edges[i] / total if total else 1 / len(indexes))
+
+    def _slow_rules(self) -> dict[str, float]:
+        """Return the rules whose patterns went over the time budget."""
+        budget = self._config.options.regex_budget
+        spent: dict[str, float] = {}
+        for i, (_, rule) in enumerate(self._rules):
+            spent[rule.name] = max(spent.get(rule.name, 0.0), self._matrix.rule_time(i))
+        for pattern, seconds in self._matrix.exclude_time().items():
+            spent[f"options.exclude '{pattern}'"] = seconds
+        spent["layers"] = self._layer_time
+        return {name: seconds for name, seconds in spent.items() if seconds > budget}
+
+    def _from_matches(self, i: int, path: str) -> bool:
+        """Check whether rule ``i``'s ``from`` matches a non-excluded path."""
+        masks = self._matrix.classify(path)
+        return masks is not None and bool(masks[0] >> i & 1)
+
+    def _to_matches(self, i: int, path: str) -> bool:
+        """Check whether rule ``i``'s ``to`` matches a non-excluded path."""
+        masks = self._matrix.classify(path)
+        return masks is not None and bool(masks[1] >> i & 1)
+
+    def _targets(self, active: int, source: str, target: str, targets: int) -> int:
+        """Resolve the ``active`` back-reference rules in a ``targets`` mask.
+
+        Their bits are always set in the mask, since their ``to`` depends on
+        what ``from`` captured in ``source``; this checks them for real.
+        """
+        bound = active & self._matrix.back_references
+        if not bound:
+            return targets
+        return targets & ~bound | self._matrix.bound_targets(bound, source, target)
+
+    def _reachability_index(self) -> ReachabilityIndex:
+        if self._reachability_cache is None:
+            if self._reachability is not None:
+                self._reachability_cache = self._reachability()
+            else:
+                self._reachability_cache = ReachabilityIndex(self._condensation_dag())
+        return self._reachability_cache
+
+    def _condensation_dag(self) -> Condensation:
+        if self._condensation_cache is None:
+            if self._condensation is not None:
+                self._condensation_cache = self._condensation()
+            else:
+                self._condensation_cache = Condensation.from_graph(self._graph)
+        return self._condensation_cache
+
+    def _graph_metrics(self) -> GraphMetrics:
+        if self._metrics_cache is None:
+            if self._metrics is not None:
+                self._metrics_cache = self._metrics()
+            else:
+                self._metrics_cache = GraphMetrics(self._condensation_dag().csr)
+        return self._metrics_cache
+
+    def _check_edges(
+        self,
+        forbidden: int,
+        allowed: int,
+        required: int,
+        applies: dict[DependencyType, int],
+        found: list[list[Violation]],
+    ) -> None:
+        """Check the forbidden, allowed and required rules in one edge pass.
+
+        Each argument is a mask of rule indexes, and ``applies`` maps each
+        dependency type to the rules that apply to it. For a dependency, the
+        forbidden rules whose ``from`` matches the module and whose ``to``
+        matches the target are violated, as are the allowed rules whose
+        ``to`` does not match it. A required rule is violated by a module
+        none of whose dependencies match its ``to``.
+        """
+        for module in self._graph.all_modules():
+            masks = self._matrix.classify(module.path)
+            if masks is None:
+                continue
+            sources = masks[0]
+            module_forbidden = sources & forbidden
+            module_allowed = sources & allowed
+            module_required = sources & required
+            if not (module_forbidden or module_allowed or module_required):
                 continue
 
+            reached = 0
             for dep in module.dependencies:
-                if self._is_excluded(dep.target):
+                target_masks = self._matrix.classify(dep.target)
+                if target_masks is None:
                     continue
-
-                if to_matcher.matches(dep.target):
-                    result.violations.append(
+                targets = self._targets(
+                    sources, module.path, dep.target, target_masks[1]
+                )
+                reached |= targets & applies[dep.dep_type]
+                violated = (module_forbidden & targets) | (module_allowed & ~targets)
+                self._report(violated & applies[dep.dep_type], module.path, dep, found)
+
+            for i in _bits(module_required & ~reached):
+                rule = self._rules[i][1]
+                if self._keep(i):
+                    self._record(
+                        found[i],
                         Violation(
                             rule=rule,
-                            rule_type="forbidden",
+                            rule_type="required",
                             from_module=module.path,
-                            to_module=dep.target,
-                        )
+                            to_module=rule.to.path if rule.to else None,
+                            message=(
+                                f"Missing required dependency matching '{rule.to.path}'"
+                            ),
+                        ),
                     )
 
+    def _check_typed_edges(
+        self,
+        forbidden: int,
+        allowed: int,
+        applies: dict[DependencyType, int],
+        found: list[list[Violation]],
+    ) -> None:
+        """Check typed forbidden and allowed rules on their edges only.
+
+        Only the edges of the types some rule applies to are visited, one
+        type at a time through :meth:`DependencyGraph.get_edges_by_type`.
+        The violating edges are then reported in graph order, so each rule's
+        violations (and which ones a ``max_violations`` cap keeps) are the
+        same as in the all-edges pass. With fail_fast the first one found is
+        reported at once.
+        """
+        violating: list[tuple[int, str, Dependency]] = []
+        for dep_type in DependencyType:
+            rules = applies[dep_type] & (forbidden | allowed)
+            if not rules:
+                continue
+            for source, dep in self._graph.get_edges_by_type(dep_type):
+                masks = self._matrix.classify(source)
+                if masks is None or not masks[0] & rules:
+                    continue
+                target_masks = self._matrix.classify(dep.target)
+                if target_masks is None:
+                    continue
+                active = masks[0] & rules
+                targets = self._targets(active, source, dep.target, target_masks[1])
+                violated = (active & forbidden & targets) | (
+                    active & allowed & ~targets
+                )
+                if not violated:
+                    continue
+                if self._fail_fast:
+                    self._report(violated, source, dep, found)
+                violating.append((violated, source, dep))
+        if not violating:
+            return
+
+        rank = {module.path: n for n, module in enumerate(self._graph.all_modules())}
+        positions: dict[str, dict[int, int]] = {}
+
+        def position(edge: tuple[int, str, Dependency]) -> tuple[int, int]:
+            _, source, dep = edge
+            if source not in positions:
+                module = self._graph.get_module(source)
+                positions[source] = {
+                    id(d): j for j, d in enumerate(module.dependencies)
+                }
+            return rank[source], positions[source][id(dep)]
+
+        violating.sort(key=position)
+        for violated, source, dep in violating:
+            self._report(violated, source, dep, found)
+
+    def _report(
+        self,
+        violated: int,
+        source: str,
+        dep: Dependency,
+        found: list[list[Violation]],
+    ) -> None:
+        """Record a violation of every rule in ``violated`` by one edge."""
+        for i in _bits(violated):
+            rule_type, rule = self._rules[i]
+            if self._keep(i):
+                self._record(
+                    found[i],
+                    Violation(
+                        rule=rule,
+                        rule_type=rule_type,
+                        from_module=source,
+                        to_module=dep.target,
+                    ),
+                )
+
     def _check_circular_forbidden(
         self,
+        i: int,
         rule: Rule,
-        from_matcher: PathMatcherCompiled,
         cycles: list[list[str]],
-        result: RuleCheckResult,
+        violations: list[Violation],
     ) -> None:
         """Check for forbidden circular dependencies."""
         reported_cycles: set[tuple[str, ...]] = set()
 
         for cycle in cycles:
             # Check if any module in the cycle matches the from pattern
-            matching_modules = [
-                path
-                for path in cycle
-                if from_matcher.matches(path) and not self._is_excluded(path)
-            ]
-
-            if matching_modules:
+            if any(self._from_matches(i, path) for path in cycle):
                 # Create a normalized cycle key to avoid duplicates
                 cycle_key = tuple(sorted(cycle))
                 if cycle_key not in reported_cycles:
                     reported_cycles.add(cycle_key)
-                    result.violations.append(
-                        Violation(
-                            rule=rule,
-                            rule_type="forbidden",
-                            from_module=" -> ".join(cycle),
-                            message=f"Circular dependency: {' -> '.join(cycle)} -> {cycle[0]}",
+                    if self._keep(i):
+                        self._record(
+                            violations,
+                            Violation(
+                                rule=rule,
+                                rule_type="forbidden",
+                                from_module=" -> ".join(cycle),
+                                message=(
+                                    "Circular dependency: "
+                                    f"{' -> '.join(cycle)} -> {cycle[0]}"
+                                ),
+                            ),
                         )
-                    )
 
     def _check_orphan_forbidden(
-        self,
-        rule: Rule,
-        from_matcher: PathMatcherCompiled,
-        result: RuleCheckResult,
+        self, i: int, rule: Rule, violations: list[Violation]
     ) -> None:
         """Check for forbidden orphan modules (no dependencies)."""
         for module in self._graph.all_modules():
-            if self._is_excluded(module.path):
-                continue
-
-            if not from_matcher.matches(module.path):
+            if not self._from_matches(i, module.path):
                 continue
 
             # Check if module has no dependencies and no dependents
             has_deps = len(module.dependencies) > 0
             has_dependents = len(self._graph.get_dependents(module.path)) > 0
 
-            if not has_deps and not has_dependents:
-                result.violations.append(
+            if not has_deps and not has_dependents and self._keep(i):
+                self._record(
+                    violations,
                     Violation(
                         rule=rule,
                         rule_type="forbidden",
                         from_module=module.path,
+                    ),
+                )
+
+    def _check_reachable_forbidden(
+        self, i: int, rule: Rule, violations: list[Violation]
+    ) -> None:
+        """Check a forbidden rule against transitive dependencies.
+
+        The rule's targets form one bitset (one per distinct capture when
+        ``to`` refers back to ``from``), so each matching module costs a
+        single intersection with its descendants; a shortest chain is then
+        searched only for modules that do reach a target.
+        """
+        reachability = self._reachability_index()
+        modules = self._graph.all_modules()
+        bound = bool(self._matrix.back_references >> i & 1)
+        # Target sets per distinct ``from`` captures; without back-references
+        # there is only one.
+        target_sets: dict[tuple[str, ...], int] = {}
+
+        def targets_for(source: str) -> int:
+            captures = self._matrix.captures(i, source) if bound else ()
+            if captures not in target_sets:
+                target_sets[captures] = reachability.mask(
+                    module.path
+                    for module in modules
+                    if self._to_matches(i, module.path)
+                    and (
+                        not bound
+                        or self._matrix.bound_targets(1 << i, source, module.path)
                     )
                 )
+            return target_sets[captures]
 
-    def _check_allowed(self, rule: Rule, result: RuleCheckResult) -> None:
-        """Check an allowed rule (dependencies must match pattern)."""
-        if rule.severity == Severity.IGNORE:
+        if not bound and not targets_for(""):
             return
 
-        from_matcher = PathMatcherCompiled(rule.from_)
-        to_matcher = PathMatcherCompiled(rule.to)
-
-        for module in self._graph.all_modules():
-            if self._is_excluded(module.path):
+        for module in modules:
+            if not self._from_matches(i, module.path):
                 continue
-
-            if not from_matcher.matches(module.path):
+            targets = targets_for(module.path)
+            if not reachability.descendant_mask(module.path) & targets:
                 continue
-
-            for dep in module.dependencies:
-                if self._is_excluded(dep.target):
-                    continue
-
-                # In allowed rules, violations are dependencies that DON'T match
-                if not to_matcher.matches(dep.target):
-                    result.violations.append(
+            for target, chain in reachability.shortest_paths(
+                module.path, targets
+            ).items():
+                if self._keep(i):
+                    self._record(
+                        violations,
                         Violation(
                             rule=rule,
-                            rule_type="allowed",
+                            rule_type="forbidden",
                             from_module=module.path,
-                            to_module=dep.target,
-                        )
+                            to_module=target,
+                            path=chain,
+                        ),
                     )
 
-    def _check_required(self, rule: Rule, result: RuleCheckResult) -> None:
-        """Check a required rule (matching modules must have dependency)."""
-        if rule.severity == Severity.IGNORE:
-            return
-
-        from_matcher = PathMatcherCompiled(rule.from_)
-        to_matcher = PathMatcherCompiled(rule.to)
-
-        # Required rules only make sense with specific 'to' patterns
-        if to_matcher.matches_any():
-            return
+    def _check_layers(self, violations: list[Violation], stats: RuleStats) -> None:
+        """Check that no module depends on a module in a higher layer.
+
+        A module belongs to the first layer whose patterns match it; modules
+        in no layer (or excluded) are not constrained. The check counts as
+        one rule named ``layers``, whose modules and edges go to ``stats``.
+        """
+        layer = len(self._rules)
+        layers = self._config.layers
+        matchers = [
+            PathMatcherCompiled(PathMatcher(path=layer.path, pathNot=layer.pathNot))
+            for layer in layers
+        ]
+        rule = Rule(
+            name="layers",
+            comment=" < ".join(layer.name for layer in layers),
+        )
+        layer_of: dict[str, int | None] = {}
+
+        def classify(path: str) -> int | None:
+            if path not in layer_of:
+                layer_of[path] = None
+                if not self._matrix.is_excluded(path):
+                    start = perf_counter()
+                    for i, matcher in enumerate(matchers):
+                        if matcher.matches(path):
+                            layer_of[path] = i
+                            break
+                    self._layer_time += perf_counter() - start
+            return layer_of[path]
 
         for module in self._graph.all_modules():
-            if self._is_excluded(module.path):
-                continue
-
-            if not from_matcher.matches(module.path):
+            source = classify(module.path)
+            if source is None:
                 continue
+            stats.modules += 1
+            stats.edges += len(module.dependencies)
+            for dep in module.dependencies:
+                target = classify(dep.target)
+                if target is None or target <= source:
+                    continue
+                lower, higher = layers[source].name, layers[target].name
+                if self._keep(layer):
+                    self._record(
+                        violations,
+                        Violation(
+                            rule=rule,
+                            rule_type="layers",
+                            from_module=module.path,
+                            to_module=dep.target,
+                            message=(
+                                f"Layer '{lower}' must not depend on higher layer "
+                                f"'{higher}': {module.path} -> {dep.target}"
+                            ),
+                        ),
+                    )
 
-            # Check if module has at least one dependency matching 'to' pattern
-            has_required_dep = any(
-                to_matcher.matches(dep.target)
-                for dep in module.dependencies
-                if not self._is_excluded(dep.target)
-            )
+    def _check_thresholds(
+        self, i: int, rule: Rule, violations: list[Violation]
+    ) -> None:
+        """Check a threshold rule against precomputed metrics.
+
+        Fan-out and fan-in count distinct in-project modules (Ce and Ca),
+        depth is the module's topological level, and a cycle is too large
+        when its strongly connected component has more members than allowed
+        and at least one of them matches ``from``.
+        """
+        condensation = self._condensation_dag()
+        nodes = condensation.csr.nodes
+        if (
+            rule.max_fan_out is not None
+            or rule.max_fan_in is not None
+            or rule.max_depth is not None
+        ):
+            metrics = self._graph_metrics().modules
+            for node, path in enumerate(nodes):
+                if not self._from_matches(i, path):
+                    continue
+                module = metrics[path]
+                level = condensation.levels[condensation.component_of[node]]
+                for value, limit, label in (
+                    (module.efferent, rule.max_fan_out, "fan-out"),
+                    (module.afferent, rule.max_fan_in, "fan-in"),
+                    (level, rule.max_depth, "depth"),
+                ):
+                    if limit is not None and value > limit and self._keep(i):
+                        self._record(
+                            violations,
+                            Violation(
+                                rule=rule,
+                                rule_type="thresholds",
+                                from_module=path,
+                                message=f"{path}: {label} {value} > {limit}",
+                            ),
+                        )
 
-            if not has_required_dep:
-                result.violations.append(
-                    Violation(
-                        rule=rule,
-                        rule_type="required",
-                        from_module=module.path,
-                        to_module=rule.to.path if rule.to else None,
-                        message=f"Missing required dependency matching '{rule.to.path}'",
+        if rule.max_cycle_size is not None:
+            for members in condensation.components:
+                if len(members) <= rule.max_cycle_size or len(members) < 2:
+                    continue
+                cycle = sorted(nodes[node] for node in members)
+                if any(self._from_matches(i, path) for path in cycle) and self._keep(i):
+                    self._record(
+                        violations,
+                        Violation(
+                            rule=rule,
+                            rule_type="thresholds",
+                            from_module=", ".join(cycle),
+                            message=(
+                                f"{', '.join(cycle)}: cycle size {len(cycle)} "
+                                f"> {rule.max_cycle_size}"
+                            ),
+                        ),
                     )
-                )
@@ -1,31 +1,89 @@
 """Path matching for rule evaluation."""
 
 import re
+from collections.abc import Iterable
+from time import perf_counter
 
-from ..config.models import PathMatcher
+from ..config.models import BACK_REFERENCE, PathMatcher, Rule
+
+_Patterns = tuple[re.Pattern[str] | None, re.Pattern[str] | None]
 
 
 class PathMatcherCompiled:
-    """Compiled path matcher for efficient rule evaluation."""
+    """Compiled path matcher for efficient rule evaluation.
+
+    Patterns may contain back-references (``$1``) to groups captured by
+    another matcher, see :meth:`captures`. They are instantiated with the
+    escaped captured values on demand, and each instantiation is compiled
+    once and cached, so a rule costs one compilation per distinct capture.
+    """
 
     def __init__(self, matcher: PathMatcher) -> None:
-        self._path_re = re.compile(matcher.path) if matcher.path else None
-        self._path_not_re = re.compile(matcher.pathNot) if matcher.pathNot else None
+        self._path = matcher.path or None
+        self._path_not = matcher.pathNot or None
+        self.has_back_references = any(
+            p is not None and BACK_REFERENCE.search(p) is not None
+            for p in (self._path, self._path_not)
+        )
+        self._instances: dict[tuple[str, ...], _Patterns] = {}
+        self._path_re, self._path_not_re = self._instance(())
+
+    def _instance(self, captures: tuple[str, ...]) -> _Patterns:
+        patterns = self._instances.get(captures)
+        if patterns is None:
+            patterns = self._instances[captures] = (
+                self._compile(self._path, captures),
+                self._compile(self._path_not, captures),
+            )
+        return patterns
+
+    def _compile(
+        self, pattern: str | None, captures: tuple[str, ...]
+    ) -> re.Pattern[str] | None:
+        if pattern is None:
+            return None
+        if self.has_back_references:
+            # References to groups that were not captured match nothing.
+            pattern = BACK_REFERENCE.sub(
+                lambda m: (
+                    re.escape(captures[int(m.group(1)) - 1])
+                    if int(m.group(1)) <= len(captures)
+                    else "(?!)"
+                ),
+                pattern,
+            )
+        return re.compile(pattern)
+
+    def captures(self, path: str) -> tuple[str, ...]:
+        """Return the groups the ``path`` pattern captures in ``path``."""
+        if self._path_re is None:
+            return ()
+        match = self._path_re.search(path)
+        return match.groups(default="") if match else ()
+
+    def matches(self, path: str, captures: tuple[str, ...] = ()) -> bool:
+        """Check if a path matches the matcher criteria.
+
+        ``captures`` are the values back-references refer to (ignored when
+        the patterns have none).
+        """
+        if self.has_back_references:
+            path_re, path_not_re = self._instance(captures)
+        else:
+            path_re, path_not_re = self._path_re, self._path_not_re
 
-    def matches(self, path: str) -> bool:
-        """Check if a path matches the matcher criteria."""
         # If no patterns defined, match everything
-        if self._path_re is None and self._path_not_re is None:
+        if path_re is None and path_not_re is None:
             return True
 
         # Check positive match
-        if self._path_re is not None:
-            if not self._path_re.search(path):
+        if path_re is not None:
+            if not path_re.search(path):
                 return False
 
         # Check negative match
-        if self._path_not_re is not None:
-            if self._path_not_re.search(path):
+        if path_not_re is not None:
+            if path_not_re.search(path):
                 return False
 
         return True
@@ -33,3 +91,172 @@ class PathMatcherCompiled:
     def matches_any(self) -> bool:
         """Check if this matcher would match anything (no patterns defined)."""
         return self._path_re is None and self._path_not_re is None
+
+
+class RuleMatrix:
+    """Classifies paths against every rule's matchers at once.
+
+    Each distinct regex (from any rule's ``from``/``to`` or the exclude list)
+    is compiled once and given a bit. A path is searched against every regex
+    once, and the resulting pattern mask is turned into two rule masks: bit
+    ``i`` of ``sources`` is set when rule ``i``'s ``from`` matches the path,
+    bit ``i`` of ``targets`` when its ``to`` matches. Results are cached per
+    path and per pattern mask, since most paths share a handful of masks, so
+    evaluating an edge against all rules is a few integer operations.
+
+    A ``to`` with back-references depends on the source, so it cannot be
+    part of a path's mask: those rules are listed in ``back_references``,
+    their bit in ``targets`` is always set, and :meth:`bound_targets` checks
+    them for a given source.
+
+    The time spent in each regex is accumulated, see :meth:`rule_time`, so
+    a pattern that backtracks badly can be traced back to its rules.
+    :meth:`prepare` classifies many paths one regex at a time, which keeps
+    that bookkeeping to one clock read per regex.
+    """
+
+    def __init__(self, rules: list[Rule], exclude: list[str] | None = None) -> None:
+        self._bits: dict[str, int] = {}
+        self._regexes: list[re.Pattern[str]] = []
+        self._time: list[float] = []
+        self._from = [self._compile(rule.from_) for rule in rules]
+        self.back_references = 0
+        self._bound: dict[int, tuple[PathMatcherCompiled, PathMatcherCompiled]] = {}
+        self._bound_time: dict[int, float] = {}
+        self._to: list[tuple[int, int]] = []
+        for i, rule in enumerate(rules):
+            to = PathMatcherCompiled(rule.to or PathMatcher())
+            if to.has_back_references:
+                self.back_references |= 1 << i
+                self._bound[i] = (PathMatcherCompiled(rule.from_ or PathMatcher()), to)
+                self._bound_time[i] = 0.0
+                self._to.append((0, 0))
+            else:
+                self._to.append(self._compile(rule.to))
+        self._captures: dict[tuple[int, str], tuple[str, ...]] = {}
+        self._exclude = 0
+        for pattern in exclude or []:
+            self._exclude |= self._bit(pattern)
+        self._by_path: dict[str, tuple[int, int] | None] = {}
+        self._by_mask: dict[int, tuple[int, int] | None] = {}
+
+    def pattern_count(self) -> int:
+        """Return the number of distinct compiled regexes."""
+        return len(self._regexes)
+
+    def _bit(self, pattern: str | None) -> int:
+        if not pattern:
+            return 0
+        bit = self._bits.get(pattern)
+        if bit is None:
+            bit = self._bits[pattern] = 1 << len(self._regexes)
+            self._regexes.append(re.compile(pattern))
+            self._time.append(0.0)
+        return bit
+
+    def _compile(self, matcher: PathMatcher | None) -> tuple[int, int]:
+        if matcher is None:
+            return 0, 0
+        return self._bit(matcher.path), self._bit(matcher.pathNot)
+
+    def prepare(self, paths: Iterable[str]) -> None:
+        """Classify ``paths`` up front, so :meth:`classify` finds them cached."""
+        pending = [path for path in dict.fromkeys(paths) if path not in self._by_path]
+        masks = [0] * len(pending)
+        for i, regex in enumerate(self._regexes):
+            bit = 1 << i
+            search = regex.search
+            start = perf_counter()
+            for j, path in enumerate(pending):
+                if search(path):
+                    masks[j] |= bit
+            self._time[i] += perf_counter() - start
+        for path, mask in zip(pending, masks):
+            self._by_path[path] = self._masks(mask)
+
+    def classify(self, path: str) -> tuple[int, int] | None:
+        """Return ``(sources, targets)`` rule masks, or None if excluded."""
+        if path in self._by_path:
+            return self._by_path[path]
+        mask = 0
+        for i, regex in enumerate(self._regexes):
+            start = perf_counter()
+            found = regex.search(path)
+            self._time[i] += perf_counter() - start
+            if found:
+                mask |= 1 << i
+        masks = self._by_path[path] = self._masks(mask)
+        return masks
+
+    def _masks(self, mask: int) -> tuple[int, int] | None:
+        if mask not in self._by_mask:
+            self._by_mask[mask] = self._rule_masks(mask)
+        return self._by_mask[mask]
+
+    def _rule_masks(self, mask: int) -> tuple[int, int] | None:
+        if mask & self._exclude:
+            return None
+
+        def matching(matchers: list[tuple[int, int]]) -> int:
+            rules = 0
+            for i, (required, forbidden) in enumerate(matchers):
+                if mask & required == required and not mask & forbidden:
+                    rules |= 1 << i
+            return rules
+
+        return matching(self._from), matching(self._to)
+
+    def captures(self, i: int, source: str) -> tuple[str, ...]:
+        """Return the groups rule ``i``'s ``from`` captures in ``source``."""
+        key = (i, source)
+        captures = self._captures.get(key)
+        if captures is None:
+            start = perf_counter()
+            captures = self._captures[key] = self._bound[i][0].captures(source)
+            self._bound_time[i] += perf_counter() - start
+        return captures
+
+    def bound_targets(self, rules: int, source: str, target: str) -> int:
+        """Return which back-reference ``rules`` match ``target`` from ``source``.
+
+        ``rules`` must be a subset of :attr:`back_references`.
+        """
+        matched = 0
+        bits = rules
+        while bits:
+            low = bits & -bits
+            i = low.bit_length() - 1
+            captures = self.captures(i, source)
+            start = perf_counter()
+            if self._bound[i][1].matches(target, captures):
+                matched |= low
+            self._bound_time[i] += perf_counter() - start
+            bits ^= low
+        return matched
+
+    def rule_time(self, i: int) -> float:
+        """Return the seconds rule ``i``'s patterns have spent matching.
+
+        A pattern shared by several rules counts in full for each of them.
+        """
+        patterns = 0
+        for matcher in (self._from[i], self._to[i]):
+            patterns |= matcher[0] | matcher[1]
+        spent = self._bound_time.get(i, 0.0)
+        while patterns:
+            low = patterns & -patterns
+            spent += self._time[low.bit_length() - 1]
+            patterns ^= low
+        return spent
+
+    def exclude_time(self) -> dict[str, float]:
+        """Return the seconds each exclude pattern has spent matching."""
+        return {
+            pattern: self._time[bit.bit_length() - 1]
+            for pattern, bit in self._bits.items()
+            if bit & self._exclude
+        }
+
+    def is_excluded(self, path: str) -> bool:
+        """Check if a path is excluded from rule checking."""
+        return self.classify(path) is None
@@ -119,3 +119,90 @@ class TestAnalyzer:
         assert enemy is not None
         targets = {d.target for d in enemy.dependencies}
         assert "res://player.gd" in targets
+
+
+class TestCycleTypes:
+    def _project(self, root):
+        (root / "project.godot").write_text("[application]\n", encoding="utf-8")
+        (root / "a.gd").write_text(
+            'class_name A\nvar b = preload("res://b.gd")\n', encoding="utf-8"
+        )
+        (root / "b.gd").write_text("class_name B\nvar a: A\n", encoding="utf-8")
+
+    def test_soft_cycle_reported_separately(self, tmp_path):
+        self._project(tmp_path)
+        hard = [DependencyType.PRELOAD, DependencyType.EXTENDS_PATH]
+        result = Analyzer(tmp_path).analyze(cycle_types=hard)
+
+        assert result.cycles == []
+        assert [sorted(c) for c in result.soft_cycles] == [["res://a.gd", "res://b.gd"]]
+        assert result.to_dict()["cycle_types"] == ["preload", "extends_path"]
+
+    def test_soft_component_around_hard_cycle_is_not_repeated(self, tmp_path):
+        self._project(tmp_path)
+        # b <-preload-> c is hard, and a class reference closes a loop
+        # through a around it.
+        (tmp_path / "b.gd").write_text(
+            'class_name B\nvar a: A\nvar c = preload("res://c.gd")\n',
+            encoding="utf-8",
+        )
+        (tmp_path / "c.gd").write_text(
+            'var b = preload("res://b.gd")\n', encoding="utf-8"
+        )
+        hard = [DependencyType.PRELOAD, DependencyType.EXTENDS_PATH]
+        result = Analyzer(tmp_path).analyze(cycle_types=hard)
+
+        assert [sorted(c) for c in result.cycles] == [["res://b.gd", "res://c.gd"]]
+        assert result.soft_cycles == []
+
+    def test_without_cycle_types_everything_is_hard(self, tmp_path):
+        self._project(tmp_path)
+        result = Analyzer(tmp_path).analyze()
+
+        assert len(result.cycles) == 1
+        assert result.soft_cycles == []
+
+
+class TestSubgraph:
+    def test_focus_selects_neighbors(self):
+        result = Analyzer(FIXTURES).analyze()
+
+        view = result.subgraph(focus=r"player\.gd$")
+        paths = {m.path for m in view.graph.all_modules()}
+        assert "res://player.gd" in paths
+        assert "res://base_entity.gd" in paths
+        assert "res://cycle_a.gd" not in paths
+        assert view.cycles == []
+        # The original result is untouched.
+        assert result.cycles
+
+    def test_only_cycles(self):
+        result = Analyzer(FIXTURES).analyze()
+
+        view = result.subgraph(only_cycles=True)
+        paths = {m.path for m in view.graph.all_modules()}
+        assert paths == {"res://cycle_a.gd", "res://cycle_b.gd"}
+        assert view.cycles == result.cycles
+
+    def test_cycle_breaks_cover_the_whole_cycle(self, tmp_path):
+        # a -> b -> c -> a, where only a is selected: the break must still
+        # be an edge of the full cycle, chosen over all of its edges.
+        (tmp_path / "a.gd").write_text('var b = load("res://b.gd")\n', encoding="utf-8")
+        (tmp_path / "b.gd").write_text(
+            'var c = preload("res://c.gd")\n', encoding="utf-8"
+        )
+        (tmp_path / "c.gd").write_text(
+            'var a = preload("res://a.gd")\n', encoding="utf-8"
+        )
+        result = Analyzer(tmp_path).analyze()
+
+        view = result.subgraph(focus=r"/a\.gd$", depth=0)
+        assert {m.path for m in view.graph.all_modules()} == {"res://a.gd"}
+        assert view.cycles == result.cycles
+        ((cut,),) = view.cycle_breaks()
+        assert (cut.source, cut.target) == ("res://a.gd", "res://b.gd")
+        assert view.cycle_breaks() == result.cycle_breaks()
+
+    def test_no_selection_returns_same_result(self):
+        result = Analyzer(FIXTURES).analyze()
+        assert result.subgraph() is result
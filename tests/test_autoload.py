@@ -1,9 +1,12 @@
 from pathlib import Path
 
+import pytest
+
+from gdcruiser import analyzer
 from gdcruiser.analyzer import Analyzer
 from gdcruiser.graph.node import DependencyType
 from gdcruiser.parser.gdscript import GDScriptParser
-from gdcruiser.parser.project_godot import parse_autoloads
+from gdcruiser.parser.project_godot import parse_autoloads, parse_main_scene
 from gdcruiser.symbols.table import SymbolTable
 
 
@@ -47,6 +50,72 @@ class TestParseAutoloads:
         assert autoloads == {"Real": "res://scripts/real.gd"}
 
 
+class TestParseMainScene:
+    def test_parses_res_path(self, tmp_path):
+        (tmp_path / "project.godot").write_text(
+            '[application]\nrun/main_scene="res://main.tscn"\n'
+        )
+        assert parse_main_scene(tmp_path) == "res://main.tscn"
+
+    def test_resolves_uid_against_scene_headers(self, tmp_path):
+        (tmp_path / "project.godot").write_text(
+            '[application]\nrun/main_scene="uid://b2k8x"\n'
+        )
+        (tmp_path / "levels").mkdir()
+        other = tmp_path / "other.tscn"
+        other.write_text('[gd_scene format=3 uid="uid://zzz"]\n')
+        main = tmp_path / "levels" / "main.tscn"
+        main.write_text('[gd_scene load_steps=2 format=3 uid="uid://b2k8x"]\n')
+
+        assert parse_main_scene(tmp_path, [other, main]) == "res://levels/main.tscn"
+        assert parse_main_scene(tmp_path, [other]) is None
+
+    def test_missing_main_scene(self, tmp_path):
+        assert parse_main_scene(tmp_path) is None
+        assert parse_main_scene(FIXTURES) is None
+
+    def test_unreadable_scene_is_reported(self, tmp_path):
+        (tmp_path / "project.godot").write_text(
+            '[application]\nrun/main_scene="uid://b2k8x"\n'
+        )
+        (tmp_path / "main.tscn").write_bytes(b"\xff\xfe[gd_scene]\n")
+
+        result = Analyzer(tmp_path).analyze()
+        assert result.main_scene is None
+        assert any("main scene" in e for e in result.errors)
+
+    def test_unexpected_main_scene_errors_propagate(self, tmp_path, monkeypatch):
+        def broken(*args):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(analyzer, "parse_main_scene", broken)
+        with pytest.raises(TypeError):
+            Analyzer(tmp_path).analyze()
+
+    def test_main_scene_roots_dominator_tree(self, tmp_path):
+        (tmp_path / "project.godot").write_text(
+            '[application]\nrun/main_scene="res://main.tscn"\n'
+            '[autoload]\nBus="*res://bus.gd"\n'
+        )
+        (tmp_path / "main.tscn").write_text(
+            "[gd_scene format=3]\n"
+            '[ext_resource type="Script" path="res://main.gd" id="1"]\n'
+        )
+        (tmp_path / "main.gd").write_text('const Hud = preload("res://hud.gd")\n')
+        (tmp_path / "hud.gd").write_text("extends Node\n")
+        (tmp_path / "bus.gd").write_text("extends Node\n")
+
+        result = Analyzer(tmp_path).analyze()
+        assert result.main_scene == "res://main.tscn"
+        tree = result.dominators()
+        assert tree.roots == ["res://main.tscn", "res://bus.gd"]
+        assert tree.immediate_dominator("res://hud.gd") == "res://main.gd"
+        assert result.to_dict()["dominators"]["chokepoints"][0] == {
+            "module": "res://main.tscn",
+            "dominated": 2,
+        }
+
+
 class TestAutoloadResolution:
     def test_member_access_resolves_to_autoload_target(self):
         analyzer = Analyzer(AUTOLOAD_PROJECT)
@@ -69,6 +138,14 @@ class TestAutoloadResolution:
         for dep in autoload_refs:
             assert dep.resolved is True
 
+    def test_autoload_coupling_metric(self):
+        analyzer = Analyzer(AUTOLOAD_PROJECT)
+        result = analyzer.analyze()
+
+        assert result.autoloads["EventBus"] == "res://scripts/autoload/event_bus.gd"
+        metrics = result.metrics().modules["res://scripts/heal_skill.gd"]
+        assert metrics.autoload_coupling == 2
+
     def test_string_literal_autoload_ignored(self, tmp_path):
         # "TurnManager.advance" inside a string must not produce a class_ref.
         project = tmp_path / "project.godot"
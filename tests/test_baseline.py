@@ -0,0 +1,157 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from gdcruiser.analyzer import AnalysisResult
+from gdcruiser.baseline import (
+    Baseline,
+    cycle_key,
+    package_cycle_key,
+    violation_key,
+)
+from gdcruiser.cli import create_parser, run
+from gdcruiser.config import Rule
+from gdcruiser.graph.cycles import CycleDetector
+from gdcruiser.graph.dependency import DependencyGraph
+from gdcruiser.graph.node import Dependency, DependencyType, Module
+from gdcruiser.rules.models import RuleCheckResult, Violation
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _violation(source: str, target: str | None = None, **rule) -> Violation:
+    return Violation(
+        rule=Rule(name="r", **rule),
+        rule_type="forbidden",
+        from_module=source,
+        to_module=target,
+    )
+
+
+class TestKeys:
+    def test_cycle_key_ignores_rotation(self):
+        assert cycle_key(["a", "b", "c"]) == cycle_key(["c", "a", "b"])
+        assert cycle_key(["a", "b"]) != cycle_key(["a", "b", "c"])
+
+    def test_package_cycle_key(self):
+        assert package_cycle_key(["ui", "net"]) == package_cycle_key(["net", "ui"])
+        assert package_cycle_key(["ui", "net"]) != cycle_key(["ui", "net"])
+
+    def test_violation_key(self):
+        assert violation_key(_violation("a", "b")) == violation_key(
+            _violation("a", "b", comment="changed")
+        )
+        assert violation_key(_violation("a", "b")) != violation_key(
+            _violation("a", "c")
+        )
+        assert violation_key(_violation("a -> b", circular=True)) == violation_key(
+            _violation("b -> a", circular=True)
+        )
+
+
+class TestBaseline:
+    def test_filters_known_entries(self, tmp_path):
+        known = RuleCheckResult(violations=[_violation("a", "b")])
+        path = tmp_path / "baseline.json"
+        Baseline.from_results([["x", "y"]], known).save(path)
+
+        baseline = Baseline.load(path)
+        current = RuleCheckResult(
+            violations=[_violation("a", "b"), _violation("a", "c")]
+        )
+        assert [v.to_module for v in baseline.new_violations(current).violations] == [
+            "c"
+        ]
+        assert baseline.new_cycles([["y", "x"], ["x", "y", "z"]]) == [["x", "y", "z"]]
+        assert baseline.new_package_cycles([["y", "x"]]) == [["y", "x"]]
+
+    def test_cycle_breaks_follow_filtered_cycles(self):
+        graph = DependencyGraph()
+        for source, target in [("a", "b"), ("b", "a"), ("x", "y"), ("y", "x")]:
+            graph.add_module(
+                Module(
+                    path=f"res://{source}.gd",
+                    dependencies=[
+                        Dependency(
+                            target=f"res://{target}.gd",
+                            dep_type=DependencyType.PRELOAD,
+                        )
+                    ],
+                )
+            )
+        cycles = CycleDetector(graph).find_cycles()
+        result = AnalysisResult(graph=graph, cycles=cycles)
+        assert len(result.cycle_breaks()) == 2
+
+        baseline = Baseline.from_results(
+            [["res://a.gd", "res://b.gd"]], RuleCheckResult()
+        )
+        filtered = replace(result, cycles=baseline.new_cycles(result.cycles))
+        (cycle,) = filtered.cycles
+        assert set(cycle) == {"res://x.gd", "res://y.gd"}
+        (breaks,) = filtered.cycle_breaks()
+        (cut,) = breaks
+        assert {cut.source, cut.target} == {"res://x.gd", "res://y.gd"}
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text(json.dumps({"graph": {}}), encoding="utf-8")
+        with pytest.raises(ValueError, match="not a gdcruiser baseline"):
+            Baseline.load(path)
+
+
+class TestBaselineCLI:
+    def test_write_then_check(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        parser = create_parser()
+
+        # The fixtures contain one cycle, which fails the run...
+        assert run(parser.parse_args([str(FIXTURES)])) == 1
+        assert (
+            run(
+                parser.parse_args(
+                    [str(FIXTURES), "--baseline", str(baseline), "--write-baseline"]
+                )
+            )
+            == 0
+        )
+        assert "0 violations, 1 cycles" in capsys.readouterr().out
+
+        # ... until it is baselined.
+        assert run(parser.parse_args([str(FIXTURES), "--baseline", str(baseline)])) == 0
+        assert "CIRCULAR DEPENDENCIES" not in capsys.readouterr().out
+
+    def test_package_cycles(self, tmp_path, capsys):
+        project = tmp_path / "project"
+        (project / "ui").mkdir(parents=True)
+        (project / "net").mkdir()
+        (project / "ui" / "menu.gd").write_text(
+            'var c = preload("res://net/client.gd")\n', encoding="utf-8"
+        )
+        (project / "ui" / "theme.gd").write_text("extends Node\n", encoding="utf-8")
+        (project / "net" / "client.gd").write_text(
+            'var t = load("res://ui/theme.gd")\n', encoding="utf-8"
+        )
+        baseline = tmp_path / "baseline.json"
+        parser = create_parser()
+        options = [str(project), "--package-depth", "1", "--baseline", str(baseline)]
+
+        assert run(parser.parse_args([*options, "--write-baseline"])) == 0
+        assert "1 package cycles" in capsys.readouterr().out
+        assert run(parser.parse_args(options)) == 0
+        out = capsys.readouterr().out
+        assert "PACKAGES (2 packages" in out
+        assert "Package cycles" not in out
+
+    def test_write_requires_file(self, capsys):
+        args = create_parser().parse_args([str(FIXTURES), "--write-baseline"])
+        assert run(args) == 1
+        assert "requires --baseline" in capsys.readouterr().err
+
+    def test_missing_baseline(self, tmp_path, capsys):
+        missing = tmp_path / "missing.json"
+        args = create_parser().parse_args([str(FIXTURES), "--baseline", str(missing)])
+        assert run(args) == 1
+        assert "Cannot read baseline" in capsys.readouterr().err
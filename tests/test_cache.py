@@ -72,6 +72,26 @@ def test_cache_produces_identical_graph(tmp_path):
     assert cached == no_cache
 
 
+def test_cache_keeps_aggregated_lines(tmp_path):
+    _make_project(tmp_path)
+    (tmp_path / "c.gd").write_text(
+        'var x = preload("res://b.gd")\nvar y = preload("res://b.gd")\n',
+        encoding="utf-8",
+    )
+    cache_path = tmp_path / "cache.json"
+
+    cold = ParseCache(cache_path)
+    cold.load()
+    Analyzer(tmp_path, cache=cold).analyze()
+    warm = ParseCache(cache_path)
+    warm.load()
+    result = Analyzer(tmp_path, cache=warm).analyze()
+
+    (dep,) = result.graph.get_dependencies("res://c.gd")
+    assert warm.hits == 3
+    assert (dep.lines, dep.count) == ([1, 2], 2)
+
+
 def test_stale_version_ignored(tmp_path):
     _make_project(tmp_path)
     cache_path = tmp_path / "cache.json"
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from gdcruiser.cli import create_parser, run
 
 
@@ -116,3 +118,166 @@ class TestCLIRun:
         result = run(args)
 
         assert result == 0
+
+    def test_run_elementary_cycles(self, capsys):
+        parser = create_parser()
+        args = parser.parse_args(
+            [str(FIXTURES), "--elementary-cycles", "--max-cycle-length", "4"]
+        )
+
+        run(args)
+
+        captured = capsys.readouterr()
+        assert "ELEMENTARY CYCLES (1 listed)" in captured.out
+        assert "--[preload]-->" in captured.out
+
+    def test_cycle_types_only_fail_on_hard_cycles(self, tmp_path, capsys):
+        (tmp_path / "a.gd").write_text(
+            'class_name A\nvar b = preload("res://b.gd")\n', encoding="utf-8"
+        )
+        (tmp_path / "b.gd").write_text("class_name B\nvar a: A\n", encoding="utf-8")
+        parser = create_parser()
+        args = parser.parse_args(
+            [str(tmp_path), "--cycle-types", "preload,extends_path"]
+        )
+
+        assert run(args) == 0
+        assert "SOFT CYCLES (1 found)" in capsys.readouterr().out
+
+    def test_cycle_types_rejects_unknown_type(self, capsys):
+        parser = create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--cycle-types", "preload,bogus"])
+        assert "unknown dependency type 'bogus'" in capsys.readouterr().err
+
+    def test_cycle_types_rejects_empty_list(self, capsys):
+        for value in ("", ","):
+            with pytest.raises(SystemExit):
+                create_parser().parse_args(["--cycle-types", value])
+            assert "at least one dependency type" in capsys.readouterr().err
+
+    def test_package_cycles_fail(self, tmp_path, capsys):
+        (tmp_path / "ui").mkdir()
+        (tmp_path / "net").mkdir()
+        (tmp_path / "ui" / "menu.gd").write_text(
+            'var c = preload("res://net/client.gd")\n', encoding="utf-8"
+        )
+        (tmp_path / "ui" / "theme.gd").write_text("extends Node\n", encoding="utf-8")
+        (tmp_path / "net" / "client.gd").write_text(
+            'var t = load("res://ui/theme.gd")\n', encoding="utf-8"
+        )
+        parser = create_parser()
+
+        assert run(parser.parse_args([str(tmp_path)])) == 0
+        capsys.readouterr()
+        assert run(parser.parse_args([str(tmp_path), "--package-depth", "1"])) == 1
+        out = capsys.readouterr().out
+        assert "PACKAGES (2 packages, 2 dependencies)" in out
+        assert "Package cycles (1 found)" in out
+
+        # The package cycle needs the load() edge, which is not hard here.
+        args = [str(tmp_path), "--package-depth", "1", "--cycle-types", "preload"]
+        assert run(parser.parse_args(args)) == 0
+        assert "Package cycles" not in capsys.readouterr().out
+
+    def test_package_options_are_exclusive(self, capsys):
+        parser = create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--package-depth", "1", "--package-pattern", "x"])
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--package-pattern", "(unclosed"])
+        assert "invalid regex" in capsys.readouterr().err
+
+    def test_rule_stats(self, tmp_path, capsys):
+        config = tmp_path / "rules.json"
+        config.write_text(
+            '{"forbidden": [{"name": "no-cycles", "circular": true}]}',
+            encoding="utf-8",
+        )
+        parser = create_parser()
+        run(parser.parse_args([str(FIXTURES), "--config", str(config), "--rule-stats"]))
+        out = capsys.readouterr().out
+        assert "RULE STATS (1 rules)" in out
+        assert "no-cycles (forbidden)" in out
+
+    def test_fail_fast(self, tmp_path, capsys):
+        config = tmp_path / "rules.json"
+        config.write_text(
+            '{"forbidden": [{"name": "no-cycles", "circular": true}]}',
+            encoding="utf-8",
+        )
+        parser = create_parser()
+        args = parser.parse_args(
+            [str(FIXTURES), "--config", str(config), "--fail-fast"]
+        )
+        assert run(args) == 1
+        assert "stopped at the first violation" in capsys.readouterr().out
+
+    def test_limits_reject_baseline(self, tmp_path, capsys):
+        args = create_parser().parse_args(
+            [
+                str(FIXTURES),
+                "--baseline",
+                str(tmp_path / "b.json"),
+                "--max-violations-per-rule",
+                "5",
+            ]
+        )
+        assert run(args) == 1
+        assert "cannot be combined" in capsys.readouterr().err
+
+    def test_dsm_streams_to_file(self, tmp_path):
+        output = tmp_path / "dsm.csv"
+        args = create_parser().parse_args(
+            [str(FIXTURES), "-f", "dsm", "--dsm-layout", "sparse", "-o", str(output)]
+        )
+        run(args)
+        assert output.read_text(encoding="utf-8").startswith("row,col,from,to")
+
+    def test_cycle_limits_must_be_positive(self, capsys):
+        for option in ("--max-cycle-length", "--max-cycles"):
+            with pytest.raises(SystemExit):
+                create_parser().parse_args([str(FIXTURES), option, "-1"])
+            assert "must be at least 1" in capsys.readouterr().err
+
+    def test_top_impact_must_be_positive(self, capsys):
+        with pytest.raises(SystemExit):
+            create_parser().parse_args([str(FIXTURES), "--top-impact", "-3"])
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_chokepoints_must_be_positive(self, capsys):
+        with pytest.raises(SystemExit):
+            create_parser().parse_args([str(FIXTURES), "--chokepoints", "0"])
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_exclude_warns_about_nested_quantifiers(self, capsys):
+        args = create_parser().parse_args([str(FIXTURES), "--exclude", "(a+)+"])
+        run(args)
+        err = capsys.readouterr().err
+        assert "Warning: --exclude:" in err
+        assert "backtrack catastrophically" in err
+
+    def test_suggest_breaks(self, capsys):
+        args = create_parser().parse_args([str(FIXTURES), "--suggest-breaks"])
+
+        run(args)
+
+        assert "SUGGESTED CYCLE BREAKS" in capsys.readouterr().out
+
+    def test_hierarchy(self, capsys):
+        args = create_parser().parse_args([str(FIXTURES), "--hierarchy"])
+
+        run(args)
+
+        assert "CLASS HIERARCHY" in capsys.readouterr().out
+
+    def test_focus_limits_output_but_not_exit_code(self, capsys):
+        parser = create_parser()
+        args = parser.parse_args(
+            [str(FIXTURES), "-f", "dot", "--focus", "base_entity", "--depth", "0"]
+        )
+
+        assert run(args) == 1
+        out = capsys.readouterr().out
+        assert '"res://base_entity.gd" [label=' in out
+        assert "res://player.gd" not in out
@@ -11,10 +11,14 @@ from gdcruiser.config import (
     ConfigError,
     ConfigLoader,
     ConfigValidator,
+    Layer,
     PathMatcher,
     Rule,
     Severity,
+    validator,
 )
+from gdcruiser.config.validator import has_nested_quantifiers
+from gdcruiser.graph.node import DependencyType
 
 
 class TestConfigModels:
@@ -167,6 +171,107 @@ class TestConfigLoader:
 
             assert config.forbidden[0].circular is True
 
+    def test_load_json_reachable_rule(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".gdcruiser.json"
+            config_path.write_text(
+                json.dumps(
+                    {
+                        "forbidden": [
+                            {
+                                "name": "ui-not-net",
+                                "from": {"path": "^res://ui/"},
+                                "to": {"path": "^res://net/"},
+                                "reachable": True,
+                            }
+                        ]
+                    }
+                )
+            )
+
+            config = ConfigLoader(Path(tmpdir)).load()
+
+            assert config.forbidden[0].reachable is True
+            assert config.warnings == []
+
+    def test_load_json_dependency_types(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".gdcruiser.json"
+            config_path.write_text(
+                json.dumps(
+                    {
+                        "forbidden": [
+                            {
+                                "name": "no-preload",
+                                "dependencyTypes": ["preload", "PRELOAD", "bogus"],
+                                "dependencyTypesNot": "class_ref",
+                            }
+                        ]
+                    }
+                )
+            )
+
+            config = ConfigLoader(Path(tmpdir)).load()
+
+            rule = config.forbidden[0]
+            assert rule.dependency_types == [
+                DependencyType.PRELOAD,
+                DependencyType.PRELOAD,
+            ]
+            assert rule.dependency_types_not == [DependencyType.CLASS_REF]
+            assert rule.dependency_type_set() == {DependencyType.PRELOAD}
+            assert len(config.warnings) == 1
+            assert "unknown dependency type 'bogus'" in config.warnings[0]
+
+    def test_load_json_thresholds(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".gdcruiser.json"
+            config_path.write_text(
+                json.dumps(
+                    {
+                        "thresholds": [
+                            {
+                                "name": "hotspots",
+                                "from": {"path": "^res://gameplay/"},
+                                "maxFanOut": 15,
+                                "maxCycleSize": 4,
+                            }
+                        ]
+                    }
+                )
+            )
+
+            config = ConfigLoader(Path(tmpdir)).load()
+
+            (rule,) = config.thresholds
+            assert (rule.max_fan_out, rule.max_fan_in) == (15, None)
+            assert rule.max_cycle_size == 4
+            assert config.all_rules() == [("thresholds", rule)]
+            assert config.warnings == []
+
+    def test_load_json_layers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".gdcruiser.json"
+            config_path.write_text(
+                json.dumps(
+                    {
+                        "layers": [
+                            {"name": "core", "path": "^res://core/"},
+                            {"name": "ui", "path": "^res://ui/", "pathNot": "test"},
+                        ]
+                    }
+                )
+            )
+
+            config = ConfigLoader(Path(tmpdir)).load()
+
+            assert config.layers == [
+                Layer(name="core", path="^res://core/"),
+                Layer(name="ui", path="^res://ui/", pathNot="test"),
+            ]
+            assert config.has_rules()
+            assert config.warnings == []
+
     def test_load_json_with_options(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / ".gdcruiser.json"
@@ -178,6 +283,7 @@ class TestConfigLoader:
             config = loader.load()
 
             assert config.options.exclude == ["^res://addons/"]
+            assert config.options.regex_budget == 1.0
 
     def test_load_invalid_json(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -257,6 +363,69 @@ class TestConfigValidator:
         assert not result.is_valid()
         assert any("Invalid regex" in e.message for e in result.errors)
 
+    def test_validate_back_references(self):
+        rule = Rule(
+            name="features",
+            from_=PathMatcher(path="^res://features/([^/]+)/"),
+            to=PathMatcher(pathNot="^res://features/$1/"),
+        )
+        assert ConfigValidator().validate(Config(forbidden=[rule])).is_valid()
+
+        rule.to = PathMatcher(path="^res://$2/")
+        result = ConfigValidator().validate(Config(forbidden=[rule]))
+        assert [e.path for e in result.errors] == ["forbidden[0].to.path"]
+        assert "'$2'" in result.errors[0].message
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(a+)+$", r"(a*)*", r"(\w+\s?)*$", r"^(.*/)*x", r"((ab)+|c)*d"],
+    )
+    def test_nested_quantifiers_detected(self, pattern):
+        assert has_nested_quantifiers(pattern)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"^res://ui/",
+            r"^res://(\w+/)*\w+\.gd$",
+            r"([^/]+/)+",
+            r"(a++)+",
+            r"(?>a+)+",
+            r"(.*a){3}",
+            r"[unclosed",
+        ],
+    )
+    def test_nested_quantifiers_safe(self, pattern):
+        assert not has_nested_quantifiers(pattern)
+
+    def test_nested_quantifiers_without_regex_parser(self, monkeypatch):
+        # The check relies on a private module; without it, it is skipped.
+        monkeypatch.setattr(validator, "_parser", None)
+        assert not has_nested_quantifiers(r"(a+)+$")
+        config = Config()
+        config.options.exclude = ["(a+)+"]
+        assert ConfigValidator().validate(config).warnings == []
+
+    def test_validate_nested_quantifiers(self):
+        config = Config(
+            forbidden=[Rule(name="slow", from_=PathMatcher(path=r"^res://(\w+\s?)*$"))]
+        )
+        config.options.exclude = ["(a+)+"]
+        result = ConfigValidator().validate(config)
+        # Only a heuristic: reported, but the config stays valid.
+        assert result.is_valid()
+        assert [w.path for w in result.warnings] == [
+            "forbidden[0].from.path",
+            "options.exclude[0]",
+        ]
+        assert "backtrack catastrophically" in result.warnings[0].message
+
+    def test_validate_regex_budget(self):
+        config = Config()
+        config.options.regex_budget = 0
+        result = ConfigValidator().validate(config)
+        assert [e.path for e in result.errors] == ["options.regexBudget"]
+
     def test_validate_rule_without_criteria_warns(self):
         config = Config(forbidden=[Rule(name="empty")])
         validator = ConfigValidator()
@@ -271,6 +440,63 @@ class TestConfigValidator:
         assert result.is_valid()
         assert len(result.warnings) == 0
 
+    def test_validate_reachable_only_on_forbidden(self):
+        config = Config(
+            allowed=[Rule(name="deps", from_=PathMatcher(path="ui/"), reachable=True)]
+        )
+        result = ConfigValidator().validate(config)
+        assert result.is_valid()
+        assert [w.path for w in result.warnings] == ["allowed[0].reachable"]
+
+    def test_validate_dependency_types_ignored(self):
+        config = Config(
+            forbidden=[
+                Rule(
+                    name="cycles",
+                    circular=True,
+                    dependency_types=[DependencyType.PRELOAD],
+                )
+            ]
+        )
+        result = ConfigValidator().validate(config)
+        assert [w.path for w in result.warnings] == ["forbidden[0].dependencyTypes"]
+
+    def test_validate_thresholds(self):
+        config = Config(
+            forbidden=[Rule(name="f", from_=PathMatcher(path="ui/"), max_depth=3)],
+            thresholds=[
+                Rule(name="ok", max_fan_in=10),
+                Rule(name="bad", max_fan_out=-1, max_depth="3"),
+                Rule(name="empty"),
+            ],
+        )
+        result = ConfigValidator().validate(config)
+        assert [e.path for e in result.errors] == [
+            "thresholds[1].maxFanOut",
+            "thresholds[1].maxDepth",
+        ]
+        assert [w.path for w in result.warnings] == [
+            "forbidden[0].maxDepth",
+            "thresholds[2]",
+        ]
+
+    def test_validate_layers(self):
+        config = Config(
+            layers=[
+                Layer(name="core", path="^res://core/"),
+                Layer(name="core", path="^res://ui/"),
+                Layer(name="scenes"),
+                Layer(name="", path="["),
+            ]
+        )
+        result = ConfigValidator().validate(config)
+        assert [e.path for e in result.errors] == [
+            "layers[1]",
+            "layers[2]",
+            "layers[3]",
+            "layers[3].path",
+        ]
+
     def test_validate_options_exclude(self):
         config = Config()
         config.options.exclude = ["[invalid"]
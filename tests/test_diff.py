@@ -0,0 +1,126 @@
+"""Tests for the snapshot diff."""
+
+import json
+
+from gdcruiser.analyzer import Analyzer
+from gdcruiser.cli import main
+from gdcruiser.diff import diff_snapshots, format_text
+
+
+def _write(root, files):
+    for name, text in files.items():
+        (root / name).write_text(text, encoding="utf-8")
+
+
+def _snapshot(root):
+    return Analyzer(root).analyze().to_dict()
+
+
+def _base_project(root):
+    _write(
+        root,
+        {
+            "a.gd": 'class_name A\nvar b = preload("res://b.gd")\n',
+            "b.gd": "class_name B\n",
+            "c.gd": 'var x = preload("res://b.gd")\n',
+        },
+    )
+
+
+def test_identical_snapshots(tmp_path):
+    _base_project(tmp_path)
+    snapshot = _snapshot(tmp_path)
+
+    diff = diff_snapshots(snapshot, snapshot)
+    assert diff.is_empty()
+    assert format_text(diff) == "No architectural changes.\n"
+
+
+def test_line_moves_are_not_changes(tmp_path):
+    _base_project(tmp_path)
+    old = _snapshot(tmp_path)
+    _write(tmp_path, {"a.gd": 'class_name A\n\n\nvar b = preload("res://b.gd")\n'})
+
+    assert diff_snapshots(old, _snapshot(tmp_path)).is_empty()
+
+
+def test_modules_and_edges_by_type(tmp_path):
+    _base_project(tmp_path)
+    old = _snapshot(tmp_path)
+    (tmp_path / "c.gd").unlink()
+    _write(
+        tmp_path,
+        {
+            "a.gd": "class_name A\nvar b: B\n",
+            "d.gd": 'var a = load("res://a.gd")\n',
+        },
+    )
+
+    diff = diff_snapshots(old, _snapshot(tmp_path))
+    assert diff.added_modules == ["res://d.gd"]
+    assert diff.removed_modules == ["res://c.gd"]
+    assert diff.added_edges == {
+        "class_ref": [("res://a.gd", "res://b.gd")],
+        "load": [("res://d.gd", "res://a.gd")],
+    }
+    assert diff.removed_edges == {
+        "preload": [("res://a.gd", "res://b.gd"), ("res://c.gd", "res://b.gd")]
+    }
+    # b.gd lost a dependent (c.gd) but a.gd still depends on it.
+    assert diff.metric_deltas["res://b.gd"]["afferent"] == (2, 1)
+
+
+def test_new_grown_and_resolved_cycles():
+    def snapshot(cycles):
+        return {"graph": {"modules": {}}, "cycles": cycles}
+
+    old = snapshot([["a", "b"], ["x", "y"], ["p", "q"], ["m", "n"]])
+    new = snapshot([["a", "b"], ["x", "y", "z"], ["p", "q", "m", "n"], ["s", "t"]])
+
+    diff = diff_snapshots(old, new)
+    changes = [(c.modules, c.added, c.grown) for c in diff.cycle_changes]
+    assert changes == [
+        (["x", "y", "z"], ["z"], True),
+        (["m", "n", "p", "q"], [], True),
+        (["s", "t"], ["s", "t"], False),
+    ]
+    assert diff.resolved_cycles == []
+    assert diff_snapshots(new, old).resolved_cycles == [["s", "t"]]
+
+
+def test_cli_diff(tmp_path, capsys):
+    _base_project(tmp_path)
+    old_path = tmp_path / "old.json"
+    old_path.write_text(json.dumps(_snapshot(tmp_path)), encoding="utf-8")
+    _write(tmp_path, {"b.gd": 'class_name B\nvar a = load("res://a.gd")\n'})
+    new_path = tmp_path / "new.json"
+    new_path.write_text(json.dumps(_snapshot(tmp_path)), encoding="utf-8")
+
+    assert main(["diff", str(old_path), str(new_path)]) == 1
+    out = capsys.readouterr().out
+    assert "+ res://b.gd --[load]--> res://a.gd" in out
+    assert "New cycle (2 modules):" in out
+
+    assert main(["diff", str(old_path), str(old_path), "-f", "json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["cycles"]["new"] == []
+
+
+def test_cli_diff_rejects_non_snapshot(tmp_path, capsys):
+    bogus = tmp_path / "bogus.json"
+    bogus.write_text("[]", encoding="utf-8")
+
+    assert main(["diff", str(bogus), str(bogus)]) == 1
+    assert "Cannot read snapshot" in capsys.readouterr().err
+
+
+def test_cli_analyzes_directory_named_diff(tmp_path, monkeypatch, capsys):
+    project = tmp_path / "diff"
+    project.mkdir()
+    _base_project(project)
+    monkeypatch.chdir(tmp_path)
+
+    main(["diff"])
+    out = capsys.readouterr().out
+    assert "GDScript Dependency Analysis" in out
+    assert "res://c.gd" in out
@@ -1,6 +1,14 @@
 from gdcruiser.graph.node import Module, Dependency, DependencyType
 from gdcruiser.graph.dependency import DependencyGraph
+from gdcruiser.graph.condensation import Condensation
+from gdcruiser.graph.csr import CSRGraph, strongly_connected_components
 from gdcruiser.graph.cycles import CycleDetector
+from gdcruiser.graph.dominators import DominatorTree
+from gdcruiser.graph.feedback import feedback_arc_set
+from gdcruiser.graph.hierarchy import InheritanceForest
+from gdcruiser.graph.metrics import GraphMetrics
+from gdcruiser.graph.packages import PackageGraph, depth_key, pattern_key
+from gdcruiser.graph.reachability import ReachabilityIndex
 
 
 class TestDependencyGraph:
@@ -51,6 +59,37 @@ class TestDependencyGraph:
         assert dependents[0][0] == "res://a.gd"
 
 
+class TestSubgraph:
+    def _graph(self):
+        # main -> menu -> hud -> theme, menu -> net (missing target: "gone")
+        return _cyclic_graph(
+            {
+                "main": [("menu", DependencyType.PRELOAD)],
+                "menu": [
+                    ("hud", DependencyType.PRELOAD),
+                    ("gone", DependencyType.LOAD),
+                ],
+                "hud": [("theme", DependencyType.CLASS_REF)],
+                "theme": [],
+                "other": [("theme", DependencyType.PRELOAD)],
+            }
+        )
+
+    def test_neighborhood_goes_both_directions(self):
+        graph = self._graph()
+        assert graph.neighborhood(["menu"], 0) == {"menu"}
+        assert graph.neighborhood(["menu"], 1) == {"main", "menu", "hud"}
+        assert graph.neighborhood(["menu"], 2) == {"main", "menu", "hud", "theme"}
+        assert len(graph.neighborhood(["menu"], None)) == 5
+        assert graph.neighborhood(["unknown"], 3) == set()
+
+    def test_subgraph_keeps_internal_and_external_edges(self):
+        sub = self._graph().subgraph({"menu", "hud"})
+        assert [m.path for m in sub.all_modules()] == ["menu", "hud"]
+        assert [d.target for d in sub.get_dependencies("menu")] == ["hud", "gone"]
+        assert sub.get_dependencies("hud") == []
+
+
 class TestCycleDetector:
     def test_no_cycles(self):
         graph = DependencyGraph()
@@ -123,3 +162,626 @@ class TestCycleDetector:
         cycles = detector.find_cycles()
         assert len(cycles) == 1
         assert set(cycles[0]) == {"res://a.gd", "res://b.gd", "res://c.gd"}
+
+
+def _cyclic_graph(edges: dict[str, list[tuple[str, DependencyType]]]):
+    graph = DependencyGraph()
+    for path, deps in edges.items():
+        graph.add_module(
+            Module(
+                path=path,
+                dependencies=[Dependency(target=t, dep_type=k) for t, k in deps],
+            )
+        )
+    return graph
+
+
+class TestElementaryCycles:
+    def test_enumerates_every_cycle_in_component(self):
+        # a <-> b and a -> b -> c -> a share one SCC but are distinct cycles.
+        graph = _cyclic_graph(
+            {
+                "a": [("b", DependencyType.PRELOAD)],
+                "b": [("a", DependencyType.CLASS_REF), ("c", DependencyType.LOAD)],
+                "c": [("a", DependencyType.EXTENDS_PATH)],
+            }
+        )
+        cycles = list(CycleDetector(graph).elementary_cycles())
+        assert sorted(sorted(c.modules) for c in cycles) == [
+            ["a", "b"],
+            ["a", "b", "c"],
+        ]
+
+    def test_edge_types_follow_cycle_order(self):
+        graph = _cyclic_graph(
+            {
+                "a": [("b", DependencyType.PRELOAD), ("b", DependencyType.CLASS_REF)],
+                "b": [("a", DependencyType.EXTENDS_CLASS)],
+            }
+        )
+        (cycle,) = CycleDetector(graph).elementary_cycles()
+        assert cycle.modules == ["a", "b"]
+        assert cycle.edge_types == [
+            [DependencyType.PRELOAD, DependencyType.CLASS_REF],
+            [DependencyType.EXTENDS_CLASS],
+        ]
+        assert cycle.to_dict()["edges"][1] == {
+            "from": "b",
+            "to": "a",
+            "types": ["extends_class"],
+        }
+
+    def test_complete_graph_cycle_count(self):
+        # K4 has 6 two-cycles, 8 three-cycles and 6 four-cycles.
+        nodes = ["a", "b", "c", "d"]
+        graph = _cyclic_graph(
+            {n: [(m, DependencyType.PRELOAD) for m in nodes if m != n] for n in nodes}
+        )
+        cycles = list(CycleDetector(graph).elementary_cycles())
+        lengths = sorted(len(c.modules) for c in cycles)
+        assert lengths == [2] * 6 + [3] * 8 + [4] * 6
+
+    def test_max_length_and_max_cycles(self):
+        nodes = ["a", "b", "c", "d"]
+        graph = _cyclic_graph(
+            {n: [(m, DependencyType.PRELOAD) for m in nodes if m != n] for n in nodes}
+        )
+        detector = CycleDetector(graph)
+        short = list(detector.elementary_cycles(max_length=3))
+        assert sorted(len(c.modules) for c in short) == [2] * 6 + [3] * 8
+        assert len(list(detector.elementary_cycles(max_cycles=5))) == 5
+
+    def test_self_loops_and_acyclic_graphs_yield_nothing(self):
+        graph = _cyclic_graph(
+            {"a": [("a", DependencyType.PRELOAD), ("b", DependencyType.PRELOAD)]}
+        )
+        graph.add_module(Module(path="b"))
+        assert list(CycleDetector(graph).elementary_cycles()) == []
+
+
+class TestTypedCycleDetection:
+    def _graph(self):
+        # a -preload-> b -class_ref-> a is a soft cycle; c <-extends-> d is hard.
+        return _cyclic_graph(
+            {
+                "a": [("b", DependencyType.PRELOAD)],
+                "b": [("a", DependencyType.CLASS_REF)],
+                "c": [("d", DependencyType.EXTENDS_PATH)],
+                "d": [("c", DependencyType.PRELOAD)],
+            }
+        )
+
+    def test_untyped_detector_sees_all_cycles(self):
+        cycles = CycleDetector(self._graph()).find_cycles()
+        assert sorted(sorted(c) for c in cycles) == [["a", "b"], ["c", "d"]]
+
+    def test_typed_detector_ignores_other_edges(self):
+        hard = {
+            DependencyType.PRELOAD,
+            DependencyType.EXTENDS_PATH,
+            DependencyType.EXTENDS_CLASS,
+        }
+        detector = CycleDetector(self._graph(), dep_types=hard)
+        assert [sorted(c) for c in detector.find_cycles()] == [["c", "d"]]
+        cycles = list(detector.elementary_cycles())
+        assert [sorted(c.modules) for c in cycles] == [["c", "d"]]
+
+
+class TestCondensation:
+    def _graph(self):
+        # scene -> player -> {entity, inventory}; entity <-> stats is a cycle.
+        return _cyclic_graph(
+            {
+                "scene": [("player", DependencyType.SCENE_SCRIPT)],
+                "player": [
+                    ("entity", DependencyType.EXTENDS_CLASS),
+                    ("inventory", DependencyType.PRELOAD),
+                    ("entity", DependencyType.CLASS_REF),
+                ],
+                "entity": [("stats", DependencyType.PRELOAD)],
+                "stats": [("entity", DependencyType.CLASS_REF)],
+                "inventory": [("missing", DependencyType.LOAD)],
+            }
+        )
+
+    def test_cycle_collapses_to_one_component(self):
+        condensation = Condensation.from_graph(self._graph())
+        assert condensation.component_count() == 4
+        assert [sorted(c) for c in condensation.cycles()] == [["entity", "stats"]]
+
+    def test_levels_are_longest_dependency_depth(self):
+        condensation = Condensation.from_graph(self._graph())
+        assert condensation.module_levels() == {
+            "scene": 2,
+            "player": 1,
+            "entity": 0,
+            "stats": 0,
+            "inventory": 0,
+        }
+        assert condensation.level("scene") == 2
+        assert condensation.depth() == 2
+
+    def test_load_order_puts_dependencies_first(self):
+        graph = self._graph()
+        order = Condensation.from_graph(graph).load_order()
+        position = {path: i for i, path in enumerate(order)}
+        assert sorted(order) == sorted(m.path for m in graph.all_modules())
+        for module in graph.all_modules():
+            for dep in module.dependencies:
+                if dep.target in position and {module.path, dep.target} != {
+                    "entity",
+                    "stats",
+                }:
+                    assert position[dep.target] < position[module.path]
+
+    def test_stages_group_by_level(self):
+        stages = Condensation.from_graph(self._graph()).stages()
+        assert [sorted(stage) for stage in stages] == [
+            ["entity", "inventory", "stats"],
+            ["player"],
+            ["scene"],
+        ]
+
+    def test_dag_edges_are_deduplicated(self):
+        condensation = Condensation.from_graph(self._graph())
+        player = condensation.component_of[condensation.csr.index["player"]]
+        assert len(condensation.dag_successors(player)) == 2
+
+    def test_empty_graph(self):
+        condensation = Condensation.from_graph(DependencyGraph())
+        assert condensation.depth() == 0
+        assert condensation.load_order() == []
+        assert condensation.stages() == []
+
+
+class TestTransitiveReduction:
+    def _graph(self):
+        # ui -> hud -> util and ui -> util (implied); util <-> log is a cycle.
+        return _cyclic_graph(
+            {
+                "ui": [
+                    ("hud", DependencyType.PRELOAD),
+                    ("util", DependencyType.CLASS_REF),
+                    ("log", DependencyType.LOAD),
+                ],
+                "hud": [("util", DependencyType.PRELOAD)],
+                "util": [("log", DependencyType.PRELOAD)],
+                "log": [("util", DependencyType.CLASS_REF)],
+            }
+        )
+
+    def test_drops_implied_arcs(self):
+        condensation = Condensation.from_graph(self._graph())
+        reduced = condensation.transitive_reduction()
+        assert sum(len(succs) for succs in reduced) == 2
+
+    def test_filter_keeps_cycle_edges(self):
+        csr = CSRGraph.from_graph(self._graph())
+        keep = Condensation(csr).reduction_filter()
+        kept = [
+            (csr.nodes[node], csr.nodes[csr.targets[edge]])
+            for node in range(csr.node_count())
+            for edge in csr.edge_range(node)
+            if keep[edge]
+        ]
+        assert kept == [
+            ("ui", "hud"),
+            ("hud", "util"),
+            ("util", "log"),
+            ("log", "util"),
+        ]
+
+    def test_reduction_preserves_reachability(self):
+        edges = {
+            f"m{i}": [
+                (f"m{j}", DependencyType.PRELOAD) for j in range(i) if i % (j + 2)
+            ]
+            for i in range(16)
+        }
+        graph = _cyclic_graph(edges)
+        csr = CSRGraph.from_graph(graph)
+        condensation = Condensation(csr)
+        keep = condensation.reduction_filter()
+        assert sum(keep) < csr.edge_count()
+
+        reduced = _cyclic_graph(
+            {
+                csr.nodes[node]: [
+                    (csr.nodes[csr.targets[e]], DependencyType.PRELOAD)
+                    for e in csr.edge_range(node)
+                    if keep[e]
+                ]
+                for node in range(csr.node_count())
+            }
+        )
+        before = ReachabilityIndex(condensation)
+        after = ReachabilityIndex(Condensation.from_graph(reduced))
+        for path in edges:
+            assert sorted(after.descendants(path)) == sorted(before.descendants(path))
+
+
+class TestReachabilityIndex:
+    def _index(self):
+        # ui -> helper -> net; helper <-> util cycle; net isolated downstream.
+        graph = _cyclic_graph(
+            {
+                "ui": [("helper", DependencyType.PRELOAD)],
+                "helper": [
+                    ("net", DependencyType.CLASS_REF),
+                    ("util", DependencyType.LOAD),
+                ],
+                "util": [("helper", DependencyType.CLASS_REF)],
+                "net": [],
+                "other": [],
+            }
+        )
+        return ReachabilityIndex(Condensation.from_graph(graph))
+
+    def test_transitive_reaches(self):
+        index = self._index()
+        assert index.reaches("ui", "net")
+        assert index.reaches("ui", "util")
+        assert not index.reaches("net", "ui")
+        assert not index.reaches("ui", "other")
+        assert not index.reaches("ui", "missing")
+
+    def test_self_reachability_only_on_cycles(self):
+        index = self._index()
+        assert index.reaches("helper", "helper")
+        assert not index.reaches("ui", "ui")
+
+    def test_descendants_and_ancestors(self):
+        index = self._index()
+        assert sorted(index.descendants("ui")) == ["helper", "net", "util"]
+        assert sorted(index.ancestors("net")) == ["helper", "ui", "util"]
+        assert index.descendants("net") == []
+
+    def test_impact_counts_exclude_self(self):
+        index = self._index()
+        assert index.ancestor_count("net") == 3
+        assert index.descendant_count("ui") == 3
+        # helper sits on a cycle with util but is not counted twice.
+        assert index.descendant_count("helper") == 2
+        assert index.impact()["other"] == {"dependents": 0, "dependencies": 0}
+
+    def test_reaches_any(self):
+        index = self._index()
+        assert index.reaches_any(["other", "ui"], ["net"])
+        assert not index.reaches_any(["net", "other"], ["ui", "helper"])
+
+    def test_shortest_paths(self):
+        index = self._index()
+        paths = index.shortest_paths("ui", index.mask(["net", "util", "other"]))
+        assert paths == {
+            "net": ["ui", "helper", "net"],
+            "util": ["ui", "helper", "util"],
+        }
+        # A module on a cycle is not its own target.
+        assert index.shortest_paths("helper", index.mask(["helper"])) == {}
+
+
+class TestGraphMetrics:
+    def _metrics(self, autoloads=()):
+        graph = _cyclic_graph(
+            {
+                "res://ui/menu.gd": [
+                    ("res://core/util.gd", DependencyType.PRELOAD),
+                    ("res://core/util.gd", DependencyType.CLASS_REF),
+                    ("res://bus.gd", DependencyType.CLASS_REF),
+                ],
+                "res://ui/hud.gd": [
+                    ("res://ui/menu.gd", DependencyType.LOAD),
+                    ("res://core/util.gd", DependencyType.CLASS_REF),
+                ],
+                "res://core/util.gd": [],
+                "res://bus.gd": [("res://core/util.gd", DependencyType.PRELOAD)],
+            }
+        )
+        return GraphMetrics(CSRGraph.from_graph(graph), autoloads=autoloads)
+
+    def test_coupling_counts_distinct_modules(self):
+        metrics = self._metrics().modules
+        menu = metrics["res://ui/menu.gd"]
+        assert (menu.afferent, menu.efferent) == (1, 2)
+        util = metrics["res://core/util.gd"]
+        assert (util.afferent, util.efferent) == (3, 0)
+
+    def test_instability(self):
+        metrics = self._metrics().modules
+        assert metrics["res://core/util.gd"].instability == 0.0
+        assert metrics["res://ui/hud.gd"].instability == 1.0
+        assert metrics["res://ui/menu.gd"].instability == 2 / 3
+
+    def test_directory_aggregation(self):
+        directories = self._metrics().directories
+        ui = directories["res://ui"]
+        # hud -> menu stays inside the directory.
+        assert ui.modules == 2
+        assert (ui.afferent, ui.efferent) == (0, 2)
+        assert directories["res://core"].afferent == 3
+        assert directories["res://"].modules == 1
+
+    def test_autoload_coupling(self):
+        metrics = self._metrics(autoloads=["res://bus.gd"])
+        assert metrics.modules["res://ui/menu.gd"].autoload_coupling == 1
+        assert metrics.modules["res://ui/hud.gd"].autoload_coupling == 0
+        assert metrics.directories["res://ui"].autoload_coupling == 1
+
+    def test_pagerank_favours_depended_on_modules(self):
+        metrics = self._metrics().modules
+        ranks = {path: m.pagerank for path, m in metrics.items()}
+        assert abs(sum(ranks.values()) - 1.0) < 1e-6
+        assert max(ranks, key=ranks.get) == "res://core/util.gd"
+        assert ranks["res://ui/hud.gd"] == min(ranks.values())
+
+
+class TestDominatorTree:
+    def _tree(self, roots=("main",)):
+        #   main -> level -> {enemy, player} -> entity ; main -> hud
+        #   bus (autoload) -> hud ; orphan is never loaded
+        graph = _cyclic_graph(
+            {
+                "main": [
+                    ("level", DependencyType.PRELOAD),
+                    ("hud", DependencyType.PRELOAD),
+                ],
+                "level": [
+                    ("enemy", DependencyType.PRELOAD),
+                    ("player", DependencyType.LOAD),
+                ],
+                "enemy": [("entity", DependencyType.EXTENDS_CLASS)],
+                "player": [("entity", DependencyType.EXTENDS_CLASS)],
+                "entity": [("level", DependencyType.CLASS_REF)],
+                "hud": [],
+                "bus": [("hud", DependencyType.CLASS_REF)],
+                "orphan": [("entity", DependencyType.PRELOAD)],
+            }
+        )
+        return DominatorTree(CSRGraph.from_graph(graph), roots)
+
+    def test_immediate_dominators(self):
+        tree = self._tree()
+        assert tree.immediate_dominator("main") is None
+        assert tree.immediate_dominator("level") == "main"
+        # Two paths to entity meet again at level.
+        assert tree.immediate_dominator("entity") == "level"
+        assert tree.immediate_dominator("player") == "level"
+
+    def test_dominates(self):
+        tree = self._tree()
+        assert tree.dominates("level", "entity")
+        assert tree.dominates("main", "player")
+        assert tree.dominates("enemy", "enemy")
+        assert not tree.dominates("enemy", "entity")
+
+    def test_multiple_roots(self):
+        tree = self._tree(roots=("main", "bus"))
+        # hud is reached from both entry points, so only the root dominates it.
+        assert tree.immediate_dominator("hud") is None
+        assert not tree.dominates("main", "hud")
+        assert tree.dominated_count("main") == 4
+
+    def test_unreachable_modules(self):
+        tree = self._tree()
+        assert sorted(tree.unreachable()) == ["bus", "orphan"]
+        assert not tree.is_reachable("orphan")
+        assert tree.dominated_count("orphan") == 0
+        assert tree.immediate_dominator("orphan") is None
+
+    def test_chokepoints(self):
+        tree = self._tree()
+        assert tree.chokepoints() == [("main", 5), ("level", 3)]
+        assert tree.chokepoints(1) == [("main", 5)]
+
+    def test_no_roots(self):
+        tree = self._tree(roots=())
+        assert tree.chokepoints() == []
+        assert len(tree.unreachable()) == 8
+
+
+class TestFeedbackArcSet:
+    def _breaks(self, graph, dep_types=None):
+        csr = CSRGraph.from_graph(graph)
+        keep = csr.edge_filter(dep_types)
+        (scc,) = [c for c in strongly_connected_components(csr, keep) if len(c) > 1]
+        return feedback_arc_set(csr, scc, keep)
+
+    def test_prefers_cheap_edge_types(self):
+        graph = _cyclic_graph(
+            {
+                "player": [("entity", DependencyType.EXTENDS_CLASS)],
+                "entity": [("world", DependencyType.PRELOAD)],
+                "world": [("player", DependencyType.CLASS_REF)],
+            }
+        )
+        (cut,) = self._breaks(graph)
+        assert (cut.source, cut.target) == ("world", "player")
+        assert cut.types == [DependencyType.CLASS_REF]
+        assert cut.cost == 1
+
+    def test_breaks_every_cycle(self):
+        edges = {
+            f"m{i}": [
+                (f"m{(i + 1) % 12}", DependencyType.PRELOAD),
+                (f"m{(i * 5) % 12}", DependencyType.CLASS_REF),
+            ]
+            for i in range(12)
+        }
+        graph = _cyclic_graph(edges)
+        breaks = self._breaks(graph)
+        assert breaks == sorted(breaks, key=lambda b: b.cost)
+
+        cut = {(b.source, b.target) for b in breaks}
+        for module in graph.all_modules():
+            module.dependencies = [
+                d for d in module.dependencies if (module.path, d.target) not in cut
+            ]
+        assert CycleDetector(graph).find_cycles() == []
+
+    def test_reports_all_lines_of_a_cut_edge(self):
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="a",
+                dependencies=[
+                    Dependency(target="b", dep_type=DependencyType.LOAD, line=4),
+                    Dependency(target="b", dep_type=DependencyType.LOAD, line=9),
+                ],
+            )
+        )
+        graph.add_module(
+            Module(
+                path="b",
+                dependencies=[
+                    Dependency(target="a", dep_type=DependencyType.EXTENDS_PATH)
+                ],
+            )
+        )
+        (cut,) = self._breaks(graph)
+        assert (cut.source, cut.lines, cut.cost) == ("a", [4, 9], 2)
+
+    def test_respects_edge_filter(self):
+        graph = _cyclic_graph(
+            {
+                "a": [
+                    ("b", DependencyType.PRELOAD),
+                    ("b", DependencyType.CLASS_REF),
+                ],
+                "b": [("a", DependencyType.PRELOAD)],
+            }
+        )
+        (cut,) = self._breaks(graph, dep_types=[DependencyType.PRELOAD])
+        assert cut.types == [DependencyType.PRELOAD]
+
+
+class TestPackageGraph:
+    def _graph(self):
+        return _cyclic_graph(
+            {
+                "res://ui/menu.gd": [
+                    ("res://core/util.gd", DependencyType.PRELOAD),
+                    ("res://ui/hud.gd", DependencyType.PRELOAD),
+                ],
+                "res://ui/hud.gd": [
+                    ("res://core/util.gd", DependencyType.CLASS_REF),
+                    ("res://net/client.gd", DependencyType.LOAD),
+                ],
+                "res://core/util.gd": [],
+                "res://core/io/file.gd": [("res://ui/theme.gd", DependencyType.LOAD)],
+                "res://ui/theme.gd": [],
+                "res://net/client.gd": [("res://core/io/file.gd", DependencyType.LOAD)],
+                "res://main.gd": [("res://ui/menu.gd", DependencyType.PRELOAD)],
+            }
+        )
+
+    def test_depth_key(self):
+        key = depth_key(1)
+        assert key("res://ui/menus/main.gd") == "res://ui"
+        assert key("res://main.gd") == "res://"
+        assert depth_key(2)("res://ui/menus/main.gd") == "res://ui/menus"
+        assert depth_key(3)("res://ui/main.gd") == "res://ui"
+
+    def test_pattern_key(self):
+        key = pattern_key(r"^res://(?:addons/)?([^/]+)/")
+        assert key("res://addons/dialogue/box.gd") == "dialogue"
+        assert key("res://ui/menu.gd") == "ui"
+        assert key("res://main.gd") == "res://main.gd"
+
+    def test_pattern_key_unmatched_optional_group(self):
+        key = pattern_key(r"^res://(addons)?")
+        assert key("res://addons/box.gd") == "addons"
+        assert key("res://ui/menu.gd") == "res://"
+        assert pattern_key(r"(x)?")("res://ui/menu.gd") == "res://ui/menu.gd"
+        packages = PackageGraph(CSRGraph.from_graph(self._graph()), key)
+        assert packages.package_count() == 1
+        assert packages.to_dict()["packages"]["res://"]["modules"] == 7
+
+    def test_weighted_edges(self):
+        packages = PackageGraph(CSRGraph.from_graph(self._graph()), depth_key(1))
+        edges = {(a, b): w for a, b, w in packages.edges()}
+        assert edges[("res://ui", "res://core")] == 2
+        assert edges[("res://", "res://ui")] == 1
+        assert packages.package_count() == 4
+        ui = packages.csr.index["res://ui"]
+        assert packages.internal[ui] == 1
+        assert packages.package_of["res://core/io/file.gd"] == "res://core"
+
+    def test_package_cycles(self):
+        csr = CSRGraph.from_graph(self._graph())
+        # Module-level the graph is acyclic...
+        assert CycleDetector(self._graph(), csr=csr).find_cycles() == []
+        # ...but ui -> net -> core/io -> ui closes between packages.
+        cycles = PackageGraph(csr, depth_key(1)).cycles()
+        assert [sorted(c) for c in cycles] == [["res://core", "res://net", "res://ui"]]
+        cycles = PackageGraph(csr, depth_key(2)).cycles()
+        assert [sorted(c) for c in cycles] == [
+            ["res://core/io", "res://net", "res://ui"]
+        ]
+
+    def test_package_metrics(self):
+        packages = PackageGraph(CSRGraph.from_graph(self._graph()), depth_key(1))
+        metrics = packages.metrics()
+        assert (metrics["res://ui"].afferent, metrics["res://ui"].efferent) == (2, 2)
+        data = packages.to_dict()
+        assert data["packages"]["res://core"]["modules"] == 2
+        assert GraphMetrics(packages.csr, directories=False).directories == {}
+
+
+class TestInheritanceForest:
+    def _forest(self):
+        return InheritanceForest(
+            _cyclic_graph(
+                {
+                    "entity": [("util", DependencyType.PRELOAD)],
+                    "enemy": [("entity", DependencyType.EXTENDS_CLASS)],
+                    "boss": [
+                        ("enemy", DependencyType.EXTENDS_PATH),
+                        ("entity", DependencyType.CLASS_REF),
+                    ],
+                    "minion": [("enemy", DependencyType.EXTENDS_CLASS)],
+                    "player": [("entity", DependencyType.EXTENDS_CLASS)],
+                    "ui": [("Control", DependencyType.EXTENDS_CLASS)],
+                    "util": [],
+                }
+            )
+        )
+
+    def test_only_extends_edges_form_the_forest(self):
+        forest = self._forest()
+        assert forest.roots == ["entity"]
+        assert forest.class_count() == 5
+        assert "util" not in forest
+        assert "ui" not in forest
+
+    def test_depth_and_superclasses(self):
+        forest = self._forest()
+        assert forest.depth("boss") == 2
+        assert forest.depth("entity") == 0
+        assert forest.max_depth() == 2
+        assert forest.superclasses("boss") == ["enemy", "entity"]
+
+    def test_subclass_queries(self):
+        forest = self._forest()
+        assert forest.is_subclass("boss", "entity")
+        assert forest.is_subclass("minion", "enemy")
+        assert not forest.is_subclass("player", "enemy")
+        assert not forest.is_subclass("enemy", "enemy")
+        assert forest.subclasses("enemy") == ["boss", "minion"]
+        assert forest.subclass_count("entity") == 4
+        assert forest.children("entity") == ["enemy", "player"]
+        assert forest.subclasses("util") == []
+
+    def test_extends_cycle_is_broken(self):
+        forest = InheritanceForest(
+            _cyclic_graph(
+                {
+                    "a": [("b", DependencyType.EXTENDS_PATH)],
+                    "b": [("a", DependencyType.EXTENDS_PATH)],
+                    "c": [("a", DependencyType.EXTENDS_PATH)],
+                }
+            )
+        )
+        # b -> a closes the cycle, so b becomes the root.
+        assert forest.cyclic == ["b"]
+        assert forest.roots == ["b"]
+        assert forest.superclasses("c") == ["a", "b"]
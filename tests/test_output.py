@@ -1,3 +1,5 @@
+import csv
+import io
 import json
 from pathlib import Path
 
@@ -6,6 +8,10 @@ from gdcruiser.output.text import TextFormatter
 from gdcruiser.output.json import JsonFormatter
 from gdcruiser.output.dot import DotFormatter
 from gdcruiser.output.mermaid import MermaidFormatter
+from gdcruiser.output import dsm
+from gdcruiser.output.dsm import DsmFormatter
+from gdcruiser.config import Rule
+from gdcruiser.rules.models import RuleCheckResult, RuleStats, Violation
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -32,6 +38,87 @@ class TestTextFormatter:
 
         assert "CIRCULAR DEPENDENCIES" in output
 
+    def test_format_top_impact(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        output = TextFormatter(top_impact=3).format(result)
+        section = output.split("TOP IMPACT (3 modules)")[1].split(
+            "MODULE DEPENDENCIES"
+        )[0]
+        rows = [line for line in section.splitlines() if "res://" in line]
+        assert len(rows) == 3
+        counts = [int(row.split()[0]) for row in rows]
+        assert counts == sorted(counts, reverse=True)
+
+    def test_format_without_top_impact(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        assert "TOP IMPACT" not in TextFormatter().format(result)
+
+    def test_format_cycle_breaks(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        output = TextFormatter(cycle_breaks=True).format(result)
+        assert "SUGGESTED CYCLE BREAKS" in output
+        assert "Cycle 1: cut 1 edges (cost 3)" in output
+        assert "--[preload]--> res://cycle_" in output
+        assert "SUGGESTED CYCLE BREAKS" not in TextFormatter().format(result)
+
+    def test_format_hierarchy(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        output = TextFormatter(hierarchy=True).format(result)
+        section = output.split("CLASS HIERARCHY")[1].split("MODULE DEPENDENCIES")[0]
+        assert "  res://base_entity.gd (BaseEntity)" in section
+        assert "    res://enemy.gd (Enemy)" in section
+        assert "CLASS HIERARCHY" not in TextFormatter().format(result)
+
+    def test_format_rule_stats(self):
+        result = Analyzer(FIXTURES).analyze()
+        rule_result = RuleCheckResult(
+            stats=[
+                RuleStats(rule="fast", rule_type="forbidden", seconds=0.001),
+                RuleStats(rule="slow", rule_type="allowed", seconds=0.5, edges=7),
+            ]
+        )
+
+        output = TextFormatter(rule_stats=True).format(result, rule_result)
+        section = output.split("RULE STATS (2 rules)")[1]
+        rows = [line.split() for line in section.splitlines() if "(" in line]
+        assert rows == [
+            ["500.00", "0", "7", "0", "slow", "(allowed)"],
+            ["1.00", "0", "0", "0", "fast", "(forbidden)"],
+        ]
+        assert "RULE STATS" not in TextFormatter().format(result, rule_result)
+
+    def test_format_suppressed_violations(self):
+        result = Analyzer(FIXTURES).analyze()
+        rule = Rule(name="no-deps")
+        rule_result = RuleCheckResult(
+            violations=[
+                Violation(rule=rule, rule_type="forbidden", from_module="res://a.gd")
+            ],
+            stats=[RuleStats(rule="no-deps", rule_type="forbidden", suppressed=4)],
+            stopped=True,
+        )
+
+        output = TextFormatter().format(result, rule_result)
+        assert "RULE VIOLATIONS (5 errors, 0 warnings)" in output
+        assert "stopped at the first violation" in output
+        assert "    ... and 4 more" in output
+
+    def test_format_chokepoints_without_entry_points(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        output = TextFormatter(chokepoints=5).format(result)
+        assert "CHOKEPOINTS (0 modules)" in output
+        assert "no main scene or autoloads" in output
+
 
 class TestJsonFormatter:
     def test_format_valid_json(self):
@@ -58,6 +145,57 @@ class TestJsonFormatter:
         assert "modules" in data["graph"]
         assert len(data["graph"]["modules"]) > 0
 
+    def test_format_contains_topology(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        data = json.loads(JsonFormatter().format(result))
+        topology = data["topology"]
+        order = topology["load_order"]
+        assert sorted(order) == sorted(data["graph"]["modules"])
+        assert order.index("res://base_entity.gd") < order.index("res://player.gd")
+        assert topology["levels"]["res://player.tscn"] > 0
+        assert topology["depth"] == max(topology["levels"].values())
+
+    def test_format_contains_impact(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        data = json.loads(JsonFormatter().format(result))
+        impact = data["impact"]["res://base_entity.gd"]
+        # player.gd, enemy.gd and the scenes/resources above them.
+        assert impact["dependents"] >= 2
+        assert data["impact"]["res://game_manager.gd"]["dependents"] == 0
+
+    def test_format_contains_cycle_breaks(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        data = json.loads(JsonFormatter().format(result))
+        assert len(data["cycle_breaks"]) == len(data["cycles"])
+        (cut,) = data["cycle_breaks"][0]
+        assert cut["types"] == ["preload"]
+        assert cut["lines"] == [4]
+
+    def test_format_contains_hierarchy(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        data = json.loads(JsonFormatter().format(result))
+        enemy = data["hierarchy"]["classes"]["res://enemy.gd"]
+        assert enemy == {"extends": "res://base_entity.gd", "depth": 1, "subclasses": 0}
+        assert data["hierarchy"]["classes"]["res://base_entity.gd"]["subclasses"] >= 2
+
+    def test_format_contains_metrics(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        data = json.loads(JsonFormatter().format(result))
+        metrics = data["metrics"]["modules"]["res://game_manager.gd"]
+        assert metrics["afferent"] == 0
+        assert metrics["instability"] == 1.0
+        assert data["metrics"]["directories"]["res://"]["modules"] > 1
+
 
 class TestDotFormatter:
     def test_format_valid_dot(self):
@@ -82,6 +220,17 @@ class TestDotFormatter:
         # Should have edge declarations
         assert "->" in output
 
+    def test_format_reduced(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        full = DotFormatter().format(result)
+        reduced = DotFormatter(reduce=True).format(result)
+        assert 0 < reduced.count(" -> ") < full.count(" -> ")
+        # Cycle edges survive the reduction.
+        assert '"res://cycle_a.gd" -> "res://cycle_b.gd"' in reduced
+        assert '"res://cycle_b.gd" -> "res://cycle_a.gd"' in reduced
+
 
 class TestMermaidFormatter:
     def test_format_valid_mermaid(self):
@@ -107,3 +256,69 @@ class TestMermaidFormatter:
         assert "-->" in output
         # Should have node labels
         assert '["' in output
+
+    def test_format_reduced(self):
+        analyzer = Analyzer(FIXTURES)
+        result = analyzer.analyze()
+
+        full = MermaidFormatter().format(result)
+        reduced = MermaidFormatter(reduce=True).format(result)
+        assert reduced.count("-->") < full.count("-->")
+
+
+class TestDsmFormatter:
+    def _rows(self):
+        result = Analyzer(FIXTURES).analyze()
+        return list(csv.reader(DsmFormatter().format(result).splitlines()))
+
+    def test_square_matrix(self):
+        header, *rows = self._rows()
+        assert header[:4] == ["#", "module", "level", "cycle"]
+        assert len(header) == 4 + len(rows)
+        assert all(len(row) == len(header) for row in rows)
+
+    def test_rows_ordered_by_level_with_cycle_blocks(self):
+        _, *rows = self._rows()
+        levels = [int(row[2]) for row in rows]
+        assert levels == sorted(levels)
+        blocks = [i for i, row in enumerate(rows) if row[3]]
+        assert len(blocks) == 2
+        assert blocks[1] == blocks[0] + 1
+        assert rows[blocks[0]][3] == rows[blocks[1]][3] == "C1"
+
+    def test_cells_count_dependencies_by_type(self):
+        _, *rows = self._rows()
+        index = {row[1]: i for i, row in enumerate(rows)}
+        player = rows[index["res://player.gd"]]
+        assert player[4 + index["res://inventory.gd"]] == "preload:1"
+        assert player[4 + index["res://base_entity.gd"]] == "extends_class:1"
+        # Outside cycle blocks, marks only sit below the diagonal.
+        for i, row in enumerate(rows):
+            for j, cell in enumerate(row[4:]):
+                if cell and not row[3]:
+                    assert j < i
+
+    def test_sparse_layout(self):
+        result = Analyzer(FIXTURES).analyze()
+        _, *dense = csv.reader(DsmFormatter("dense").format(result).splitlines())
+        header, *cells = csv.reader(DsmFormatter("sparse").format(result).splitlines())
+        assert header == ["row", "col", "from", "to", "count"]
+        expected = [
+            [str(i + 1), str(j + 1), row[1], dense[j][1], cell]
+            for i, row in enumerate(dense)
+            for j, cell in enumerate(row[4:])
+            if cell
+        ]
+        assert cells == expected
+
+    def test_auto_layout_goes_sparse_on_large_graphs(self, monkeypatch):
+        result = Analyzer(FIXTURES).analyze()
+        assert DsmFormatter().format(result).startswith("#,module")
+        monkeypatch.setattr(dsm, "DENSE_LIMIT", 3)
+        assert DsmFormatter().format(result).startswith("row,col")
+
+    def test_write_streams_rows(self):
+        result = Analyzer(FIXTURES).analyze()
+        out = io.StringIO()
+        DsmFormatter().write(out, result)
+        assert out.getvalue() == DsmFormatter().format(result)
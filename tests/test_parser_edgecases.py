@@ -96,6 +96,55 @@ class TestLineNumbersPreserved:
         assert preload[0].line == 6
 
 
+class TestAggregatedEdges:
+    def test_repeated_preloads_become_one_edge(self, tmp_path):
+        source = (
+            "extends Node\n"  # 1
+            'var a = preload("res://bullet.tscn")\n'  # 2
+            "func fire():\n"  # 3
+            '    add_child(preload("res://bullet.tscn").instantiate())\n'  # 4
+            '    var b = load("res://bullet.tscn")\n'  # 5
+            '    add_child(preload("res://bullet.tscn").instantiate())\n'  # 6
+        )
+        module = _parse(tmp_path, source)
+        preload = [
+            d for d in module.dependencies if d.dep_type == DependencyType.PRELOAD
+        ]
+        assert len(preload) == 1
+        assert preload[0].lines == [2, 4, 6]
+        assert preload[0].count == 3
+        assert preload[0].line == 2
+        # Same target, different type: its own edge.
+        assert _targets(module, DependencyType.LOAD) == ["res://bullet.tscn"]
+
+    def test_class_refs_record_every_line(self, tmp_path):
+        source = (
+            "extends Node\n"  # 1
+            "var a: Player\n"  # 2
+            "func f(p: Player) -> Player:\n"  # 3
+            "    return p as Player\n"  # 4
+        )
+        module = _parse(tmp_path, source)
+        (ref,) = [
+            d for d in module.dependencies if d.dep_type == DependencyType.CLASS_REF
+        ]
+        assert ref.target == "Player"
+        assert ref.lines == [2, 3, 4]
+
+    def test_edges_merged_after_resolution(self, tmp_path):
+        table = SymbolTable()
+        table.register("Player", "res://player.gd")
+        table.register("Hero", "res://player.gd")
+        parser = GDScriptParser(table)
+        f = tmp_path / "script.gd"
+        f.write_text("extends Node\nvar a: Player\nvar b: Hero\n", encoding="utf-8")
+        module = parser.parse(f, tmp_path)
+        parser.resolve_class_dependencies(module)
+
+        (ref,) = module.dependencies
+        assert (ref.target, ref.lines) == ("res://player.gd", [2, 3])
+
+
 class TestBuiltinExtends:
     def test_extends_known_builtin_not_a_dependency(self, tmp_path):
         module = _parse(tmp_path, "extends PhysicsBody2D\n")
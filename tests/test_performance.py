@@ -1,5 +1,8 @@
 """Tests for the reverse-dependents index, deep-graph cycles, and scanner."""
 
+import random
+import time
+
 from gdcruiser.graph.cycles import CycleDetector
 from gdcruiser.graph.dependency import DependencyGraph
 from gdcruiser.graph.node import Dependency, DependencyType, Module
@@ -24,6 +27,17 @@ class TestDependentsIndex:
         g.add_module(Module(path="a"))
         assert g.get_dependents("a") == []
 
+    def test_edges_by_type(self):
+        g = DependencyGraph()
+        load = Dependency(target="c", dep_type=DependencyType.LOAD)
+        g.add_module(Module(path="a", dependencies=[_dep("b"), load]))
+        assert [
+            (s, d.target) for s, d in g.get_edges_by_type(DependencyType.PRELOAD)
+        ] == [("a", "b")]
+        g.add_module(Module(path="b", dependencies=[_dep("c")]))
+        assert len(g.get_edges_by_type(DependencyType.PRELOAD)) == 2  # rebuilt
+        assert g.get_edges_by_type(DependencyType.EXTENDS_PATH) == []
+
     def test_index_invalidated_on_add(self):
         g = DependencyGraph()
         g.add_module(Module(path="a", dependencies=[_dep("c")]))
@@ -52,6 +66,24 @@ class TestDeepCycles:
         assert len(cycles) == 1
         assert len(cycles[0]) == n
 
+    def test_bounded_elementary_cycles_on_large_scc(self):
+        # One 5000-module SCC (a ring plus random edges): a length-bounded
+        # enumeration must not cost a pass over the component per module.
+        rng = random.Random(7)
+        g = DependencyGraph()
+        n = 5000
+        for i in range(n):
+            targets = {(i + 1) % n} | {rng.randrange(n) for _ in range(8)}
+            targets.discard(i)
+            deps = [_dep(f"m{t}") for t in sorted(targets)]
+            g.add_module(Module(path=f"m{i}", dependencies=deps))
+        detector = CycleDetector(g)
+        start = time.perf_counter()
+        cycles = list(detector.elementary_cycles(max_length=2, max_cycles=1000))
+        assert time.perf_counter() - start < 5.0
+        assert cycles
+        assert all(len(c.modules) == 2 for c in cycles)
+
 
 class TestScannerSinglePass:
     def test_buckets_by_suffix(self, tmp_path):
@@ -1,9 +1,18 @@
 """Tests for rule evaluation."""
 
-from gdcruiser.config import Config, ConfigOptions, PathMatcher, Rule, Severity
+from gdcruiser.config import (
+    Config,
+    ConfigOptions,
+    Layer,
+    PathMatcher,
+    Rule,
+    Severity,
+)
+from gdcruiser.graph.condensation import Condensation
 from gdcruiser.graph.dependency import DependencyGraph
 from gdcruiser.graph.node import Dependency, DependencyType, Module
-from gdcruiser.rules import PathMatcherCompiled, RuleEngine, Violation
+from gdcruiser.graph.reachability import ReachabilityIndex
+from gdcruiser.rules import PathMatcherCompiled, RuleEngine, RuleMatrix, Violation
 from gdcruiser.rules.models import RuleCheckResult
 
 
@@ -32,6 +41,20 @@ class TestPathMatcherCompiled:
         assert not matcher.matches("res://ui/test_button.gd")
         assert not matcher.matches("res://core/player.gd")
 
+    def test_back_references(self):
+        source = PathMatcherCompiled(PathMatcher(path="^res://features/([^/]+)/"))
+        captures = source.captures("res://features/a.b/main.gd")
+        assert captures == ("a.b",)
+        assert source.captures("res://core/main.gd") == ()
+
+        matcher = PathMatcherCompiled(PathMatcher(pathNot="^res://features/$1/"))
+        assert matcher.has_back_references
+        assert not matcher.matches("res://features/a.b/x.gd", captures)
+        # The captured value is matched literally.
+        assert matcher.matches("res://features/aXb/x.gd", captures)
+        # Without a capture, a back-reference matches nothing.
+        assert matcher.matches("res://features/a.b/x.gd")
+
 
 class TestRuleCheckResult:
     def test_empty_result(self):
@@ -421,3 +444,639 @@ class TestRuleEngine:
         engine = RuleEngine(config, graph)
         result = engine.check_all()
         assert len(result.violations) == 0
+
+
+class TestRuleMatrix:
+    def test_identical_patterns_compiled_once(self):
+        rules = [
+            Rule(
+                name="a",
+                from_=PathMatcher(path="^res://ui/"),
+                to=PathMatcher(path="^res://core/"),
+            ),
+            Rule(
+                name="b",
+                from_=PathMatcher(path="^res://ui/"),
+                to=PathMatcher(pathNot="^res://ui/"),
+            ),
+        ]
+        matrix = RuleMatrix(rules, exclude=["^res://core/"])
+        assert matrix.pattern_count() == 2
+
+    def test_rule_masks(self):
+        rules = [
+            Rule(
+                name="a",
+                from_=PathMatcher(path="^res://ui/"),
+                to=PathMatcher(path="^res://core/"),
+            ),
+            Rule(name="b", from_=PathMatcher(path="^res://", pathNot="test")),
+        ]
+        matrix = RuleMatrix(rules, exclude=["^res://addons/"])
+        # Rule b's empty 'to' matches every target.
+        assert matrix.classify("res://ui/button.gd") == (0b11, 0b10)
+        assert matrix.classify("res://core/engine.gd") == (0b10, 0b11)
+        assert matrix.classify("res://ui/test_button.gd") == (0b01, 0b10)
+        assert matrix.classify("res://addons/plugin.gd") is None
+        assert matrix.is_excluded("res://addons/plugin.gd")
+
+    def test_prepare_matches_classify(self):
+        rules = [Rule(name="a", from_=PathMatcher(path="^res://ui/"), to=None)]
+        paths = ["res://ui/button.gd", "res://core/engine.gd", "res://addons/x.gd"]
+        prepared = RuleMatrix(rules, exclude=["^res://addons/"])
+        prepared.prepare(paths)
+        matrix = RuleMatrix(rules, exclude=["^res://addons/"])
+        assert [prepared.classify(p) for p in paths] == [
+            matrix.classify(p) for p in paths
+        ]
+        assert prepared.rule_time(0) > 0
+        assert list(prepared.exclude_time()) == ["^res://addons/"]
+
+
+class TestRegexBudget:
+    def _engine(self, budget: float) -> RuleEngine:
+        config = Config(
+            forbidden=[
+                Rule(
+                    name="ui-not-core",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                )
+            ],
+            options=ConfigOptions(exclude=["^res://addons/"], regex_budget=budget),
+        )
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="res://ui/menu.gd",
+                dependencies=[
+                    Dependency(target="res://core/a.gd", dep_type=DependencyType.LOAD)
+                ],
+            )
+        )
+        return RuleEngine(config, graph)
+
+    def test_within_budget(self):
+        result = self._engine(1.0).check_all()
+        assert len(result.violations) == 1
+        assert result.slow_rules == {}
+        assert result.to_dict()["slow_rules"] == {}
+
+    def test_slow_rules_reported_by_name(self):
+        result = self._engine(1e-12).check_all()
+        assert set(result.slow_rules) == {
+            "ui-not-core",
+            "options.exclude '^res://addons/'",
+        }
+
+
+class TestRuleEngineSinglePass:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="res://ui/button.gd",
+                dependencies=[
+                    Dependency(
+                        target="res://core/engine.gd", dep_type=DependencyType.PRELOAD
+                    ),
+                    Dependency(
+                        target="res://data/items.gd", dep_type=DependencyType.LOAD
+                    ),
+                ],
+            )
+        )
+        graph.add_module(
+            Module(
+                path="res://ui/menu.gd",
+                dependencies=[
+                    Dependency(
+                        target="res://core/engine.gd", dep_type=DependencyType.PRELOAD
+                    )
+                ],
+            )
+        )
+        graph.add_module(Module(path="res://core/engine.gd"))
+        return graph
+
+    def test_violations_grouped_in_rule_order(self):
+        config = Config(
+            forbidden=[
+                Rule(
+                    name="no-ui-to-core",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+            ],
+            allowed=[
+                Rule(
+                    name="ui-to-core-only",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+            ],
+            required=[
+                Rule(
+                    name="ui-needs-data",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://data/"),
+                ),
+            ],
+        )
+        result = RuleEngine(config, self._graph()).check_all()
+        assert [
+            (v.rule.name, v.from_module, v.to_module) for v in result.violations
+        ] == [
+            ("no-ui-to-core", "res://ui/button.gd", "res://core/engine.gd"),
+            ("no-ui-to-core", "res://ui/menu.gd", "res://core/engine.gd"),
+            ("ui-to-core-only", "res://ui/button.gd", "res://data/items.gd"),
+            ("ui-needs-data", "res://ui/menu.gd", "^res://data/"),
+        ]
+
+    def test_excluded_target_does_not_satisfy_required(self):
+        config = Config(
+            required=[
+                Rule(
+                    name="ui-needs-core",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+            ],
+            options=ConfigOptions(exclude=["engine"]),
+        )
+        result = RuleEngine(config, self._graph()).check_all()
+        assert sorted(v.from_module for v in result.violations) == [
+            "res://ui/button.gd",
+            "res://ui/menu.gd",
+        ]
+
+    def test_circular_rule_without_cycles(self):
+        config = Config(
+            forbidden=[
+                Rule(
+                    name="no-cycles", from_=PathMatcher(path="^res://"), circular=True
+                ),
+            ]
+        )
+        assert RuleEngine(config, self._graph()).check_all(cycles=[]).violations == []
+
+
+class TestReachableRules:
+    def _graph(self) -> DependencyGraph:
+        # ui/menu -> ui/helper -> net/client -> net/socket
+        graph = DependencyGraph()
+        chain = [
+            "res://ui/menu.gd",
+            "res://ui/helper.gd",
+            "res://net/client.gd",
+            "res://net/socket.gd",
+        ]
+        for path, target in zip(chain, chain[1:] + [None]):
+            deps = [Dependency(target=target, dep_type=DependencyType.PRELOAD)]
+            graph.add_module(Module(path=path, dependencies=deps if target else []))
+        return graph
+
+    def _config(self, reachable: bool) -> Config:
+        return Config(
+            forbidden=[
+                Rule(
+                    name="ui-not-net",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://net/"),
+                    reachable=reachable,
+                )
+            ]
+        )
+
+    def test_direct_rule_misses_transitive_dependency(self):
+        engine = RuleEngine(self._config(reachable=False), self._graph())
+        result = engine.check_all()
+        assert [(v.from_module, v.to_module) for v in result.violations] == [
+            ("res://ui/helper.gd", "res://net/client.gd")
+        ]
+
+    def test_reachable_rule_reports_shortest_path(self):
+        engine = RuleEngine(self._config(reachable=True), self._graph())
+        violations = engine.check_all().violations
+        assert len(violations) == 4
+        menu_socket = next(
+            v
+            for v in violations
+            if v.from_module == "res://ui/menu.gd"
+            and v.to_module == "res://net/socket.gd"
+        )
+        assert menu_socket.path == [
+            "res://ui/menu.gd",
+            "res://ui/helper.gd",
+            "res://net/client.gd",
+            "res://net/socket.gd",
+        ]
+        assert menu_socket.to_dict()["path"] == menu_socket.path
+        assert "Forbidden transitive dependency" in menu_socket.to_dict()["message"]
+
+    def test_reachable_rule_uses_given_index(self):
+        graph = self._graph()
+        calls = []
+
+        def reachability():
+            calls.append(1)
+            return ReachabilityIndex(Condensation.from_graph(graph))
+
+        engine = RuleEngine(self._config(reachable=True), graph, reachability)
+        engine.check_all()
+        engine.check_all()
+        assert calls == [1]
+        RuleEngine(self._config(reachable=False), graph, reachability).check_all()
+        assert calls == [1]
+
+
+class TestLayers:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        edges = {
+            "res://core/math.gd": [],
+            "res://gameplay/unit.gd": ["res://core/math.gd"],
+            "res://ui/hud.gd": ["res://gameplay/unit.gd", "res://tools/debug.gd"],
+            "res://core/save.gd": ["res://ui/hud.gd"],
+            "res://tools/debug.gd": ["res://ui/hud.gd"],
+        }
+        for path, targets in edges.items():
+            deps = [
+                Dependency(target=t, dep_type=DependencyType.PRELOAD) for t in targets
+            ]
+            graph.add_module(Module(path=path, dependencies=deps))
+        return graph
+
+    def _layers(self) -> list[Layer]:
+        return [
+            Layer(name="core", path="^res://core/"),
+            Layer(name="gameplay", path="^res://gameplay/"),
+            Layer(name="ui", path="^res://ui/"),
+        ]
+
+    def test_upward_dependency_reported_with_layer_names(self):
+        config = Config(layers=self._layers())
+        assert config.has_rules()
+        result = RuleEngine(config, self._graph()).check_all()
+
+        # Unlayered modules (tools/) are not constrained either way.
+        (v,) = result.violations
+        assert v.rule_type == "layers"
+        assert (v.from_module, v.to_module) == ("res://core/save.gd", "res://ui/hud.gd")
+        assert "'core' must not depend on higher layer 'ui'" in v.message
+        assert v.to_dict()["rule"] == "layers"
+
+    def test_first_matching_layer_wins(self):
+        layers = [Layer(name="base", path="^res://core/math"), *self._layers()]
+        config = Config(layers=layers, options=ConfigOptions(exclude=["save"]))
+        result = RuleEngine(config, self._graph()).check_all()
+        assert result.violations == []
+
+
+class TestThresholdRules:
+    def _graph(self) -> DependencyGraph:
+        # hub -> a, b, c; a -> b -> c -> a is a three-module cycle.
+        graph = DependencyGraph()
+        edges = {
+            "res://hub.gd": ["res://core/a.gd", "res://core/b.gd", "res://core/c.gd"],
+            "res://core/a.gd": ["res://core/b.gd"],
+            "res://core/b.gd": ["res://core/c.gd"],
+            "res://core/c.gd": ["res://core/a.gd"],
+            "res://leaf.gd": [],
+        }
+        for path, targets in edges.items():
+            deps = [
+                Dependency(target=t, dep_type=DependencyType.PRELOAD) for t in targets
+            ]
+            graph.add_module(Module(path=path, dependencies=deps))
+        return graph
+
+    def _check(self, rule: Rule) -> list[str]:
+        result = RuleEngine(Config(thresholds=[rule]), self._graph()).check_all()
+        assert all(v.rule_type == "thresholds" for v in result.violations)
+        return [v.message for v in result.violations]
+
+    def test_fan_out_and_fan_in(self):
+        assert self._check(Rule(name="fan", max_fan_out=2, max_fan_in=1)) == [
+            "res://hub.gd: fan-out 3 > 2",
+            "res://core/a.gd: fan-in 2 > 1",
+            "res://core/b.gd: fan-in 2 > 1",
+            "res://core/c.gd: fan-in 2 > 1",
+        ]
+
+    def test_depth_scoped_by_from(self):
+        rule = Rule(name="depth", from_=PathMatcher(pathNot="core"), max_depth=0)
+        assert self._check(rule) == ["res://hub.gd: depth 1 > 0"]
+
+    def test_cycle_size(self):
+        assert self._check(Rule(name="cycles", max_cycle_size=3)) == []
+        (message,) = self._check(Rule(name="cycles", max_cycle_size=2))
+        assert message == (
+            "res://core/a.gd, res://core/b.gd, res://core/c.gd: cycle size 3 > 2"
+        )
+        rule = Rule(name="cycles", from_=PathMatcher(path="hub"), max_cycle_size=2)
+        assert self._check(rule) == []
+
+    def test_uses_given_metrics_once(self):
+        graph = self._graph()
+        calls = []
+
+        def condensation():
+            calls.append("condensation")
+            return Condensation.from_graph(graph)
+
+        config = Config(
+            thresholds=[
+                Rule(name="fan-out", max_fan_out=5),
+                Rule(name="depth", max_depth=5),
+            ]
+        )
+        RuleEngine(config, graph, condensation=condensation).check_all()
+        assert calls == ["condensation"]
+
+
+class TestDependencyTypeFilters:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="res://ui/menu.gd",
+                dependencies=[
+                    Dependency(
+                        target="res://data/items.gd", dep_type=DependencyType.PRELOAD
+                    ),
+                    Dependency(
+                        target="res://data/items.gd", dep_type=DependencyType.CLASS_REF
+                    ),
+                    Dependency(
+                        target="res://data/base.gd",
+                        dep_type=DependencyType.EXTENDS_PATH,
+                    ),
+                ],
+            )
+        )
+        return graph
+
+    def _check(self, **sections) -> list[tuple[str, str]]:
+        result = RuleEngine(Config(**sections), self._graph()).check_all()
+        return [(v.rule.name, v.to_module) for v in result.violations]
+
+    def _rule(self, name: str, **kwargs) -> Rule:
+        return Rule(
+            name=name,
+            from_=PathMatcher(path="^res://ui/"),
+            to=PathMatcher(path="^res://data/"),
+            **kwargs,
+        )
+
+    def test_forbidden_only_listed_types(self):
+        rule = self._rule("no-preload", dependency_types=[DependencyType.PRELOAD])
+        assert self._check(forbidden=[rule]) == [("no-preload", "res://data/items.gd")]
+
+    def test_forbidden_except_types(self):
+        rule = self._rule(
+            "no-hard-deps", dependency_types_not=[DependencyType.CLASS_REF]
+        )
+        untyped = self._rule("no-deps")
+        assert self._check(forbidden=[untyped, rule]) == [
+            ("no-deps", "res://data/items.gd"),
+            ("no-deps", "res://data/items.gd"),
+            ("no-deps", "res://data/base.gd"),
+            # Reported in graph order, like the untyped rule.
+            ("no-hard-deps", "res://data/items.gd"),
+            ("no-hard-deps", "res://data/base.gd"),
+        ]
+
+    def test_allowed_ignores_other_types(self):
+        rule = Rule(
+            name="ui-extends-ui",
+            from_=PathMatcher(path="^res://ui/"),
+            to=PathMatcher(path="^res://ui/"),
+            dependency_types=[DependencyType.EXTENDS_PATH],
+        )
+        assert self._check(allowed=[rule]) == [("ui-extends-ui", "res://data/base.gd")]
+
+    def test_required_counts_only_listed_types(self):
+        rule = self._rule("preload-data", dependency_types=[DependencyType.LOAD])
+        assert self._check(required=[rule]) == [("preload-data", "^res://data/")]
+        rule = self._rule("preload-data", dependency_types=[DependencyType.PRELOAD])
+        assert self._check(required=[rule]) == []
+
+
+class TestBackReferences:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        edges = {
+            "res://features/shop/ui.gd": [
+                "res://features/shop/cart.gd",
+                "res://features/inventory/items.gd",
+                "res://core/log.gd",
+            ],
+            "res://features/inventory/items.gd": ["res://features/inventory/db.gd"],
+            "res://features/inventory/db.gd": ["res://features/shop/cart.gd"],
+            "res://features/shop/cart.gd": [],
+            "res://core/log.gd": [],
+        }
+        for path, targets in edges.items():
+            graph.add_module(
+                Module(
+                    path=path,
+                    dependencies=[
+                        Dependency(target=t, dep_type=DependencyType.PRELOAD)
+                        for t in targets
+                    ],
+                )
+            )
+        return graph
+
+    def _rule(self, **kwargs) -> Rule:
+        return Rule(
+            name="feature-isolation",
+            from_=PathMatcher(path="^res://features/([^/]+)/"),
+            to=PathMatcher(path="^res://features/", pathNot="^res://features/$1/"),
+            **kwargs,
+        )
+
+    def _check(self, **sections) -> list[tuple[str, str]]:
+        result = RuleEngine(Config(**sections), self._graph()).check_all()
+        return [(v.from_module, v.to_module) for v in result.violations]
+
+    def test_forbidden_other_features(self):
+        assert self._check(forbidden=[self._rule()]) == [
+            ("res://features/shop/ui.gd", "res://features/inventory/items.gd"),
+            ("res://features/inventory/db.gd", "res://features/shop/cart.gd"),
+        ]
+
+    def test_typed_rule(self):
+        rule = self._rule(dependency_types=[DependencyType.PRELOAD])
+        assert len(self._check(forbidden=[rule])) == 2
+        rule = self._rule(dependency_types=[DependencyType.LOAD])
+        assert self._check(forbidden=[rule]) == []
+
+    def test_allowed_own_feature(self):
+        rule = Rule(
+            name="own-feature",
+            from_=PathMatcher(path="^res://features/([^/]+)/"),
+            to=PathMatcher(path="^res://(features/$1|core)/"),
+        )
+        assert self._check(allowed=[rule]) == [
+            ("res://features/shop/ui.gd", "res://features/inventory/items.gd"),
+            ("res://features/inventory/db.gd", "res://features/shop/cart.gd"),
+        ]
+
+    def test_reachable(self):
+        rule = self._rule(reachable=True)
+        violations = RuleEngine(Config(forbidden=[rule]), self._graph()).check_all()
+        pairs = {(v.from_module, v.to_module) for v in violations.violations}
+        assert pairs == {
+            ("res://features/shop/ui.gd", "res://features/inventory/items.gd"),
+            ("res://features/shop/ui.gd", "res://features/inventory/db.gd"),
+            ("res://features/inventory/items.gd", "res://features/shop/cart.gd"),
+            ("res://features/inventory/db.gd", "res://features/shop/cart.gd"),
+        }
+
+
+class TestRuleStats:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="res://ui/menu.gd",
+                dependencies=[
+                    Dependency(target="res://core/a.gd", dep_type=DependencyType.LOAD),
+                    Dependency(
+                        target="res://core/b.gd", dep_type=DependencyType.PRELOAD
+                    ),
+                ],
+            )
+        )
+        graph.add_module(Module(path="res://ui/button.gd"))
+        graph.add_module(Module(path="res://core/a.gd"))
+        return graph
+
+    def test_stats_per_rule(self):
+        config = Config(
+            forbidden=[
+                Rule(
+                    name="ui-not-core",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+                Rule(
+                    name="ui-no-preload",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                    dependency_types=[DependencyType.PRELOAD],
+                ),
+                Rule(name="orphans", from_=PathMatcher(path="^res://"), orphan=True),
+            ],
+            layers=[Layer(name="core", path="^res://core/")],
+        )
+        result = RuleEngine(config, self._graph()).check_all()
+        stats = {s.rule: s for s in result.stats}
+        assert [
+            (s.modules, s.edges, s.violations)
+            for s in (
+                stats["ui-not-core"],
+                stats["ui-no-preload"],
+                stats["orphans"],
+                stats["layers"],
+            )
+        ] == [(2, 2, 2), (2, 1, 1), (3, 0, 1), (1, 0, 0)]
+        assert all(s.seconds > 0 for s in result.stats)
+        assert result.to_dict()["stats"][0]["rule"] == "ui-not-core"
+
+
+class TestFailFastAndLimits:
+    def _graph(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        graph.add_module(
+            Module(
+                path="res://ui/menu.gd",
+                dependencies=[
+                    Dependency(
+                        target=f"res://core/{n}.gd", dep_type=DependencyType.LOAD
+                    )
+                    for n in "abcde"
+                ],
+            )
+        )
+        return graph
+
+    def _config(self) -> Config:
+        return Config(
+            forbidden=[
+                Rule(
+                    name="ui-not-core",
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+                Rule(
+                    name="ui-core-warning",
+                    severity=Severity.WARN,
+                    from_=PathMatcher(path="^res://ui/"),
+                    to=PathMatcher(path="^res://core/"),
+                ),
+                Rule(name="no-cycles", circular=True),
+            ]
+        )
+
+    def test_max_violations_counts_the_rest(self):
+        engine = RuleEngine(self._config(), self._graph(), max_violations=2)
+        result = engine.check_all(cycles=[["res://ui/menu.gd", "res://core/a.gd"]])
+        assert [v.rule.name for v in result.violations] == [
+            "ui-not-core",
+            "ui-not-core",
+            "ui-core-warning",
+            "ui-core-warning",
+            "no-cycles",
+        ]
+        stats = {s.rule: (s.violations, s.suppressed) for s in result.stats}
+        assert stats == {
+            "ui-not-core": (5, 3),
+            "ui-core-warning": (5, 3),
+            "no-cycles": (1, 0),
+        }
+        assert result.error_count() == 6
+        assert result.warning_count() == 5
+        assert result.to_dict()["summary"]["suppressed"] == 6
+
+    def test_fail_fast_runs_cheapest_error_rules_first(self):
+        engine = RuleEngine(self._config(), self._graph(), fail_fast=True)
+        result = engine.check_all(cycles=[["res://ui/menu.gd", "res://core/a.gd"]])
+        assert result.stopped
+        # The circular rule is cheaper than the edge pass; warnings are skipped.
+        assert [v.rule.name for v in result.violations] == ["no-cycles"]
+        assert [s.rule for s in result.stats] == ["ui-not-core", "no-cycles"]
+
+        result = engine.check_all(cycles=[])
+        assert result.stopped
+        assert [v.to_module for v in result.violations] == ["res://core/a.gd"]
+        assert result.has_errors()
+
+    def test_fail_fast_skips_up_front_work(self, monkeypatch):
+        engine = RuleEngine(self._config(), self._graph(), fail_fast=True)
+        classified: list[str] = []
+        classify = engine._matrix.classify
+
+        def spy(path: str):
+            classified.append(path)
+            return classify(path)
+
+        def unexpected(*args):
+            raise AssertionError("ran before the first check")
+
+        monkeypatch.setattr(engine._matrix, "classify", spy)
+        monkeypatch.setattr(engine._matrix, "prepare", unexpected)
+        monkeypatch.setattr(engine, "_coverage", unexpected)
+        result = engine.check_all(cycles=[["res://ui/menu.gd", "res://core/a.gd"]])
+        assert result.stopped
+        # Only the first cycle member was looked at, not the core modules.
+        assert classified == ["res://ui/menu.gd"]
+        assert [(s.modules, s.edges) for s in result.stats] == [(0, 0), (0, 0)]
+
+    def test_fail_fast_without_violations(self):
+        config = Config(forbidden=[Rule(name="no-cycles", circular=True)])
+        result = RuleEngine(config, self._graph(), fail_fast=True).check_all([])
+        assert not result.stopped
+        assert result.violations == []